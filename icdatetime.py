@@ -9,7 +9,35 @@ Functions:
     Converts a string of 'day of week' i.e. 'Mon', 'tues', etc to respective integer values, 1 is Sunday, etc.
 **format_weekday**
     re-formats provided day into standard formats, full, abbreviation, int, or str(int)
+**weekmask**
+    converts days of week, i.e. 'Mon, Wed, Fri', to a numpy weekmask
+**business_calendar**
+    returns a cached numpy business day calendar for days of week and holidays
+**expand_recurrence**
+    dates between start and end that fall on the given days of week
+**expand_recurrences**
+    dates of many start/end ranges of one recurrence rule
+**count_business_days**
+    number of business days between dates
+**offset_business_days**
+    dates offset by a number of business days
+**infer_date_format**
+    finds the format of a column of date strings
+**parse_dates**
+    parses a column of date strings, once per unique string
 """
+import re
+import warnings
+import functools
+import numpy as np
+import pandas as pd
+
+DATE_FORMATS = ['%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', '%m/%d/%Y', '%m/%d/%Y %H:%M', '%m/%d/%Y %H:%M:%S',
+                '%m/%d/%y', '%Y%m%d', '%d-%b-%Y', '%d-%b-%y', '%b %d, %Y', '%B %d, %Y', '%d %b %Y', '%d %B %Y']
+
+_formats = {}  # column key: format found by infer_date_format
+_leading_day = re.compile(r'\s*([A-Za-z]+)\.?,?\s+')
+_trailing_day = re.compile(r',?\s+\(?([A-Za-z]+)\.?\)?\s*$')
 
 
 def day_to_int(days_to_conv):
@@ -155,3 +183,291 @@ def format_weekday(day, format_='full'):
     else:
         raise ValueError('{} is not a valid Day of Week'.format(day))
 
+
+_day_aliases = {'SUN': 'SU', 'TUES': 'TU', 'THU': 'TH', 'THURS': 'TH'}  # abbreviations day_to_int does not accept
+
+
+def _weekday_position(day):
+    """
+    Position of a day of week in a numpy weekmask, Monday is 0
+    
+    Parameters
+    ----------
+    day : str or int
+        day of week accepted by `day_to_int`, or a three letter abbreviation as returned by `format_weekday`, i.e.
+        'Thu', 'Sun'
+    
+    Returns
+    -------
+    weekmask position : int
+    """
+    if type(day) is str:
+        day = day.strip()
+        day = _day_aliases.get(day.upper(), day)
+    day = day_to_int(day)
+    if type(day) is list:
+        day = day[0]
+    if int(day) not in range(1, 8):
+        raise ValueError('{} is not a valid Day of Week'.format(day))
+
+    return (int(day) - 2) % 7
+
+
+def weekmask(days):
+    """
+    Converts days of week to a numpy weekmask
+    
+    Parameters
+    ----------
+    days : str or list (str, int)
+        days of week accepted by `day_to_int`, as a list or a string separated by commas, '/' or spaces,
+        i.e. 'Mon, Wed, Fri'
+    
+    Returns
+    -------
+    weekmask : str
+        seven '1' or '0' characters, Monday first
+    """
+    if type(days) is str:
+        days = [day for day in re.split(r'[,/\s]+', days) if day]
+    mask = ['0'] * 7
+    for day in days:
+        mask[_weekday_position(day)] = '1'
+
+    return ''.join(mask)
+
+
+@functools.lru_cache(maxsize=64)
+def _calendar(mask, holidays):
+    """cached np.busdaycalendar for a weekmask and a tuple of holidays"""
+    return np.busdaycalendar(weekmask=mask, holidays=list(holidays))
+
+
+def business_calendar(days='Mon, Tue, Wed, Thu, Fri', holidays=None):
+    """
+    Returns a numpy business day calendar for days of week and holidays, calendars are cached so repeated calls
+    with the same days and holidays do not rebuild them
+    
+    Parameters
+    ----------
+    days : str or list (str, int)
+        days of week that are business days, as for `weekmask`
+    holidays : list (str, date, or np.datetime64), default=None
+        dates that are not business days
+    
+    Returns
+    -------
+    calendar : np.busdaycalendar
+    """
+    if holidays is None:
+        holidays = []
+
+    return _calendar(weekmask(days), tuple(np.asarray(holidays, dtype='datetime64[D]').tolist()))
+
+
+def expand_recurrence(days, start, end, holidays=None):
+    """
+    Dates from start up to (not including) end that fall on the given days of week and are not holidays
+    
+    Parameters
+    ----------
+    days : str or list (str, int)
+        days of week of the recurrence, i.e. 'Mon, Wed, Fri'
+    start : str, date, or np.datetime64
+        first date
+    end : str, date, or np.datetime64
+        date after the last date
+    holidays : list (str, date, or np.datetime64), default=None
+        dates to skip
+    
+    Returns
+    -------
+    dates : np.ndarray (datetime64[D])
+    """
+    dates, owners = expand_recurrences(days, [start], [end], holidays)
+
+    return dates
+
+
+def expand_recurrences(days, starts, ends, holidays=None):
+    """
+    Dates of many start/end ranges of one recurrence rule, expanded together without a Python loop
+    
+    Parameters
+    ----------
+    days : str or list (str, int)
+        days of week of the recurrence, i.e. 'Mon, Wed, Fri'
+    starts : list or array like
+        first date of each range
+    ends : list or array like
+        date after the last date of each range
+    holidays : list (str, date, or np.datetime64), default=None
+        dates to skip
+    
+    Returns
+    -------
+    (dates, owners) : (np.ndarray (datetime64[D]), np.ndarray (int))
+        dates of all ranges in order, and the position in starts of the range each date belongs to
+    """
+    calendar = business_calendar(days, holidays)
+    starts = np.asarray(starts, dtype='datetime64[D]')
+    ends = np.asarray(ends, dtype='datetime64[D]')
+
+    counts = np.maximum(np.busday_count(starts, ends, busdaycal=calendar), 0)
+    owners = np.repeat(np.arange(len(starts)), counts)
+    steps = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)  # 0, 1, .. within each range
+    dates = np.busday_offset(starts[owners], steps, roll='forward', busdaycal=calendar)
+
+    return dates, owners
+
+
+def count_business_days(start, end, days='Mon, Tue, Wed, Thu, Fri', holidays=None):
+    """
+    Number of business days from start up to (not including) end, element wise for arrays of dates
+    
+    Parameters
+    ----------
+    start : date or array like of dates
+    end : date or array like of dates
+    days : str or list (str, int)
+        days of week that are business days
+    holidays : list (str, date, or np.datetime64), default=None
+        dates that are not business days
+    
+    Returns
+    -------
+    number of business days : int or np.ndarray (int)
+    """
+    return np.busday_count(np.asarray(start, dtype='datetime64[D]'), np.asarray(end, dtype='datetime64[D]'),
+                           busdaycal=business_calendar(days, holidays))
+
+
+def offset_business_days(dates, offsets, days='Mon, Tue, Wed, Thu, Fri', holidays=None, roll='forward'):
+    """
+    Dates offset by a number of business days, element wise for arrays of dates and offsets
+    
+    Parameters
+    ----------
+    dates : date or array like of dates
+    offsets : int or array like of int
+        business days to move, negative to move back
+    days : str or list (str, int)
+        days of week that are business days
+    holidays : list (str, date, or np.datetime64), default=None
+        dates that are not business days
+    roll : str, default='forward'
+        how dates that are not business days are moved before offsetting, see np.busday_offset
+    
+    Returns
+    -------
+    dates : np.datetime64 or np.ndarray (datetime64[D])
+    """
+    return np.busday_offset(np.asarray(dates, dtype='datetime64[D]'), offsets, roll=roll,
+                            busdaycal=business_calendar(days, holidays))
+
+
+def _strip_weekday(text):
+    """
+    Removes a leading or trailing day of week token known to `format_weekday`, i.e. 'Mon, 01/02/2017' or
+    '2017-01-02 (Mon)', the date itself says which day it is
+    """
+    for pattern in (_leading_day, _trailing_day):
+        match = pattern.match(text) if pattern is _leading_day else pattern.search(text)
+        if match is not None:
+            try:
+                format_weekday(match.group(1))
+            except ValueError:
+                continue
+            text = text[:match.start()] + text[match.end():]
+
+    return text
+
+
+def _parse_date(text, tz):
+    """
+    Parses one date string in whatever format it is in, as a Timestamp in timezone tz, NaT if it is not a date
+    """
+    date = pd.to_datetime(text, errors='coerce')
+    if date is pd.NaT or date.tz == tz:
+        return date
+    if date.tz is None:
+        return date.tz_localize(tz)
+
+    return date.tz_convert(tz)
+
+
+def infer_date_format(values, formats=None, sample=20):
+    """
+    Finds the format of a column of date strings by trying each format on a sample of the unique values
+    
+    Parameters
+    ----------
+    values : list, array, or Series (str)
+        date strings, day of week tokens should already be removed
+    formats : list (str), default=None
+        strptime formats to try in order, None for `DATE_FORMATS`
+    sample : int, default=20
+        number of unique values tried
+    
+    Returns
+    -------
+    format : str, None if no format matches every value in the sample
+    """
+    if formats is None:
+        formats = DATE_FORMATS
+    values = pd.Series(pd.unique(pd.Series(values).dropna().astype(str))[:sample])
+    for format_ in formats:
+        try:
+            pd.to_datetime(values, format=format_)
+        except (ValueError, TypeError):
+            continue
+        return format_
+
+    return None
+
+
+def parse_dates(values, format_=None, key=None):
+    """
+    Parses a column of date strings.  Each unique string is parsed once, in one vectorized call, and the results
+    are broadcast back to every row, so heavily repeated values cost little.  Unless format_ is given, strings the
+    inferred format does not fit, i.e. in a column that mixes formats, are parsed one at a time rather than lost
+    
+    Parameters
+    ----------
+    values : list, array, or Series (str)
+        date strings, may start or end with a day of week token i.e. 'Tue 01/03/2017'
+    format_ : str, default=None
+        strptime format, None to infer it with `infer_date_format`
+    key : object, default=None
+        name of the column, the inferred format is remembered under key and reused by later calls
+    
+    Returns
+    -------
+    dates : np.ndarray (datetime64[ns]), or Series if values is a Series, NaT where a value could not be parsed
+    """
+    codes, uniques = pd.factorize(np.asarray(values, dtype=object))
+    texts = pd.Series(uniques, dtype=object).astype(str).map(_strip_weekday)
+
+    strict = format_ is not None
+    if format_ is None:
+        format_ = _formats.get(key) if key is not None else None
+        if format_ is None:
+            format_ = infer_date_format(texts)
+            if key is not None and format_ is not None:
+                _formats[key] = format_
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', UserWarning)  # "could not infer format", the misses are retried below
+        parsed = pd.to_datetime(texts, format=format_, errors='coerce')
+    if not strict:
+        missed = parsed.isna().values
+        if missed.any():
+            parsed = parsed.copy()
+            parsed[missed] = [_parse_date(text, parsed.dt.tz) for text in texts[missed]]
+    parsed = parsed.values
+    dates = np.append(parsed, np.datetime64('NaT', 'ns'))[codes]  # code -1 (missing value) picks the NaT
+
+    if type(values) is pd.Series:
+        return pd.Series(dates, index=values.index, name=values.name)
+
+    return dates
@@ -1,5 +1,10 @@
+from kivy.properties import ObjectProperty
+from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.button import Button
 from kivy.uix.dropdown import DropDown
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.textinput import TextInput
 
 
 class DropDownBut(Button):
@@ -19,3 +24,83 @@ class DropDownBut(Button):
 
         self.bind(on_release=self.drop_list.open)
         self.drop_list.bind(on_select=lambda instance, x: setattr(self, 'text', x))
+
+
+class DropDownItem(Button):
+    """Item view reused by RecycleDropDownBut, selects its text in the owning drop list when released"""
+    drop_list = ObjectProperty(None, allownone=True)
+
+    def on_release(self):
+        self.drop_list.select(self.text)
+
+
+class RecycleDropDownBut(Button):
+    """
+    DropDownBut for long item lists.  Items are shown by a RecycleView that reuses the few item widgets that fit
+    on screen, and the view is only built the first time the drop down opens.  Typing in the filter box shows only
+    the items containing the typed text.  Selecting an item sets the button text, as for DropDownBut.
+
+    :param item_list:list: items to show
+    :param item_height:int: height of each item
+    :param max_height:int: height of the drop down when there are more items than fit
+    :param filterable:bool: show a filter box above the items
+    """
+
+    def __init__(self, item_list=None, item_height=50, max_height=400, filterable=True, **kwargs):
+        if item_list is None:
+            item_list = ['Item1', 'Item2', 'Item3', 'Item4', 'Item5', 'Item6']
+        super(RecycleDropDownBut, self).__init__(**kwargs)
+        self.item_list = list(item_list)
+        self.item_height = item_height
+        self.max_height = max_height
+        self.filterable = filterable
+        self.filter_text = ''
+
+        self.drop_list = DropDown()
+        self.content = None
+        self.view = None
+
+        self.bind(on_release=self.open)
+        self.drop_list.bind(on_select=lambda instance, x: setattr(self, 'text', x))
+
+    def open(self, widget=None):
+        """open the drop down, building the item view on first use"""
+        if self.view is None:
+            self._build()
+        self.drop_list.open(self)
+
+    def set_items(self, item_list):
+        """replace the items, the current filter is kept"""
+        self.item_list = list(item_list)
+        self.filter(self.filter_text)
+
+    def filter(self, text=''):
+        """show only the items containing text, case insensitive"""
+        self.filter_text = text
+        if self.view is None:
+            return
+
+        text = text.lower()
+        items = [item for item in self.item_list if text in item.lower()] if text else self.item_list
+        self.view.data = [{'text': item, 'drop_list': self.drop_list} for item in items]
+        self.view.height = min(self.max_height, len(items) * self.item_height)
+        self.content.height = self.view.height + (self.item_height if self.filterable else 0)
+
+    def _build(self):
+        """build the recycle view, and filter box, inside the drop down"""
+        layout = RecycleBoxLayout(orientation='vertical', default_size=(None, self.item_height),
+                                  default_size_hint=(1, None), size_hint_y=None)
+        layout.bind(minimum_height=layout.setter('height'))
+        self.view = RecycleView(viewclass=DropDownItem, size_hint_y=None)
+        self.view.add_widget(layout)
+
+        self.content = BoxLayout(orientation='vertical', size_hint_y=None)
+        if self.filterable:
+            filter_input = TextInput(text=self.filter_text, multiline=False, size_hint_y=None,
+                                     height=self.item_height)
+            filter_input.bind(text=lambda instance, text: self.filter(text))
+            self.content.add_widget(filter_input)
+        self.content.add_widget(self.view)
+
+        self.drop_list.add_widget(self.content)
+        self.filter(self.filter_text)
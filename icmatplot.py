@@ -1,11 +1,17 @@
 from pylab import rcParams
 import io
-from PIL import ImageTk, Image
+import functools
+import multiprocessing
+from PIL import ImageTk, Image, ImageDraw, ImageFont
 import matplotlib.pyplot as plt
+from matplotlib import font_manager
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+import numpy as np
 
 
-def create_graph_image(data, title='Title', x_name='X', y_name='Y', height=5, width=10, dpi=50):
-    """return (ImageTk.PhotoImage) image of the graph
+def render_graph(data, title='Title', x_name='X', y_name='Y', height=5, width=10, dpi=50):
+    """return (PIL.Image) image of the graph, None if there is no data
 
         :param data:: data to plot  
         :param title:str: Graph Title
@@ -33,4 +39,309 @@ def create_graph_image(data, title='Title', x_name='X', y_name='Y', height=5, wi
     buf.close()  # close buffer
     plt.close()  # clear plt
 
+    return image
+
+
+def create_graph_image(data, title='Title', x_name='X', y_name='Y', height=5, width=10, dpi=50):
+    """return (ImageTk.PhotoImage) image of the graph, each call creates a new tkinter image, use
+    ictkinter.ChartSlot to redraw a graph in place
+
+        :param data:: data to plot  
+        :param title:str: Graph Title
+        :param x_name:str : x axis name
+        :param y_name:str: y axis name
+        :param height:int: height of graph
+        :param width:int: width of graph
+        :param dpi:int: dpi of graph
+    """
+    image = render_graph(data, title, x_name, y_name, height, width, dpi)
+    if image is None:
+        return None
+
     return ImageTk.PhotoImage(image)
+
+
+@functools.lru_cache(maxsize=8)
+def _grid_figure(rows, columns, cell_width, cell_height, dpi):
+    """return (Figure, list of Axes, list of Line2D) Agg figure of a grid of graphs, created once per grid shape and
+    reused by every refresh, so styling, axes and lines are only set up the first time
+
+        :param rows:int: rows of graphs
+        :param columns:int: columns of graphs
+        :param cell_width:float: width of each graph in inches
+        :param cell_height:float: height of each graph in inches
+        :param dpi:int: dpi of graphs
+    """
+    with plt.style.context('fivethirtyeight'):  # style is read when the artists are created
+        figure = Figure(figsize=(columns * cell_width, rows * cell_height), dpi=dpi)
+        FigureCanvasAgg(figure)
+        axes = list(figure.subplots(rows, columns, squeeze=False).flat)
+        lines = [ax.plot([], [])[0] for ax in axes]
+        for ax in axes:
+            ax.set_title(' ')
+        figure.tight_layout()  # laid out once, titles and limits change but the grid does not
+
+    return figure, axes, lines
+
+
+def render_graph_grid(data, titles=None, columns=4, cell_width=3, cell_height=2, dpi=50, split=False):
+    """return (PIL.Image or list) small multiples, every series drawn as a subplot of one shared Agg figure in a
+    single draw, rather than a figure and savefig per graph as with render_graph
+
+        :param data:list: series to plot, each a list, np.ndarray or pd.Series, plotted against position
+        :param titles:list: title of each graph, None for no titles
+        :param columns:int: graphs per row of the grid
+        :param cell_width:float: width of each graph in inches
+        :param cell_height:float: height of each graph in inches
+        :param dpi:int: dpi of graphs
+        :param split:bool: False for one image of the whole grid, True for a list of one image per graph, in the
+            order of data, i.e. for ictkinter.ChartSlot.update
+    """
+    rows = max(1, -(-len(data) // columns))
+    figure, axes, lines = _grid_figure(rows, columns, cell_width, cell_height, dpi)
+    titles = [''] * len(data) if titles is None else titles
+
+    for i, (ax, line) in enumerate(zip(axes, lines)):
+        ax.set_visible(i < len(data))
+        if i >= len(data):
+            continue
+        values = np.asarray(data[i], dtype=float)
+        line.set_data(np.arange(len(values)), values)
+        ax.set_title(titles[i])
+        ax.relim()
+        ax.autoscale_view()
+
+    figure.canvas.draw()
+    width, height = figure.canvas.get_width_height()
+    image = Image.frombuffer('RGBA', (width, height), figure.canvas.buffer_rgba(), 'raw', 'RGBA', 0, 1).convert('RGB')
+    if not split:
+        return image
+
+    cell_w, cell_h = width / columns, height / rows
+    boxes = [(int(c * cell_w), int(r * cell_h), int((c + 1) * cell_w), int((r + 1) * cell_h))
+             for r, c in (divmod(i, columns) for i in range(len(data)))]
+
+    return [image.crop(box) for box in boxes]
+
+
+def _resample(series, width):
+    """return (np.ndarray) each series linearly resampled to width points, shape (len(series), width), series of the
+    same length are resampled together in one vectorized pass
+
+        :param series:list: sequences of numbers
+        :param width:int: points per series
+    """
+    result = np.full((len(series), width), np.nan)
+    lengths = np.array([len(values) for values in series])
+    for length in np.unique(lengths):
+        rows = np.flatnonzero(lengths == length)
+        if length == 0:
+            continue
+        values = np.array([np.asarray(series[r], dtype=float) for r in rows]).reshape(len(rows), length)
+        if length == 1:
+            result[rows] = values
+            continue
+        points = np.linspace(0, length - 1, width)
+        i0 = np.minimum(points.astype(int), length - 2)
+        frac = points - i0
+        left, right = values[:, i0], values[:, i0 + 1]
+        # points that fall on a value take it exactly, so a NaN neighbour does not blank them
+        result[rows] = np.where(frac == 0, left, np.where(frac == 1, right, left * (1 - frac) + right * frac))
+
+    return result
+
+
+class SparklineAtlas(object):
+    """
+    Rasterizes small inline trend graphs for many rows at once with numpy, one row of the atlas per table row.  Every
+    row's line is drawn into a single boolean pixel array in one vectorized pass, no figure or savefig per graph.
+    Rows are only redrawn after they are invalidated, so refreshing a table redraws just the rows whose series
+    changed.
+    
+    **METHODS:**
+    
+    **resize** : Grow or shrink the atlas to a number of rows
+    
+    **invalidate** : Mark rows to be redrawn
+    
+    **draw** : Redraw the invalidated rows
+    
+    **image** : Image of one row's sparkline
+    
+    Parameters
+    ----------
+    width : int, default=60
+        width of each sparkline in pixels
+    height : int, default=16
+        height of each sparkline in pixels
+    color : tuple, default=(31, 119, 180)
+        RGB line colour
+    background : tuple, default=(255, 255, 255)
+        RGB background colour
+    
+    **=EXAMPLES===============================================================**
+        atlas = icmatplot.SparklineAtlas(width=80)
+        atlas.resize(len(prices))
+        atlas.draw(prices)  # list of price histories, one per row
+        image = atlas.image(12)
+    """
+    def __init__(self, width=60, height=16, color=(31, 119, 180), background=(255, 255, 255)):
+        self.width = width
+        self.height = height
+        self.color = np.array(color, dtype=np.uint8)
+        self.background = np.array(background, dtype=np.uint8)
+        self.pixels = np.zeros((0, height, width), dtype=bool)
+        self._dirty = np.zeros(0, dtype=bool)
+
+    def resize(self, rows):
+        """
+        Grow or shrink the atlas to a number of rows, added rows are drawn on the next `draw`
+        
+        Parameters
+        ----------
+        rows : int
+        """
+        if rows <= len(self.pixels):
+            self.pixels = self.pixels[:rows]
+            self._dirty = self._dirty[:rows]
+            return
+
+        added = rows - len(self.pixels)
+        self.pixels = np.concatenate([self.pixels, np.zeros((added, self.height, self.width), dtype=bool)])
+        self._dirty = np.concatenate([self._dirty, np.ones(added, dtype=bool)])
+
+    def invalidate(self, rows=None):
+        """
+        Mark rows to be redrawn on the next `draw`
+        
+        Parameters
+        ----------
+        rows : list or np.ndarray (int), default=None
+            row positions, None for every row
+        """
+        if rows is None:
+            self._dirty[:] = True
+        else:
+            self._dirty[rows] = True
+
+    def draw(self, series):
+        """
+        Redraw the invalidated rows, each line is scaled to the range of its own series
+        
+        Parameters
+        ----------
+        series : list
+            sequence of numbers for every row of the atlas, only the invalidated rows are read
+        """
+        rows = np.flatnonzero(self._dirty)
+        if len(rows) == 0:
+            return
+
+        values = _resample([series[r] for r in rows], self.width)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            low = np.nanmin(np.where(np.isnan(values), np.inf, values), axis=1, keepdims=True)
+            span = np.nanmax(np.where(np.isnan(values), -np.inf, values), axis=1, keepdims=True) - low
+            span = np.where(span > 0, span, 1)
+            y = (self.height - 1) * (1 - (values - low) / span)  # pixel row of each point, 0 at the top
+
+        # each pixel column covers the vertical span from its point to the next, so steep segments stay joined.  A
+        # point followed by a gap covers only itself, and NaN points leave their columns empty
+        following = np.concatenate([y[:, 1:], y[:, -1:]], axis=1)
+        following = np.where(np.isnan(following), y, following)
+        present = ~np.isnan(y)[:, None, :]
+        top = np.floor(np.minimum(y, following))[:, None, :]
+        bottom = np.ceil(np.maximum(y, following))[:, None, :]
+        pixel_rows = np.arange(self.height)[None, :, None]
+        self.pixels[rows] = present & (pixel_rows >= top) & (pixel_rows <= bottom)
+        self._dirty[rows] = False
+
+    def image(self, row):
+        """
+        Image of one row's sparkline
+        
+        Parameters
+        ----------
+        row : int
+            row position
+        
+        Returns
+        -------
+        sparkline : PIL.Image
+        """
+        rgb = np.where(self.pixels[row][..., None], self.color, self.background).astype(np.uint8)
+
+        return Image.fromarray(rgb, 'RGB')
+
+
+@functools.lru_cache(maxsize=64)
+def _pil_font(fontname, fontsize, fontstyle, dpi):
+    """return (ImageFont) font matching a tkinter font description, found through matplotlib's font manager which
+    falls back to DejaVu Sans when the family is not installed
+
+        :param fontname:str: font family
+        :param fontsize:int: size in points, negative for pixels as in tkinter
+        :param fontstyle:str: tkinter font style, i.e. 'bold', 'italic', 'bold italic'
+        :param dpi:int: resolution the size is scaled to
+    """
+    props = font_manager.FontProperties(family=fontname,
+                                        weight='bold' if 'bold' in fontstyle else 'normal',
+                                        style='italic' if 'italic' in fontstyle else 'normal')
+    size = -fontsize if fontsize < 0 else fontsize * dpi / 72.0
+
+    return ImageFont.truetype(font_manager.findfont(props), max(1, int(round(size))))
+
+
+def render_table(snapshot, path=None, dpi=96, padx=6, pady=2, background='white', foreground='black'):
+    """return (PIL.Image) image of a table, drawn directly with PIL so no display or tkinter widgets are needed
+
+        :param snapshot:dict: table to draw, from ictkinter.TableFrame.snapshot, 'rows' of text and matching
+            'fonts' of (fontname, fontsize, fontstyle)
+        :param path:str: file to save the image to, png, pdf, etc. by extension, None to only return it
+        :param dpi:int: resolution font sizes are scaled to
+        :param padx:int: horizontal padding of each cell
+        :param pady:int: vertical padding of each cell
+        :param background:str: background colour
+        :param foreground:str: text colour
+    """
+    rows = snapshot['rows']
+    fonts = [[_pil_font(name, size, style, dpi) for name, size, style in row] for row in snapshot['fonts']]
+    widths = [[font.getlength(text) for text, font in zip(row, row_fonts)] for row, row_fonts in zip(rows, fonts)]
+
+    col_widths = [0] * max([len(row) for row in rows] + [0])
+    for row in widths:
+        for c, width in enumerate(row):
+            col_widths[c] = max(col_widths[c], int(width) + 1 + 2 * padx)
+    row_heights = [max([sum(font.getmetrics()) for font in row_fonts] + [0]) + 2 * pady for row_fonts in fonts]
+
+    image = Image.new('RGB', (max(sum(col_widths), 1), max(sum(row_heights), 1)), background)
+    draw = ImageDraw.Draw(image)
+    y = 0
+    for row, row_fonts, row_widths, height in zip(rows, fonts, widths, row_heights):
+        x = 0
+        for c, (text, font, width) in enumerate(zip(row, row_fonts, row_widths)):
+            draw.text((x + (col_widths[c] - width) / 2, y + pady), text, font=font, fill=foreground)  # centred
+            x += col_widths[c]
+        y += height
+
+    if path is not None:
+        image.save(path)
+
+    return image
+
+
+def _render_job(snapshot, path, kwargs):
+    """render_table for a worker process, returns path rather than the image"""
+    render_table(snapshot, path, **kwargs)
+    return path
+
+
+def render_tables(snapshots, paths, processes=None, **kwargs):
+    """return (list) paths of the table images, rendered across a pool of worker processes
+
+        :param snapshots:list: tables to draw, from ictkinter.TableFrame.snapshot
+        :param paths:list: file to save each image to
+        :param processes:int: number of worker processes, None for one per CPU
+        :param kwargs: passed on to render_table
+    """
+    with multiprocessing.Pool(processes) as pool:
+        return pool.starmap(_render_job, [(snapshot, path, kwargs) for snapshot, path in zip(snapshots, paths)])
@@ -1,4 +1,99 @@
 import re
+import numbers
+import locale
+import functools
+import numpy as np
+import pandas as pd
+
+_non_decimal = re.compile(r'[^\d.]+')
+_negative = re.compile(r'\s*\(.*\)\s*$|[^\d]*-')  # (accounting parentheses), or a minus sign before the first digit
+# text that is a number once formatting is removed: optional parentheses, sign and currency symbol, digits with
+# grouping commas, decimals and a percent sign, so codes such as 'SKU-100' or '2024-01-05' are not numbers
+_numerical = re.compile(r'^\s*\(?\s*[-+]?\s*[^\w\s().,%+-]?\s*[-+]?\s*(?=\.?\d)(\d[\d,]*)?(\.\d*)?\s*%?\s*\)?\s*$')
+
+
+_separators = (',', '.')  # thousands separator and decimal point of format specs, see `set_separators`
+
+
+def _to_number(label_text):
+    """
+    Number in a value or 'numerical text', None if there is no number.  Follows the same rules as `parse_numbers`,
+    percentages are divided by 100
+    """
+    if isinstance(label_text, numbers.Real):
+        return None if np.isnan(label_text) else label_text
+
+    try:  # plain numbers, including exponents
+        number = float(label_text)
+        return None if np.isnan(number) else number
+    except (TypeError, ValueError):
+        pass
+    if _numerical.match(str(label_text)) is None:
+        return None
+    text = _non_decimal.sub('', str(label_text))
+    try:
+        number = float(text)
+    except ValueError:
+        return None
+    if _negative.match(str(label_text)) is not None:
+        number = -number
+    if '%' in str(label_text):
+        number /= 100
+
+    return number
+
+
+def _legacy_number(label_text):
+    """
+    Number in a value or text for the 'float', '$' and 'int' codes of `format_text`, None if there is no number.
+    Everything but digits and '.' is stripped from text and the sign kept, percentages are not scaled, as these
+    codes have always displayed '12.5%' as 12.5
+    """
+    if isinstance(label_text, numbers.Real):
+        return None if np.isnan(label_text) else label_text
+
+    try:
+        number = float(_non_decimal.sub('', str(label_text)))
+    except ValueError:
+        return None
+
+    return -number if _negative.match(str(label_text)) is not None else number
+
+
+def set_separators(thousands=',', decimal='.'):
+    """
+    Sets the thousands separator and decimal point displayed by format specs in `format_text` and `format_array`,
+    and so in TableFrame cells, headers and footers
+    
+    Parameters
+    ----------
+    thousands : str, default=','
+        thousands separator, None to take it from the current locale
+    decimal : str, default='.'
+        decimal point, None to take it from the current locale
+    """
+    global _separators
+    _separators = (thousands, decimal)
+
+
+def _spec_format(spec):
+    """
+    Returns the compiled format of a spec with the separators set by `set_separators`
+    """
+    thousands, decimal = _separators
+    if thousands is None or decimal is None:  # resolved here so the cache is keyed by the actual separators
+        conv = locale.localeconv()
+        thousands = (conv['thousands_sep'] or ',') if thousands is None else thousands
+        decimal = (conv['decimal_point'] or '.') if decimal is None else decimal
+
+    return compile_format(spec, thousands, decimal)
+
+
+def _is_spec(format_):
+    """
+    True if format_ is a format spec (i.e. '$#,##0.00') rather than one of the codes 'float', '$' or 'int'
+    """
+    return '#' in format_ or '0' in format_
 
 
 def format_text(dec, format_, label_text):
@@ -8,28 +103,249 @@ def format_text(dec, format_, label_text):
     Parameters
     ----------         
     dec : int 
-        number of decimal places for float_ and currency 
+        number of decimal places for float_ and currency, not used by format specs
     format_ : str 
         format style
             - 'float'
             - '$' : currency
             - 'int' : integer, will drop all decimals if present
+            - format spec, see `compile_format`, i.e. '$#,##0.00;($#,##0.00)' or '0.0%'
     label_text : str
         text to convert
     Returns
     -------
     Formatted text : str
     """
-    non_decimal = re.compile(r'[^\d.]+')
-    text = non_decimal.sub('', str(label_text))
-    if text != '':
+    if _is_spec(format_):
+        return _spec_format(format_).format(label_text)
+
+    number = _legacy_number(label_text)
+    if number is not None:
         if 'float' in format_:
             fc = '{0:.' + str(dec) + 'f}'
-            return fc.format(float(text))
+            return fc.format(number)
         if '$' in format_:
             fc = '${0:.' + str(dec) + 'f}'
-            return fc.format(float(text))
+            return fc.format(number)
         if 'int' in format_:
-            return int(float(text))
+            return int(number)
 
     return label_text
+
+
+def parse_numbers(values, dtype='float64'):
+    """
+    Convert formatted numerical text, i.e. '$1,234.50', '12.00', '-3', '(45.10)' or '12.5%', back to numbers in one
+    vectorized pass.  Values that are already numbers are passed through, text in parentheses or with a minus sign
+    before the first digit is negative and percentages are divided by 100.  Text is only converted when nothing but
+    a sign, parentheses, a currency symbol, grouping commas and a percent sign surround the number, so codes such as
+    'SKU-100', 'Q1 2024' or '2024-01-05' are not numbers
+    
+    Parameters
+    ----------
+    values : list, array, or Series
+        values to convert
+    dtype : str
+        'float64' or 'int64', int64 drops all decimals
+    
+    Returns
+    -------
+    (numbers, valid) : (np.ndarray, np.ndarray (bool))
+        converted values, and True where a value could be converted, unconverted values are NaN (0 for int64)
+    """
+    series = pd.Series(np.asarray(values, dtype=object))
+    result = pd.to_numeric(series, errors='coerce').values.astype(float)
+
+    # only text that is not a plain number goes through the regular expressions
+    retry = np.isnan(result) & series.notnull().values
+    if retry.any():
+        text = series[retry].astype(str)
+        number = pd.to_numeric(text.str.replace(_non_decimal.pattern, '', regex=True),
+                               errors='coerce').values.astype(float)
+        number = np.where(text.str.match(_negative.pattern).values, -number, number)
+        number = np.where(text.str.contains('%', regex=False).values, number / 100, number)
+        number = np.where(text.str.match(_numerical.pattern).values, number, np.nan)
+        result[retry] = number
+
+    valid = ~np.isnan(result)
+    if dtype in ['int64', 'int', np.int64]:
+        result = np.where(valid, result, 0).astype(np.int64)
+
+    return result, valid
+
+
+def format_array(dec, format_, values):
+    """
+    Format a column of values, format specs are applied to the whole column at once
+    
+    Parameters
+    ----------
+    dec : int
+        number of decimal places for float_ and currency, not used by format specs
+    format_ : str
+        format style, as for `format_text`
+    values : list, array, or Series
+        values to format
+    
+    Returns
+    -------
+    Formatted text : np.ndarray (object)
+    """
+    if _is_spec(format_):
+        return _spec_format(format_).format_array(values)
+
+    return np.array([format_text(dec, format_, value) for value in values], dtype=object)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_format(spec, thousands=',', decimal='.'):
+    """
+    Compile a format spec once, later calls with the same spec return the cached NumberFormat
+    
+    Spec language (a subset of spreadsheet number formats):
+        - up to three sections separated by ';', for positive, negative and zero values, negative values use the
+          first section with a leading '-' if there is no negative section
+        - in each section a run of '#', '0', ',' and '.' is the number, ',' in the run groups thousands and the
+          number of '0' or '#' after '.' sets the decimal places
+        - text before and after the number is kept as is, '%' multiplies the value by 100
+    
+    Examples: '#,##0', '$#,##0.00;($#,##0.00)', '0.0%', '#,##0.00 "units"'
+    
+    Parameters
+    ----------
+    spec : str
+        format spec
+    thousands : str, default=','
+        thousands separator to display, None to take it from the current locale
+    decimal : str, default='.'
+        decimal point to display, None to take it from the current locale
+    
+    Returns
+    -------
+    compiled format : NumberFormat
+    """
+    conv = locale.localeconv()
+    if thousands is None:
+        thousands = conv['thousands_sep'] or ','
+    if decimal is None:
+        decimal = conv['decimal_point'] or '.'
+
+    return NumberFormat(spec, thousands, decimal)
+
+
+class NumberFormat(object):
+    """
+    Number format compiled from a format spec, use `compile_format` to get a cached instance
+    
+    **METHODS:**
+    
+    **format** : Format a single value
+    
+    **format_array** : Format a column of values
+    
+    Parameters
+    ----------
+    spec : str
+        format spec, see `compile_format`
+    thousands : str
+        thousands separator to display
+    decimal : str
+        decimal point to display
+    """
+    def __init__(self, spec, thousands=',', decimal='.'):
+        self.spec = spec
+        self.sections = [self._compile(section) for section in spec.split(';')[:3]]
+        self._separators = None
+        if (thousands, decimal) != (',', '.'):
+            self._separators = str.maketrans({',': thousands, '.': decimal})
+
+    @staticmethod
+    def _compile(section):
+        """
+        Returns (prefix, python format string, suffix, percent) of a spec section
+        """
+        digits = [i for i in (section.find('#'), section.find('0')) if i >= 0]
+        if not digits:  # literal text only
+            return section.replace('"', ''), None, '', False
+        start = min(digits)
+        if start > 0 and section[start - 1] == '.':
+            start -= 1
+        end = start
+        while end < len(section) and section[end] in '#0,.':
+            end += 1
+
+        number = section[start:end]
+        integer, _, fraction = number.partition('.')
+        pattern = '{:' + (',' if ',' in integer else '') + '.' + str(len(fraction)) + 'f}'
+        prefix = section[:start].replace('"', '')
+        suffix = section[end:].replace('"', '')
+
+        return prefix, pattern, suffix, '%' in prefix + suffix
+
+    def _section(self, number):
+        """
+        Returns (section, sign) used to display number
+        """
+        if number < 0:
+            return (self.sections[1], '') if len(self.sections) > 1 else (self.sections[0], '-')
+        if number == 0 and len(self.sections) > 2:
+            return self.sections[2], ''
+
+        return self.sections[0], ''
+
+    def _text(self, section, sign, magnitudes):
+        """
+        Returns list of the formatted text of magnitudes (absolute values) in a section
+        """
+        prefix, pattern, suffix, percent = section
+        if pattern is None:
+            return [prefix] * len(magnitudes)
+        if percent:
+            magnitudes = magnitudes * 100
+        texts = [pattern.format(magnitude) for magnitude in magnitudes.tolist()]
+        if self._separators is not None:
+            texts = [text.translate(self._separators) for text in texts]
+
+        return [sign + prefix + text + suffix for text in texts]
+
+    def format(self, value):
+        """
+        Format a single value
+        
+        Parameters
+        ----------
+        value : number or numerical text
+        
+        Returns
+        -------
+        formatted text : str, value unchanged if it is not a number
+        """
+        number = _to_number(value)
+        if number is None:
+            return value
+        section, sign = self._section(number)
+
+        return self._text(section, sign, np.array([abs(number)], dtype=float))[0]
+
+    def format_array(self, values):
+        """
+        Format a column of values, values are parsed and split by section in single vectorized passes
+        
+        Parameters
+        ----------
+        values : list, array, or Series
+        
+        Returns
+        -------
+        formatted text : np.ndarray (object), values that are not numbers are unchanged
+        """
+        result = np.array(values, dtype=object)
+        numbers, valid = parse_numbers(result)
+        magnitudes = np.abs(numbers)
+        cases = [(valid & (numbers > 0), 1.0), (valid & (numbers < 0), -1.0), (valid & (numbers == 0), 0.0)]
+        for mask, sample in cases:
+            if mask.any():
+                section, sign = self._section(sample)
+                result[mask] = self._text(section, sign, magnitudes[mask])
+
+        return result
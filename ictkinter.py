@@ -10,33 +10,79 @@ create_menu**
         creates a menu from the provided dict in the provided window
 create_sub_menu**
         returns sub menu to add to menu cascade
+invalidate_menu**
+        rebuilds lazy menus the next time they are opened
 clear_subframe**
         clears and recreates subframe
 populate_list_box**
         populates a list box in the GUI with the data provided
+render_scheduler**
+        returns the RenderScheduler shared by the widgets of a window
+load_table**
+        streams a csv or parquet file into a TableFrame
+save_column_cache**
+        writes table data to memory mappable column files
+load_column_cache**
+        finds the memory mappable column cache of a file
 
 **class:**
+LazyMenu**
+        menu built the first time it is opened
+StyleRegistry**
+        interns cell styles as small integer ids
 TableFrame**
         creates a Dataframe linked to a tkinter frame
+TableView**
+        sorted and filtered view of a TableFrame
+SharedDataset**
+        dataset shared by several TableFrames, copied on write, changes sent to every table
+ColumnStats**
+        running summary statistics of a column
+EditHistory**
+        undo/redo stack of compact table edits
+RenderScheduler**
+        runs long tkinter work in time budgeted slices from the event loop
+ChartSlot**
+        canvas image redrawn in place, for graphs that refresh
+AsyncBridge**
+        runs coroutines on an asyncio loop thread and hands results back to tkinter
 ListBoxController**
         creates a list box with specified control elements and a scroll bar
 ScrollFrame**
         creates a canvas with scroll bar
 CreateToolTip**
         create a tooltip for a given widget
+ToolTipManager**
+        tooltips for any number of widgets and table cells from one window and one set of bindings
 """
 
 import tkinter
+import tkinter.font
 import os
+import sys
+import asyncio
+import contextlib
+import csv
+import html
+import hashlib
+import json
+import queue
+import shutil
+import tempfile
+import threading
+import time
+import collections
+import math
 from PIL import ImageTk, Image
 import re
+import bisect
 import numpy as np
 import pandas as pd
 import icstring
 
 icons = {'bookmark': 'add_bookmark.png',
          'clear': 'clear.png',
-         'fileopen': 'fileopen.png',
+         'fileopen': 'fileopen.jpg',
          'folder': 'folder.png',
          'minus': 'minus.png',
          'plus': 'plus.png',
@@ -50,15 +96,16 @@ def icon(icon_name, size=16):
         :param icon_name:str: name of icon to retrieve in icons dict
         :param size:int: size of icon to be returned
         """
-    filename = os.path.dirname(__file__) + '\\rsc\\' + icons[icon_name]
+    filename = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'rsc', icons[icon_name])
     img = Image.open(filename)
     if img.width > size:
-        img = img.resize((size, size), Image.ANTIALIAS)
+        img = img.resize((size, size), Image.LANCZOS)
 
     return ImageTk.PhotoImage(img)
 
 
-def image_to_canvas(subframe, photo, row=0, column=0, padx=2, pady=1, sticky='nsew', x1=0, y1=0, anchor='nw', canvas=None):
+def image_to_canvas(subframe, photo, row=0, column=0, padx=2, pady=1, sticky='nsew', x1=0, y1=0, anchor='nw',
+                    canvas=None, item=None):
     """place graph image on canvas, and place canvas in subframe
 
         :param subframe:tkinter.Frame: frame to contain canvas(s)
@@ -72,20 +119,55 @@ def image_to_canvas(subframe, photo, row=0, column=0, padx=2, pady=1, sticky='ns
         :param y1:int: y coordinate
         :param anchor:Str: image anchor location
         :param canvas:tkinter.Canvas: canvas to add image to, if none will create and add to subframe 
+        :param item:str: tag of an image item on the canvas, the item is updated in place if it exists, else it is
+            created with this tag, None to always create a new item
     """
     if canvas is None:
         canvas = tkinter.Canvas(subframe)
     canvas.grid(row=row, column=column, sticky=sticky, padx=padx, pady=pady)
-    canvas.create_image(x1, y1, image=photo, anchor=anchor)
+    if item is not None and canvas.find_withtag(item):
+        canvas.itemconfigure(item, image=photo, anchor=anchor)
+        canvas.coords(item, x1, y1)
+    else:
+        canvas.create_image(x1, y1, image=photo, anchor=anchor, tags=() if item is None else (item,))
 
     return photo, canvas
 
 
-def create_menu(window, menu_def):
+def _add_menu_items(menu, submenu_def, icon_list, sub_menu):
+    """adds the items of a sub menu definition to menu
+
+        :param menu:tkinter.Menu: menu to add items to
+        :param submenu_def:tuple or function: (('menu item', 'command'), () pairs, use str as first item in tuple to
+                    create submenu cascade, or a function returning the definition
+        :param icon_list:list: keeps a reference to the item icons
+        :param sub_menu:function: called as sub_menu(menu, submenu_def) to create a submenu cascade
+    """
+    if callable(submenu_def):
+        submenu_def = submenu_def()
+    for sub_menu_item in submenu_def:
+        if type(sub_menu_item) is tuple:
+            if sub_menu_item[0] == '---':
+                menu.add_separator()
+            else:
+                try:
+                    img = icon(sub_menu_item[2])
+                    icon_list.append(img)
+                except IndexError:
+                    img = None
+                menu.add_command(label=sub_menu_item[0], command=sub_menu_item[1], image=img,
+                                 compound=tkinter.LEFT)
+        else:
+            menu.add_cascade(label=sub_menu_item, menu=sub_menu(menu, submenu_def[1]))
+            return
+
+
+def create_menu(window, menu_def, lazy=False):
     """creates a menu from the provided dict in the provided window
 
         :param window:tkinter.Tk: frame to contain menu
         :param menu_def:tuple: menu structure definition
+        :param lazy:bool: build each cascade the first time it is opened instead of all at once
         
     Menu Format:
     menu_format = (('', '', '', ''),   # Tuple of strings for top row items, for single item define as ('item',)
@@ -96,44 +178,50 @@ def create_menu(window, menu_def):
                       'Settings': ('Theme',    # Use a string as first item in tuple to indicate a sub-menu
                                                # follow with ('menu item', 'command') pairs
                                    (('Default', '>def'), ('Flat', '>flat'), ('Dark', '>dark'))), 
-                      'Help': (('VDOT Bid Tabs', '>tab'), ('About', '>about'))}))
+                      'Help': (('VDOT Bid Tabs', '>tab'), ('About', '>about')),
+                      'Recent': recent_files}))  # a function returning ('menu item', 'command') pairs generates the
+                                                 # items, with lazy=True it is called when the menu is first opened
+                                                 # and again after invalidate_menu
                       
                       to add sperator: ('---', None)
     """
     # TODO - test for things like one top row item and one command pair item
-    def create_sub_menu(submenu_def):
+    def create_sub_menu(parent, submenu_def):
         """returns sub menu to add to menu cascade
         
+            :param parent:tkinter.Menu: menu the cascade is added to
             :param submenu_def:tuple: (('menu item', 'command'), () pairs, use str as first item in tuple to create
                         submenu cascade
         """
         sub_menu_ = tkinter.Menu(tearoff=0)
-        for sub_menu_item in submenu_def:
-            if type(sub_menu_item) is tuple:
-                if sub_menu_item[0] == '---':
-                    sub_menu_.add_separator()
-                else:
-                    try:
-                        img = icon(sub_menu_item[2])
-                        icon_list.append(img)
-                    except IndexError:
-                        img = None
-                    sub_menu_.add_command(label=sub_menu_item[0], command=sub_menu_item[1], image=img,
-                                          compound=tkinter.LEFT)
-            else:
-                sub_menu_b = create_sub_menu(submenu_def[1])
-                sub_menu_.add_cascade(label=sub_menu_item, menu=sub_menu_b)
-                return sub_menu_
+        _add_menu_items(sub_menu_, submenu_def, icon_list, create_sub_menu)
         return sub_menu_
 
     icon_list = []
     top_menu = tkinter.Menu(window, tearoff=1)
     for top_menu_item in menu_def[0]:
-        sub_menu = create_sub_menu(menu_def[1][top_menu_item])
+        if lazy:
+            sub_menu = LazyMenu(top_menu, menu_def[1][top_menu_item])
+        else:
+            sub_menu = create_sub_menu(top_menu, menu_def[1][top_menu_item])
         top_menu.add_cascade(label=top_menu_item, menu=sub_menu)
 
     window.config(menu=top_menu)
 
+    return top_menu
+
+
+def invalidate_menu(menu):
+    """rebuilds menu, and any lazy menus below it, the next time they are opened
+
+        :param menu:tkinter.Menu: menu returned by create_menu, or a LazyMenu
+    """
+    if isinstance(menu, LazyMenu):
+        menu.invalidate()
+    for child in menu.winfo_children():
+        if isinstance(child, tkinter.Menu):
+            invalidate_menu(child)
+
 
 def clear_subframe(frame, subframe):
     """clears and recreates subframe
@@ -148,635 +236,3641 @@ def clear_subframe(frame, subframe):
     return subframe
 
 
-def populate_list_box(listbox, data, select='keys'):
+def populate_list_box(listbox, data, select='keys', chunksize=200, priority=0, on_done=None):
     """populates a list box in the GUI with the data provided.
-    data can be of type 'dict or list'
+    data can be of type 'dict or list'.  Items are inserted a chunk at a time by the window's RenderScheduler, so
+    long lists fill in without blocking input, populating the list box again cancels an unfinished fill and removes
+    the items it had inserted.  The function returns before the items are inserted, read the list box from on_done,
+    or call render_scheduler(listbox).finish((str(listbox), 'populate')) first
     
         :param listbox:Tkinter.Listbox: list box to add data to
         :param data:dict or list: data to add to list box
         :param select:Str: 'keys' add dict keys - Default, 
                            'values' add dict values
+        :param chunksize:int: items inserted per step
+        :param priority:int: scheduler priority, higher runs first
+        :param on_done:function: called with no arguments once every item is inserted
     """
     if type(data) is dict and select == 'keys':
         items = sorted(data.keys())
     elif type(data) is dict and select == 'values':
         items = sorted(data.values())
     else:
-        items = data
+        items = list(data)
 
-    for item in items:
-        listbox.insert(tkinter.END, item)
+    def fill():
+        first = listbox.size()
+        inserted = 0
+        try:
+            for start in range(0, len(items), chunksize):
+                listbox.insert(tkinter.END, *items[start:start + chunksize])
+                inserted += len(items[start:start + chunksize])
+                yield
+        except GeneratorExit:  # cancelled by a newer fill, remove the partial items so they are not duplicated
+            last = first + inserted - 1
+            partial = [str(item) for item in items[:inserted]]
+            if inserted and [str(item) for item in listbox.get(first, last)] == partial:
+                listbox.delete(first, last)  # unless the caller already cleared the list box
+            raise
 
+    render_scheduler(listbox).submit((str(listbox), 'populate'), fill(), priority, on_done)
 
-class TableFrame(pd.DataFrame):
+
+def render_scheduler(widget):
+    """returns the RenderScheduler shared by the widgets of a window, created the first time it is needed
+
+        :param widget:tkinter widget: any widget in the window
     """
-    Create a table of tkinter.Label or tkinter.Button objects
+    top = widget.winfo_toplevel()
+    if getattr(top, '_render_scheduler', None) is None:
+        top._render_scheduler = RenderScheduler(top)
+
+    return top._render_scheduler
+
+
+class LazyMenu(tkinter.Menu):
+    """
+    Menu built from a submenu definition the first time it is opened, using Tk's postcommand.  The built items are
+    kept until `invalidate` is called, then rebuilt when the menu is next opened, so a definition given as a function
+    (i.e. recent files or bookmarks) is only called again when its items may have changed.
     
-    Usage notes:
-        - after creating or altering the dataframe, need to call `show` to display changes in tkinter window
-        - to change column data: 
-            t3['Average'] = [12, 12, 12, 12, 12, 12]
-                    is equivalent to
-            t3.column('Average', [13, 13, 13, 13, 13, 13])
-                    as self is derived from pd.DataFrame    
-                    
     **METHODS:**
     
-    **update** : Replaces data in table, does not alter index or column labels
-        
-    **hide_index** : send true to hide index column, false to show
-        
-    **hide_columns** : send true to hide column labels, false to show
-        
-    **add_label** : Adds label to subframe
-        
-    **show** : Display data table on subframe.
-        
-    **insert_row** : Inserts a row in the table at specified location
-        
-    **insert** : Inserts a column in the table at specified location
-    
-    **column_format** : Formats column in the table
-    
-    **header_format** : Formats the header (column titles)
+    **invalidate** : Rebuild the items the next time the menu is opened
     
-    **index_format** : Formats the index column
+    Parameters
+    ----------
+    master : tkinter.Menu
+        menu the cascade is added to
+    submenu_def : tuple or function
+        (('menu item', 'command'), () pairs as for `create_menu`, or a function returning them
+    """
+    def __init__(self, master, submenu_def, **kwargs):
+        super().__init__(master, tearoff=0, postcommand=self._build, **kwargs)
+        self.submenu_def = submenu_def
+        self.built = False
+        self.icon_list = []
+
+    def invalidate(self):
+        """Rebuild the items the next time the menu is opened"""
+        self.built = False
+
+    def _build(self):
+        """Builds the items, if not already built, cascades are LazyMenus themselves"""
+        if self.built:
+            return
+
+        for child in self.winfo_children():  # cascades of the previous build
+            child.destroy()
+        self.delete(0, tkinter.END)
+        self.icon_list = []
+        _add_menu_items(self, self.submenu_def, self.icon_list, LazyMenu)
+        self.built = True
+
+
+class StyleRegistry(object):
+    """
+    Interns cell styles, each distinct (font name, font size, font style, format, decimals, foreground, background)
+    combination is stored once and referenced by a small integer id.  Tables keep one id per cell in an int array, and
+    a tkinter font is created once per distinct (font name, size, style), the first time it is displayed.
     
-    **row_format** : Formats row in the table
+    **METHODS:**
     
-    **i_column** : Replaces specified column (index) with provided data
+    **intern** : Id of a style, registering it if new
     
-    **column** : Replaces specified column (label) with provided data
-     
-    **i_row** : Replaces specified row (index) with provided data
+    **derive** : Id of an existing style with some fields replaced
     
-    **row** : Replaces specified row (label) with provided data
+    **key** : Fields of a style
     
-    **row_rename** : Rename row index  --*UNDER CONSTRUCTION*--
+    **font** : tkinter font of a style
     
-    **column_rename** : Rename column  --*UNDER CONSTRUCTION*-- 
+    **colors** : tkinter colour options of a style
     
-    Parameters
-    ----------  
-    -- General parameters:             
-    window : tkinter.Frame
-        container for TableFrame
-            
-    -- Dataframe parameters:
-    data : dict, list, or df
-        data to be put in TableFrame
-    index : list
-        row labels (df index)
-    column : list
-        columns labels (df columns)
-    orient : str
-        The "orientation" of the data. If the keys of the passed dict
-        should be the columns of the resulting DataFrame, pass 'columns'
-        (default). Otherwise if the keys should be rows, pass 'index'.
-                
-    -- tkinter parameters:
-    row : int
-        row in window
-    column : int
-        column in window
-    sticky : str
-        tkinter.Frame resource
-    columnspan : int
-        columnspan in window
-            
-    -- formatting parameters:
-    bold : tuple
-        columns or rows to be bolded, 0 indexed with or without index/headers.
-        Designate by: ('col0, 'col2', 'row1')
-    currency : str 
-        columns or rows to be formatted as currency '$0.00', 0 indexed with or without 
-        index/headers.  Designate by: ('col0, 'col2', 'row1')
-    float_ : str
-        columns or rows to be formatted as float '0.00', 0 indexed with or without index/headers.
-        Designate by: ('col0, 'col2', 'row1') # TODO be able to set precision
-    int_ : str
-        columns or rows to be formatted as int '0', 0 indexed with or without index/headers.
-        Designate by: ('col0, 'col2', 'row1')  # TODO not working, need to code
-          
-                
+    **measure** : Width of text in a style's font
     
+    **text** : Value formatted by a style
     
-    **=EXAMPLES===============================================================**
-        print('------------------------------------------')
-        print('From composite lists:')
+    **format_values** : Column of values formatted by their styles
+    """
+    def __init__(self):
+        self._keys = []  # id: (fontname, fontsize, fontstyle, format_, dec, foreground, background)
+        self._ids = {}  # (fontname, fontsize, fontstyle, format_, dec, foreground, background): id
+        self._fonts = {}  # (fontname, fontsize, fontstyle): tkinter.font.Font, shared by styles using the same font
+        self._widths = {}  # (id, text): width in pixels
+
+    def intern(self, fontname='arial', fontsize=10, fontstyle='normal', format_='', dec=2, foreground=None,
+               background=None):
+        """
+        Id of a style, registering it if new
         
-        data_lst = [['00', '01', '02', '03'],
-                    ['10', '11', '12', '13'],
-                    ['20', '21', '22', '23'],
-                    ['30', '31', '32', '33'],
-                    ['40', '41', '42', '43'],
-                    ['50', '51', '52', '53']]
+        Parameters
+        ----------
+        fontname : str
+            name of font to use
+        fontsize : int
+            font size
+        fontstyle : str
+            font style
+        format_ : str
+            format code ('$', 'float', 'int') or format spec, '' for none
+        dec : int
+            number of decimal places for 'float' and '$'
+        foreground : str
+            text colour, i.e. '#9c0006', None for the widget default
+        background : str
+            background colour, None for the widget default
         
-        t1 = tkinter_exp.TableFrame(main, row=2, data=data_lst,
-                                    index=[2014, 2013, 2012, 2011, 2010, 2009],
-                                    columns=['Average', 'Min', 'Max', 'Count'])
-        t1.draw_table()
+        Returns
+        -------
+        style id : int
+        """
+        key = (fontname, fontsize, fontstyle, format_, dec, foreground, background)
+        if key not in self._ids:
+            self._ids[key] = len(self._keys)
+            self._keys.append(key)
+
+        return self._ids[key]
+
+    def derive(self, style_id, fontname=None, fontsize=None, fontstyle=None, format_=None, dec=None, foreground=None,
+               background=None):
+        """
+        Id of an existing style with some fields replaced, fields left as None are kept
         
-        print('------------------------------------------')
-        print('From DataFrame:')
+        Returns
+        -------
+        style id : int
+        """
+        key = self._keys[style_id]
+        changes = (fontname, fontsize, fontstyle, format_, dec, foreground, background)
+
+        return self.intern(*[old if new is None else new for old, new in zip(key, changes)])
+
+    def key(self, style_id):
+        """
+        Fields of a style
         
-        data_array = np.array([np.arange(6)]*4).T
-        data_df = pd.DataFrame(data_array)
-        t2 = tkinter_exp.TableFrame(main, row=3, data=data_df,
-                                    index=[2014, 2013, 2012, 2011, 2010, 2009],
-                                    columns=['Average', 'Min', 'Max', 'Count'])
-        t2.draw_table()
+        Returns
+        -------
+        (fontname, fontsize, fontstyle, format_, dec, foreground, background) : tuple
+        """
+        return self._keys[style_id]
+
+    def font(self, style_id):
+        """
+        tkinter font of a style, requires a tkinter root window.  Styles differing only in format or colour share one
+        font
         
-        print('------------------------------------------')
-        print('From dict:')
+        Returns
+        -------
+        font : tkinter.font.Font
+        """
+        font = self._keys[style_id][:3]
+        if font not in self._fonts:
+            self._fonts[font] = tkinter.font.Font(font=font)
+
+        return self._fonts[font]
+
+    def measure(self, style_id, text):
+        """
+        Width of text in a style's font, memoized per (style, text) so each distinct string is measured once
         
-        data_dict = {2014: ['00', '01', '02', '03'],
-                     2013: ['10', '11', '12', '13'],
-                     2012: ['20', '21', '22', '23'],
-                     2011: ['30', '31', '32', '33'],
-                     2010: ['40', '41', '42', '43'],
-                     2009: ['50', '51', '52', '53']}
-        t3 = tkinter_exp.TableFrame(main, row=4, data=data_dict, orient='index', columns=['Average', 'Min',
-                                    'Max', 'Count'])
-        t3.draw_table() 
-      
-    **=RESULTS================================================================**
-        ------------------------------------------
-        From composite lists:
-             Average Min Max Count
-        2014      00  01  02    03
-        2013      10  11  12    13
-        2012      20  21  22    23
-        2011      30  31  32    33
-        2010      40  41  42    43
-        2009      50  51  52    53
-        ------------------------------------------
-        From DataFrame:
-              Average  Min  Max  Count
-        2014        0    0    0      0
-        2013        1    1    1      1
-        2012        2    2    2      2
-        2011        3    3    3      3
-        2010        4    4    4      4
-        2009        5    5    5      5
-        ------------------------------------------
-        From dict:
-             Average Min Max Count
-        2009      50  51  52    53
-        2010      40  41  42    43
-        2011      30  31  32    33
-        2012      20  21  22    23
-        2013      10  11  12    13
-        2014      00  01  02    03 
-    """
-    def __init__(self, window, data=None, index=None, columns=None, orient='columns',
-                 row=0, column=0, sticky='nsew', columnspan=1,
-                 bold=None, currency=None, float_=None, int_=None, blank='--'):
+        Returns
+        -------
+        width in pixels : int
         """
-        creates a Dataframe linked to a tkinter frame
+        key = (style_id, text)
+        if key not in self._widths:
+            if len(self._widths) >= 2 ** 16:  # bounded, tables of unique values would otherwise grow it forever
+                self._widths.clear()
+            self._widths[key] = self.font(style_id).measure(text)
+
+        return self._widths[key]
+
+    def colors(self, style_id):
+        """
+        tkinter colour options of a style, only the colours the style sets
+        
+        Returns
+        -------
+        options : dict
+            'fg' and 'bg' when set, for tkinter.Label
         """
-        frame = tkinter.Frame(window)
-        frame.grid(row=row, column=column, sticky=sticky, columnspan=columnspan)
+        foreground, background = self._keys[style_id][5:]
+        options = {}
+        if foreground is not None:
+            options['fg'] = foreground
+        if background is not None:
+            options['bg'] = background
 
-        sub_frame = tkinter.Frame(frame)
-        sub_frame.grid(row=0, column=0, sticky='nsew')
+        return options
 
-        if type(data) is pd.DataFrame:
-            super_df = data.copy()
-            if index is None:
-                index = super_df.index.values
-            if columns is None:
-                columns = super_df.columns
-            # super().__init__(data=data)
-            # df.rename(columns=dict(zip(data.columns, columns)), inplace=True)
-            # df.index = index
-            # self.rename(columns=dict(zip(data.columns, columns)), inplace=True)
-            # self.index = index
-        else:
-            # elif type(data) is dict:
-            super_df = pd.DataFrame.from_dict(data=data, orient='index')
-            super_df.rename(columns=dict(zip(super_df.columns, columns)), inplace=True)
-            # self.rename(columns=dict(zip(df.columns, columns)), inplace=True)
-        # else:
-            # super().__init__(data=data, index=index, columns=columns)
+    def text(self, style_id, value):
+        """
+        Value formatted by a style
+        
+        Returns
+        -------
+        formatted value : str
+        """
+        format_, dec = self._keys[style_id][3:5]
+        if format_ == '':
+            return value
 
-        index, width = super_df.shape  # index x column
-        default_font = ('arial', 10, 'normal')
+        return icstring.format_text(dec, format_, value)
 
-        super_dict = {}
-        for index in super_df.index.values:
-            tup = ()
-            for column in super_df.columns:
-                tup = tup + ({'data': super_df[column][index],
-                              'lbl': tkinter.Label(sub_frame, text=super_df[column][index]),
-                              'font': default_font}, )
-            super_dict[index] = tup
-        super_df = pd.DataFrame.from_dict(super_dict, orient='index')
-        super_df.columns = columns
-        super().__init__(data=super_df)
+    def format_values(self, style_ids, values):
+        """
+        Column of values formatted by their styles, values sharing a style are formatted together
+        
+        Parameters
+        ----------
+        style_ids : np.ndarray (int)
+            style id of each value
+        values : list or array like
+            values to format
+        
+        Returns
+        -------
+        formatted values : np.ndarray (object)
+        """
+        texts = np.array(values, dtype=object)
+        for style_id in np.unique(style_ids):
+            format_, dec = self._keys[style_id][3:5]
+            if format_ != '':
+                mask = style_ids == style_id
+                texts[mask] = icstring.format_array(dec, format_, texts[mask])
 
-        self.default_font = default_font
+        return texts
 
-        self.frame = frame
-        self.sub_frame = sub_frame
-        self.cur_lbl = None
 
-        self._formattting = {'index': {'font': self.default_font}, 'header': {'font': self.default_font}}
+styles = StyleRegistry()
+
+
+def _wrap_cells(data):
+    """returns DataFrame of table cells wrapping the values in data, cell labels are created by `TableFrame.show`.
+    Frames already holding cells, marked by attrs['cells'], are returned as they are
+
+        :param data:pd.DataFrame: values to wrap
+    """
+    if data.attrs.get('cells'):
+        return data
+    cells = np.empty(data.shape, dtype=object)
+    for col in range(data.shape[1]):
+        cells[:, col] = [{'data': value, 'lbl': None} for value in data.iloc[:, col].values]
+
+    return pd.DataFrame(cells, index=data.index, columns=data.columns)
+
+
+def _read_chunks(path, fmt=None, chunksize=10000, index_col=None):
+    """yields DataFrame chunks of a csv file, or the row groups of a parquet file
+
+        :param path:str: file to read
+        :param fmt:str: 'csv' or 'parquet', if None taken from the file extension
+        :param chunksize:int: rows per csv chunk
+        :param index_col:int or str: csv column to use as the row labels
+    """
+    if fmt is None:
+        fmt = os.path.splitext(path)[1].lstrip('.')
+    fmt = fmt.lower()
+
+    if fmt == 'csv':
+        for chunk in pd.read_csv(path, chunksize=chunksize, index_col=index_col):
+            yield chunk
+    elif fmt in ['parquet', 'pq']:
+        import pyarrow.parquet as pq
+        parquet_file = pq.ParquetFile(path)
+        for i in range(parquet_file.num_row_groups):
+            yield parquet_file.read_row_group(i).to_pandas()
+    else:
+        raise ValueError("Invalid format: '{}'".format(fmt))
+
+
+def _cache_path(path, cache_dir, fmt=None, index_col=None):
+    """returns the cache folder for path, named '<path key>-<version key>' where the path key hashes the file's
+    absolute path and the version key its modification time and the read options
+
+        :param path:str: source file
+        :param cache_dir:str: folder holding the column caches
+        :param fmt:str: format the file is read as
+        :param index_col:int or str: csv column used as the row labels
+    """
+    path_key = hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()
+    version = '{}|{}|{!r}'.format(os.stat(path).st_mtime_ns, fmt, index_col)
+
+    return os.path.join(cache_dir, '{}-{}'.format(path_key, hashlib.sha1(version.encode('utf-8')).hexdigest()))
+
+
+def _prune_cache(folder):
+    """removes the caches of older versions of the file cached in folder"""
+    cache_dir, name = os.path.split(folder)
+    prefix = name.split('-')[0] + '-'
+    for other in os.listdir(cache_dir):
+        if other.startswith(prefix) and other != name:
+            shutil.rmtree(os.path.join(cache_dir, other), ignore_errors=True)
+
+
+_missing = [None, np.nan, pd.NaT, pd.NA]  # missing values of object columns, stored in masks as 1 + position
+
+
+def _missing_code(value):
+    """returns the mask code of a missing value, float NaNs of any type and unknown missing values are stored as NaN
+    """
+    for code, missing in [(1, None), (3, pd.NaT), (4, pd.NA)]:
+        if value is missing:
+            return code
+
+    return 2
+
+
+def _column_array(parts):
+    """returns (array, mask) of the parts joined, object values are stored as fixed width strings so the array can
+    be memory mapped.  mask is None, or for object arrays with missing values an int8 array holding the
+    `_missing_code` of the missing value at each element, 0 where the value is present
+
+        :param parts:list: Series, Index or arrays to join
+    """
+    array = np.concatenate([np.asarray(part) for part in parts])
+    if array.dtype != object:
+        return array, None
+
+    mask = None
+    missing = pd.isna(array)
+    if missing.any():
+        mask = np.zeros(len(array), dtype=np.int8)
+        for i in np.flatnonzero(missing):
+            mask[i] = _missing_code(array[i])
+        array = array.copy()
+        array[missing] = ''
+
+    return array.astype(str), mask
+
+
+def _restore_missing(values, mask):
+    """returns values as an object array with the missing values recorded in mask put back
+
+        :param values:np.ndarray: slice of a cached column
+        :param mask:np.ndarray: matching slice of the column's mask, or None
+    """
+    if mask is None or not mask.any():
+        return values
+    values = values.astype(object)
+    for i in np.flatnonzero(mask):
+        values[i] = _missing[mask[i] - 1]
+
+    return values
+
+
+def _start_cache(cache_dir):
+    """returns a new folder in cache_dir to write a cache into, a cache is written aside and renamed by
+    `_finish_cache` once complete, so a half written cache is never mapped
+
+        :param cache_dir:str: folder holding the column caches
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+
+    return tempfile.mkdtemp(dir=cache_dir)
+
+
+def _write_cache_chunk(tmp, number, chunk):
+    """writes the index and columns of a chunk to one .npy file each, in sub folder number of a cache being written
+
+        :param tmp:str: folder returned by `_start_cache`
+        :param number:int: position of the chunk in the file
+        :param chunk:pd.DataFrame: rows read from the file
+    """
+    folder = os.path.join(tmp, str(number))
+    os.mkdir(folder)
+    for name, part in [(str(i), chunk.iloc[:, i]) for i in range(chunk.shape[1])] + [('index', chunk.index)]:
+        array, mask = _column_array([part])
+        np.save(os.path.join(folder, '{}.npy'.format(name)), array)
+        if mask is not None:
+            np.save(os.path.join(folder, '{}.mask.npy'.format(name)), mask)
+
+
+def _finish_cache(tmp, folder, columns, chunks):
+    """moves a completely written cache into place and removes the caches of older versions of the file
+
+        :param tmp:str: folder returned by `_start_cache`
+        :param folder:str: cache folder, from `_cache_path`
+        :param columns:list: column labels
+        :param chunks:int: number of chunks written
+    """
+    with open(os.path.join(tmp, 'columns.json'), 'w') as f:
+        json.dump({'columns': list(columns), 'chunks': chunks}, f, default=str)
+    try:
+        os.rename(tmp, folder)
+    except OSError:  # cached by another process in the meantime
+        shutil.rmtree(tmp)
+    _prune_cache(folder)
+
+    return folder
+
+
+def save_column_cache(data, path, cache_dir, fmt=None, index_col=None):
+    """writes the index and columns of each chunk of data to one .npy file each, so later loads of path can memory
+    map them instead of parsing the file again.  Caches of older versions of path are removed
+
+        :param data:pd.DataFrame or list: data read from path, or the list of chunks it was read in
+        :param path:str: source file the data was read from
+        :param cache_dir:str: folder holding the column caches
+        :param fmt:str: format the file was read as
+        :param index_col:int or str: csv column used as the row labels
+    """
+    if type(data) is pd.DataFrame:
+        data = [data]
+    folder = _cache_path(path, cache_dir, fmt, index_col)
+    if os.path.isdir(folder):
+        return folder
+
+    tmp = _start_cache(cache_dir)
+    for number, chunk in enumerate(data):
+        _write_cache_chunk(tmp, number, chunk)
+
+    return _finish_cache(tmp, folder, data[0].columns, len(data))
+
+
+def load_column_cache(path, cache_dir, fmt=None, index_col=None):
+    """returns (columns, chunk folders) of the cache of path, or None if path has not been cached with these options
+    or has been modified since.  The chunks are memory mapped read only as `_cached_chunks` reads them
+
+        :param path:str: source file
+        :param cache_dir:str: folder holding the column caches
+        :param fmt:str: format the file is read as
+        :param index_col:int or str: csv column used as the row labels
+    """
+    folder = _cache_path(path, cache_dir, fmt, index_col)
+    if not os.path.isdir(folder):
+        return None
+
+    with open(os.path.join(folder, 'columns.json')) as f:
+        cache = json.load(f)
+
+    return cache['columns'], [os.path.join(folder, str(number)) for number in range(cache['chunks'])]
+
+
+def _cached_chunks(cached):
+    """yields the DataFrame chunks of a cache returned by `load_column_cache`, one chunk is mapped at a time and
+    only the pages of each chunk that are used are read
+
+        :param cached:tuple: (columns, chunk folders)
+    """
+    columns, folders = cached
+    for folder in folders:
+        def part(name):
+            array = np.load(os.path.join(folder, '{}.npy'.format(name)), mmap_mode='r')
+            mask_file = os.path.join(folder, '{}.mask.npy'.format(name))
+            return _restore_missing(array, np.load(mask_file) if os.path.exists(mask_file) else None)
+
+        chunk = pd.DataFrame({i: part(i) for i in range(len(columns))}, index=part('index'))
+        chunk.columns = columns
+        yield chunk
+
+
+def _write_chunks(chunks, tmp, written):
+    """yields chunks, writing each one to the cache being written in tmp and appending its columns to written"""
+    for chunk in chunks:
+        _write_cache_chunk(tmp, len(written), chunk)
+        written.append(chunk.columns)
+        yield chunk
+
+
+def load_table(window, path, fmt=None, chunksize=10000, index_col=None, page_size=50, on_chunk=None, on_done=None,
+               cache_dir=None, **kwargs):
+    """streams a csv or parquet file into a TableFrame.  The first chunk is displayed straight away, the remaining
+    chunks are read one per pass of the tkinter event loop so the window stays responsive while loading.  Chunks
+    are appended straight away until the displayed page is full, after that (and with page_size None, where every
+    row is displayed) they are held back and appended together once they add up to the rows already in the table,
+    so the table is copied O(log n) times, not once per chunk
+
+        :param window:tkinter.Frame: container for TableFrame
+        :param path:str: csv or parquet file to load
+        :param fmt:str: 'csv' or 'parquet', if None taken from the file extension
+        :param chunksize:int: rows per csv chunk, parquet files are read one row group at a time
+        :param index_col:int or str: csv column to use as the row labels
+        :param page_size:int: number of rows displayed by the table, None for all rows
+        :param on_chunk:function: called as on_chunk(table, rows_loaded) after each chunk is read
+        :param on_done:function: called as on_done(table) once the whole file is loaded and displayed
+        :param cache_dir:str: folder for memory mapped column caches, if set the parsed columns are cached on the
+            first load, a chunk at a time as they are read, and later loads of the unchanged file map the cache
+            instead of parsing the file
+        :param kwargs: passed on to TableFrame (row, column, sticky, ...)
+    """
+    cached = writing = None
+    if cache_dir is not None:
+        cached = load_column_cache(path, cache_dir, fmt, index_col)
+    if cached is not None:
+        chunks = _cached_chunks(cached)
+    else:
+        chunks = _read_chunks(path, fmt, chunksize, index_col)
+        if cache_dir is not None:  # written a chunk at a time as the file is read, so no chunk is held for it
+            writing = (_start_cache(cache_dir), [], _cache_path(path, cache_dir, fmt, index_col))
+            chunks = _write_chunks(chunks, *writing[:2])
+
+    table = TableFrame(window, data=next(chunks), page_size=page_size, **kwargs)
+    table.show()
+    if on_chunk is not None:
+        on_chunk(table, len(table))
+
+    held = []  # chunks read but not yet appended
+
+    def page_full():
+        return table.page_size is not None and len(table) >= table.page_start + table.page_size
+
+    def append_held():
+        shown = page_full()  # with page_size None every row is displayed, so the table is always shown again
+        table._append_cells(pd.concat(held) if len(held) > 1 else held[0])
+        table.history.clear()  # loading is not an edit, positions recorded before it no longer hold
+        del held[:]
+        if not shown:
+            table.show()
+
+    def loaded():
+        if not table.frame.winfo_exists():
+            return
+        if render_scheduler(table.frame).pending((str(table.frame), 'show')):  # on_done sees the labels built
+            table.frame.after(10, loaded)
+            return
+        on_done(table)
+
+    def load_next():
+        if not table.frame.winfo_exists():  # table closed before loading finished
+            chunks.close()
+            if writing is not None:
+                shutil.rmtree(writing[0], ignore_errors=True)
+            return
+        try:
+            chunk = next(chunks)
+        except StopIteration:
+            if held:
+                append_held()
+            if writing is not None:
+                tmp, written, folder = writing
+                _finish_cache(tmp, folder, written[0], len(written))
+            if on_done is not None:
+                loaded()
+            return
+
+        held.append(chunk)
+        rows_held = sum(len(rows) for rows in held)
+        if (table.page_size is not None and not page_full()) or rows_held >= len(table):
+            append_held()
+        if on_chunk is not None:
+            on_chunk(table, len(table) + sum(len(rows) for rows in held))
+        table.frame.after(1, load_next)  # after(1) rather than after_idle so pending input is handled first
+
+    table.frame.after(1, load_next)
+
+    return table
+
+
+def _numbers(values):
+    """returns values as a float array, numerical text such as '$1,234.50' is parsed, NaN for values that are not
+    numbers
+
+        :param values:list or array like: values to convert
+    """
+    return icstring.parse_numbers(values)[0]
+
+
+def _sort_keys(values):
+    """returns array to sort and filter values by, numbers (or numerical text) as float, anything else as text
+
+        :param values:list or array like: values to convert
+    """
+    values = np.asarray(values, dtype=object)
+    keys = _numbers(values)
+    if np.isnan(keys).sum() > pd.isnull(values).sum():  # not all values are numbers
+        keys = values.astype(str).astype(object)  # object so replacing a key never truncates it
+
+    return keys
+
+
+def _label_positions(index, labels):
+    """returns the position in index of each label, -1 for labels not in index.  A label index holds more than once
+    is matched to its last row
+
+        :param index:pd.Index: row labels of a table
+        :param labels:list or pd.Index: labels to look up
+    """
+    if index.is_unique:
+        return index.get_indexer(labels)
+    last = ~index.duplicated(keep='last')
+    found = index[last].get_indexer(labels)
+
+    return np.where(found >= 0, np.flatnonzero(last)[found], -1)
+
+
+def _sparkline_text(values):
+    """returns text summarising a sparkline cell, for output that cannot show the graph
+
+        :param values:list or array like: sequence of numbers drawn by the sparkline
+    """
+    try:
+        numbers = np.asarray(values, dtype=float).ravel()
+    except (TypeError, ValueError):
+        return str(values)
+    numbers = numbers[~np.isnan(numbers)]
+    if len(numbers) == 0:
+        return ''
+
+    return '{} values, {:g} to {:g}, last {:g}'.format(len(numbers), numbers.min(), numbers.max(), numbers[-1])
+
+
+def _blend(colors, t):
+    """returns '#rrggbb' colour at fraction t along a scale of colours
+
+        :param colors:list: '#rrggbb' colours, evenly spaced from t=0 to t=1
+        :param t:float: position on the scale, 0 to 1
+    """
+    rgb = np.array([[int(color[i:i + 2], 16) for i in (1, 3, 5)] for color in colors], dtype=float)
+    at = t * (len(colors) - 1)
+    i = min(int(at), len(colors) - 2)
+    mixed = rgb[i] + (rgb[i + 1] - rgb[i]) * (at - i)
+
+    return '#%02x%02x%02x' % tuple(int(round(c)) for c in mixed)
+
+
+def _rule_looks(rule, keys):
+    """returns list of (mask, (foreground, background, fontstyle)) pairs, the cells a conditional formatting rule
+    applies to and how they look, evaluated over a whole column at once
+
+        :param rule:dict: rule added by TableFrame.threshold_format, color_scale or top_n_format
+        :param keys:np.ndarray: float values of the column, NaN where not a number
+    """
+    look = (rule.get('foreground'), rule.get('background'), rule.get('fontstyle'))
+    valid = ~np.isnan(keys)
+    if rule['kind'] == 'threshold':
+        mask = valid.copy()
+        if rule['above'] is not None:
+            mask &= keys > rule['above']
+        if rule['below'] is not None:
+            mask &= keys < rule['below']
+        return [(mask, look)]
+
+    if rule['kind'] == 'top_n':
+        n = min(rule['n'], valid.sum())
+        order = np.argsort(np.where(valid, keys, -np.inf if rule['largest'] else np.inf), kind='mergesort')
+        mask = np.zeros(len(keys), dtype=bool)
+        if n > 0:
+            mask[order[-n:] if rule['largest'] else order[:n]] = True
+        return [(mask, look)]
+
+    # color scale, quantized to a fixed number of steps so a column uses at most that many styles
+    if not valid.any():
+        return []
+    low, high = np.nanmin(keys), np.nanmax(keys)
+    steps = rule['steps']
+    with np.errstate(invalid='ignore'):
+        level = np.rint((keys - low) / ((high - low) or 1) * (steps - 1))
+    return [(level == k, (None, _blend(rule['colors'], k / max(steps - 1, 1)), None))
+            for k in np.unique(level[valid]).astype(int)]
+
+
+def _widest(style_ids, texts, candidates=20):
+    """returns width in pixels of the widest of texts, estimated for every text from its length and the width of '0'
+    in its font, then measured exactly for the `candidates` widest estimates only
+
+        :param style_ids:np.ndarray: style id of each text
+        :param texts:list or array like: formatted texts
+        :param candidates:int: number of texts measured exactly
+    """
+    if len(texts) == 0:
+        return 0
+    texts = [str(text) for text in texts]
+    style_ids = np.asarray(style_ids)
+    lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+    unique_ids, inverse = np.unique(style_ids, return_inverse=True)
+    char_widths = np.array([styles.measure(style_id, '0') for style_id in unique_ids])
+    estimate = lengths * char_widths[inverse.ravel()]
+    if len(texts) > candidates:
+        top = np.argpartition(estimate, -candidates)[-candidates:]
+    else:
+        top = np.arange(len(texts))
+
+    return max(styles.measure(style_ids[i], texts[i]) for i in top)
+
+
+def _write_csv(path, chunks, header=True):
+    """writes chunks of rows of text to a csv file
+
+        :param path:str: file to write
+        :param chunks:generator: lists of rows of text
+        :param header:bool: first row is the header
+    """
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        for chunk in chunks:
+            writer.writerows(chunk)
+
+
+def _write_html(path, chunks, header=True):
+    """writes chunks of rows of text to an html table
+
+        :param path:str: file to write
+        :param chunks:generator: lists of rows of text
+        :param header:bool: first row is the header
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('<table>\n')
+        tag = 'th' if header else 'td'
+        for chunk in chunks:
+            for row in chunk:
+                f.write('<tr>' + ''.join('<{0}>{1}</{0}>'.format(tag, html.escape(text)) for text in row) + '</tr>\n')
+                tag = 'td'
+        f.write('</table>\n')
+
+
+def _write_xlsx(path, chunks, header=True):
+    """writes chunks of rows of text to an xlsx workbook, rows are streamed to disk as they are added
+
+        :param path:str: file to write
+        :param chunks:generator: lists of rows of text
+        :param header:bool: first row is the header
+    """
+    import openpyxl
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    for chunk in chunks:
+        for row in chunk:
+            sheet.append(row)
+    workbook.save(path)
+
+
+_writers = {'csv': _write_csv, 'html': _write_html, 'htm': _write_html, 'xlsx': _write_xlsx}
+
+
+class TableFrame(pd.DataFrame):
+    """
+    Create a table of tkinter.Label or tkinter.Button objects
+    
+    Usage notes:
+        - after creating or altering the dataframe, need to call `show` to display changes in tkinter window
+        - to change column data: 
+            t3['Average'] = [12, 12, 12, 12, 12, 12]
+                    is equivalent to
+            t3.column('Average', [13, 13, 13, 13, 13, 13])
+                    as self is derived from pd.DataFrame    
+                    
+    **METHODS:**
+    
+    **update** : Replaces data in table, does not alter index or column labels
+        
+    **hide_index** : send true to hide index column, false to show
+        
+    **hide_columns** : send true to hide column labels, false to show
+        
+    **add_label** : Adds label to subframe
+        
+    **show** : Display data table on subframe.
+    
+    **show_page** : Display the page of rows starting at the specified row
+    
+    **set_view** : Display rows in the order of a TableView
+    
+    **formatted_rows** : Yields the table as displayed, in chunks of rows of text
+    
+    **snapshot** : Plain, picklable copy of the table as displayed
+    
+    **render** : Draws the table into an image without tkinter
+    
+    **export** : Writes the table as displayed to a csv, html or xlsx file
+        
+    **insert_row** : Inserts a row in the table at specified location
+    
+    **append_rows** : Appends a batch of rows to the table
+    
+    **upsert_rows** : Updates existing rows and appends new rows from a batch
+    
+    **flush_rows** : Applies buffered row batches to the table
+    
+    **footer** : Adds summary rows (sum, mean, min, max, count) below the table
+    
+    **column_stats** : Summary statistics of a column
+    
+    **auto_width** : Sizes columns to their widest text, measured from font metrics
+    
+    **column_widths** : Widths of the columns in pixels
+    
+    **sparkline** : Displays a column of number sequences as inline trend graphs
+        
+    **insert** : Inserts a column in the table at specified location
+    
+    **column_format** : Formats column in the table
+    
+    **threshold_format** : Colours cells of a column above and/or below a value
+    
+    **color_scale** : Colours cells of a column on a gradient by value
+    
+    **top_n_format** : Colours the largest or smallest cells of a column
+    
+    **clear_conditional** : Removes conditional formatting rules
+    
+    **header_format** : Formats the header (column titles)
+    
+    **index_format** : Formats the index column
+    
+    **row_format** : Formats row in the table
+    
+    **i_column** : Replaces specified column (index) with provided data
+    
+    **column** : Replaces specified column (label) with provided data
+     
+    **i_row** : Replaces specified row (index) with provided data
+    
+    **row** : Replaces specified row (label) with provided data
+    
+    **undo** : Undo the last edit or format change
+    
+    **redo** : Redo the last undone edit or format change
+    
+    **row_rename** : Rename row index  --*UNDER CONSTRUCTION*--
+    
+    **column_rename** : Rename column  --*UNDER CONSTRUCTION*-- 
+    
+    Parameters
+    ----------  
+    -- General parameters:             
+    window : tkinter.Frame
+        container for TableFrame, None for a headless table that can be formatted, rendered and exported without
+        a display, but not shown
+            
+    -- Dataframe parameters:
+    data : dict, list, or df
+        data to be put in TableFrame
+    index : list
+        row labels (df index)
+    column : list
+        columns labels (df columns)
+    orient : str
+        The "orientation" of the data. If the keys of the passed dict
+        should be the columns of the resulting DataFrame, pass 'columns'
+        (default). Otherwise if the keys should be rows, pass 'index'.
+                
+    -- tkinter parameters:
+    row : int
+        row in window
+    column : int
+        column in window
+    sticky : str
+        tkinter.Frame resource
+    columnspan : int
+        columnspan in window
+    page_size : int, default=None
+        number of rows to display, None to display all rows
+            
+    -- formatting parameters:
+    bold : tuple
+        columns or rows to be bolded, 0 indexed with or without index/headers.
+        Designate by: ('col0, 'col2', 'row1')
+    currency : str 
+        columns or rows to be formatted as currency '$0.00', 0 indexed with or without 
+        index/headers.  Designate by: ('col0, 'col2', 'row1')
+    float_ : str
+        columns or rows to be formatted as float '0.00', 0 indexed with or without index/headers.
+        Designate by: ('col0, 'col2', 'row1') # TODO be able to set precision
+    int_ : str
+        columns or rows to be formatted as int '0', 0 indexed with or without index/headers.
+        Designate by: ('col0, 'col2', 'row1')  # TODO not working, need to code
+          
+                
+    
+    
+    **=EXAMPLES===============================================================**
+        print('------------------------------------------')
+        print('From composite lists:')
+        
+        data_lst = [['00', '01', '02', '03'],
+                    ['10', '11', '12', '13'],
+                    ['20', '21', '22', '23'],
+                    ['30', '31', '32', '33'],
+                    ['40', '41', '42', '43'],
+                    ['50', '51', '52', '53']]
+        
+        t1 = tkinter_exp.TableFrame(main, row=2, data=data_lst,
+                                    index=[2014, 2013, 2012, 2011, 2010, 2009],
+                                    columns=['Average', 'Min', 'Max', 'Count'])
+        t1.draw_table()
+        
+        print('------------------------------------------')
+        print('From DataFrame:')
+        
+        data_array = np.array([np.arange(6)]*4).T
+        data_df = pd.DataFrame(data_array)
+        t2 = tkinter_exp.TableFrame(main, row=3, data=data_df,
+                                    index=[2014, 2013, 2012, 2011, 2010, 2009],
+                                    columns=['Average', 'Min', 'Max', 'Count'])
+        t2.draw_table()
+        
+        print('------------------------------------------')
+        print('From dict:')
+        
+        data_dict = {2014: ['00', '01', '02', '03'],
+                     2013: ['10', '11', '12', '13'],
+                     2012: ['20', '21', '22', '23'],
+                     2011: ['30', '31', '32', '33'],
+                     2010: ['40', '41', '42', '43'],
+                     2009: ['50', '51', '52', '53']}
+        t3 = tkinter_exp.TableFrame(main, row=4, data=data_dict, orient='index', columns=['Average', 'Min',
+                                    'Max', 'Count'])
+        t3.draw_table() 
+      
+    **=RESULTS================================================================**
+        ------------------------------------------
+        From composite lists:
+             Average Min Max Count
+        2014      00  01  02    03
+        2013      10  11  12    13
+        2012      20  21  22    23
+        2011      30  31  32    33
+        2010      40  41  42    43
+        2009      50  51  52    53
+        ------------------------------------------
+        From DataFrame:
+              Average  Min  Max  Count
+        2014        0    0    0      0
+        2013        1    1    1      1
+        2012        2    2    2      2
+        2011        3    3    3      3
+        2010        4    4    4      4
+        2009        5    5    5      5
+        ------------------------------------------
+        From dict:
+             Average Min Max Count
+        2009      50  51  52    53
+        2010      40  41  42    43
+        2011      30  31  32    33
+        2012      20  21  22    23
+        2013      10  11  12    13
+        2014      00  01  02    03 
+    """
+    def __init__(self, window, data=None, index=None, columns=None, orient='columns',
+                 row=0, column=0, sticky='nsew', columnspan=1,
+                 bold=None, currency=None, float_=None, int_=None, blank='--', page_size=None):
+        """
+        creates a Dataframe linked to a tkinter frame
+        """
+        if window is None:  # headless table, formatted, rendered and exported but never shown
+            frame = sub_frame = None
+        else:
+            frame = tkinter.Frame(window)
+            frame.grid(row=row, column=column, sticky=sticky, columnspan=columnspan)
+
+            sub_frame = tkinter.Frame(frame)
+            sub_frame.grid(row=0, column=0, sticky='nsew')
+
+        if type(data) is pd.DataFrame:
+            super_df = data  # only read when wrapping the cells, no need to copy
+            if index is None:
+                index = super_df.index.values
+            if columns is None:
+                columns = super_df.columns
+            # super().__init__(data=data)
+            # df.rename(columns=dict(zip(data.columns, columns)), inplace=True)
+            # df.index = index
+            # self.rename(columns=dict(zip(data.columns, columns)), inplace=True)
+            # self.index = index
+        else:
+            # elif type(data) is dict:
+            super_df = pd.DataFrame.from_dict(data=data, orient='index')
+            super_df.rename(columns=dict(zip(super_df.columns, columns)), inplace=True)
+            # self.rename(columns=dict(zip(df.columns, columns)), inplace=True)
+        # else:
+            # super().__init__(data=data, index=index, columns=columns)
+
+        default_font = ('arial', 10, 'normal')
+
+        super_df = _wrap_cells(super_df)
+        super_df.columns = columns
+        super().__init__(data=super_df)
+
+        self.default_font = default_font
+        self.default_style = styles.intern(*default_font)
+        self._style_ids = np.full(self.shape, self.default_style, dtype=np.int32)  # style id of each cell
+
+        self.frame = frame
+        self.sub_frame = sub_frame
+        self.cur_lbl = None
+
+        self._formattting = {'index': {'style': self.default_style}, 'header': {'style': self.default_style},
+                             'footer': {'style': styles.intern('arial', 10, 'bold', 'float', 2), 'stats': ()}}
 
         self.visible_columns = True
         self.visible_index = True
         self.blank_cell = blank
 
-    def update(self, other, join='left', overwrite=True, filter_func=None, raise_conflict=False):
-        super().update(other, join='left', overwrite=True, filter_func=None, raise_conflict=False)
+        self.page_size = page_size
+        self.page_start = 0
+
+        self.history = EditHistory()
+
+        self._pending = []  # (batch, upsert) pairs waiting for flush_rows
+        self._flush_id = None
+
+        self.view = None
+        self._keys = {}  # column position: sort keys
+        self._orders = {}  # column position: row positions in ascending key order
+        self._stats = {}  # column position: ColumnStats
+
+        self._conditional = {}  # column label: conditional formatting rules
+        self._conditional_ids = {}  # column position: style ids with the rules applied
+        self._shown = None  # (row positions, style ids) of the displayed cells
+
+        self._auto_width = None  # {'candidates', 'pad'} once auto_width is enabled
+        self._widths = {}  # column position or 'index': width of the widest text in pixels
+
+        self.tooltips = None  # {(row label, column label): text}, see ToolTipManager.attach_table
+        self._tooltip_tag = None
+
+        self._sparklines = {}  # column label: icmatplot.SparklineAtlas
+        self._photos = []  # sparkline images of the displayed cells
+
+    def update(self, other, join='left', overwrite=True, filter_func=None, raise_conflict=False):
+        super().update(other, join='left', overwrite=True, filter_func=None, raise_conflict=False)
+
+    def update_data(self, new_data):
+        """
+        Replaces data in table, does not alter index or column labels
+        
+        Parameters
+        ----------
+        new_data : df, dict, list
+                should have same shape as existing df, not including the index and columns            
+        """
+        # TODO add exception for shape of new data not matching existing data frame, or trim/expand to fit
+        if type(new_data) == np.ndarray:
+            new_data = pd.DataFrame(new_data)
+        elif type(new_data) == dict:
+            new_data = pd.DataFrame.from_dict(new_data)
+        elif type(new_data) == pd.DataFrame:
+            pass
+        else:
+            return
+
+        new_data.set_index(self.index.values, inplace=True)
+        new_data.columns = self.columns
+        old_values = []
+        for i, column in enumerate(self.columns):
+            cells = self.iloc[:, i].values
+            old = [cell['data'] for cell in cells]
+            for cell, value in zip(cells, new_data.iloc[:, i].values):
+                cell['data'] = value
+            self._column_changed(column, old=old)
+            old_values.extend(old)
+
+        rows, cols = np.arange(len(self)), np.arange(len(self.columns))
+        self._record_cells(np.tile(rows, len(cols)), np.repeat(cols, len(rows)), old_values,
+                           [value for i in cols for value in new_data.iloc[:, i].values])
+
+    # TODO develop usage
+    def hide_index(self, val=True):
+        """
+        Send true to hide index column, false to show
+        
+        Parameters
+        ----------
+        val : bool
+        """
+        self.visible_index = val
+
+    # TODO develop usage
+    def hide_columns(self, val=True):
+        """
+        Send true to hide column labels, false to show
+                
+        Parameters
+        ----------
+        val : bool
+        """
+        self.visible_columns = val
+
+    def add_label(self, row, col, text, fontstyle='normal'):
+        """
+        Adds label to subframe
+        
+        Parameters
+        ----------
+        row : int
+                row in subframe 
+        col : int
+                col in subframe
+        text : str
+                label text
+        fontstyle : str
+                label fontstyle
+        """
+        lbl = tkinter.Label(self.sub_frame, text=text, font=('arial', 10, fontstyle))
+        lbl.grid(row=row, column=col, sticky='nsew')
+
+        return lbl
+
+    def show(self, priority=0, on_done=None):
+        """
+        Display data table on subframe.  Must be called after table creation to display table.  The labels are built
+        a few rows at a time by the window's RenderScheduler so large tables fill in without blocking input, showing
+        the table again before it is finished cancels the unfinished build.  show returns before the labels are
+        built, read them from on_done, or call render_scheduler(table.frame).finish((str(table.frame), 'show'))
+        first
+        
+        Parameters
+        ----------
+        priority : int, default=0
+            scheduler priority, higher runs first
+        on_done : function, default=None
+            called with no arguments once every label is built
+        """
+        self.sub_frame = clear_subframe(self.frame, self.sub_frame)
+        render_scheduler(self.frame).submit((str(self.frame), 'show'), self._show_steps(self.sub_frame), priority,
+                                            on_done)
+
+    def _show_steps(self, sub_frame):
+        """
+        Builds the labels of `show`, yielding after each row
+        
+        Parameters
+        ----------
+        sub_frame : tkinter.Frame
+            frame the labels are placed in
+        """
+        positions = self._visible_positions()
+
+        if self._auto_width is not None:  # columns sized up front, so the grid is not re-laid out as labels are added
+            for col, width in enumerate(self.column_widths()):
+                sub_frame.grid_columnconfigure(col, minsize=width + self._auto_width['pad'])
+            yield
+
+        # add headers to table
+        col = 0 + self.visible_index
+        if self.visible_columns:
+            for col_label in self:
+                style_id = self._formattting['header']['style']
+                lbl = tkinter.Label(sub_frame, text=styles.text(style_id, col_label), font=styles.font(style_id))
+                lbl.grid(row=0, column=col, sticky='nsew')
+                if self.view is not None:
+                    lbl.bind('<Button-1>', lambda event, c=col_label: self._header_clicked(c))
+                col += 1
+            yield
+
+        # sparklines are redrawn and texts formatted a column at a time up front, labels are then added a row at a time
+        sparklines = {}
+        for label, atlas in self._sparklines.items():
+            j = self.columns.get_loc(label)
+            atlas.draw([cell['data'] for cell in self.iloc[:, j].values])
+            sparklines[j] = atlas
+        self._photos = photos = []
+
+        cells = [self.iloc[:, i].values[positions] for i in range(len(self.columns))]
+        style_ids = self._display_styles(positions)
+        self._shown = (positions, style_ids)
+        texts = [None if i in sparklines else styles.format_values(style_ids[:, i], [cell['data'] for cell in column])
+                 for i, column in enumerate(cells)]
+        index_style = self._formattting['index']['style']
+        for r, item in enumerate(self.index[positions].tolist()):
+            row = r + self.visible_columns
+            col = 0
+            # add index to table
+            if self.visible_index:
+                lbl = tkinter.Label(sub_frame, text=styles.text(index_style, item), font=styles.font(index_style))
+                lbl.grid(row=row, column=col, sticky='nsew')
+                col += 1
+            for i in range(len(self.columns)):
+                cell = cells[i][r]
+                if i in sparklines:
+                    photos.append(ImageTk.PhotoImage(sparklines[i].image(positions[r])))
+                    cell['lbl'] = tkinter.Label(sub_frame, image=photos[-1])
+                else:
+                    cell['lbl'] = tkinter.Label(sub_frame, text=texts[i][r], font=styles.font(style_ids[r, i]),
+                                                **styles.colors(style_ids[r, i]))
+                cell['lbl'].grid(row=row, column=col, sticky='nsew')
+                if self._tooltip_tag is not None:
+                    _add_bindtag(cell['lbl'], self._tooltip_tag)
+                col += 1
+            yield
+
+        # add footer to table
+        footer = self._formattting['footer']
+        row = self.visible_columns + len(positions)
+        for stat in footer['stats']:
+            col = 0
+            if self.visible_index:
+                lbl = tkinter.Label(sub_frame, text=stat.title(), font=styles.font(footer['style']))
+                lbl.grid(row=row, column=col, sticky='nsew')
+                col += 1
+            for text in self._footer_texts(stat):
+                lbl = tkinter.Label(sub_frame, text=text, font=styles.font(footer['style']))
+                lbl.grid(row=row, column=col, sticky='nsew')
+                col += 1
+            row += 1
+            yield
+
+    def _footer_texts(self, stat):
+        """
+        Returns the footer text of each column for a statistic
+        
+        Parameters
+        ----------
+        stat : str
+            'sum', 'mean', 'min', 'max' or 'count'
+        """
+        style_id = self._formattting['footer']['style']
+        texts = []
+        for j in range(len(self.columns)):
+            if self.columns[j] in self._sparklines:
+                texts.append(self.blank_cell)
+                continue
+            stats = self._column_stats(j).stats()
+            if stats['count'] == 0:
+                texts.append(self.blank_cell)
+            elif stat == 'count':
+                texts.append(stats['count'])
+            else:
+                texts.append(styles.text(style_id, stats[stat]))
+
+        return texts
+
+    def formatted_rows(self, chunksize=1000, styled=False):
+        """
+        Yields the table as displayed by `show`, in chunks of rows of text.  The header row comes first, then every
+        row in view order (not only the current page), then the footer rows
+        
+        Parameters
+        ----------
+        chunksize : int, default=1000
+            number of table rows formatted per chunk
+        styled : bool, default=False
+            yield (text, style id) pairs instead of text
+        
+        Returns
+        -------
+        chunks of rows : generator (list of lists)
+        """
+        header_style = self._formattting['header']['style']
+        index_style = self._formattting['index']['style']
+        footer_style = self._formattting['footer']['style']
+
+        def cell(value, style_id):
+            return (str(value), style_id) if styled else str(value)
+
+        chunk = []
+        if self.visible_columns:
+            row = [cell('', header_style)] if self.visible_index else []
+            chunk.append(row + [cell(styles.text(header_style, label), header_style) for label in self.columns])
+
+        positions = self.view.positions() if self.view is not None else np.arange(len(self))
+        for start in range(0, len(positions), chunksize):
+            block = positions[start:start + chunksize]
+            style_ids = [self._style_ids[block, j] for j in range(len(self.columns))]
+            texts = [[_sparkline_text(c['data']) for c in self.iloc[:, j].values[block]]
+                     if self.columns[j] in self._sparklines else
+                     styles.format_values(style_ids[j], [c['data'] for c in self.iloc[:, j].values[block]])
+                     for j in range(len(self.columns))]
+            labels = self.index[block].tolist()
+            for r in range(len(block)):
+                row = [cell(styles.text(index_style, labels[r]), index_style)] if self.visible_index else []
+                chunk.append(row + [cell(texts[j][r], style_ids[j][r]) for j in range(len(self.columns))])
+            yield chunk
+            chunk = []
+
+        for stat in self._formattting['footer']['stats']:
+            row = [cell(stat.title(), footer_style)] if self.visible_index else []
+            chunk.append(row + [cell(text, footer_style) for text in self._footer_texts(stat)])
+        if chunk:
+            yield chunk
+
+    def snapshot(self):
+        """
+        Plain copy of the table as displayed, picklable and independent of tkinter, for `icmatplot.render_table`
+        
+        Returns
+        -------
+        snapshot : dict
+            'rows': rows of text, 'fonts': matching rows of (fontname, fontsize, fontstyle)
+        """
+        rows = []
+        fonts = []
+        for chunk in self.formatted_rows(styled=True):
+            for row in chunk:
+                rows.append([text for text, style_id in row])
+                fonts.append([styles.key(style_id)[:3] for text, style_id in row])
+
+        return {'rows': rows, 'fonts': fonts}
+
+    def render(self, path=None, **kwargs):
+        """
+        Draws the table into an image without creating any tkinter widgets, see `icmatplot.render_table`
+        
+        Parameters
+        ----------
+        path : str, default=None
+            file to save the image to, png, pdf, etc. by extension
+        kwargs : 
+            passed on to icmatplot.render_table
+        
+        Returns
+        -------
+        image : PIL.Image
+        """
+        import icmatplot  # matplotlib is only loaded by the features that draw with it
+
+        return icmatplot.render_table(self.snapshot(), path, **kwargs)
+
+    def export(self, path, fmt=None, chunksize=1000, background=False, progress=None, on_done=None):
+        """
+        Writes the table as displayed (see `formatted_rows`) to a csv, html or xlsx file.  Rows are formatted and
+        written one chunk at a time, so no second full copy of the table is built
+        
+        Parameters
+        ----------
+        path : str
+            file to write
+        fmt : str, default=None
+            'csv', 'html' or 'xlsx', if None taken from the file extension
+        chunksize : int, default=1000
+            number of rows formatted and written at a time
+        background : bool, default=False
+            export on a background thread, progress and on_done are then called from the tkinter event loop (from the
+            thread for a headless table).  The table should not be changed until the export is done
+        progress : function, default=None
+            called as progress(rows_written, total_rows) after each chunk
+        on_done : function, default=None
+            called as on_done(path, error) when the export ends, error is None on success.  Errors in the 
+            foreground are raised after on_done is called
+        
+        Returns
+        -------
+        export thread : threading.Thread, None if not exported in the background
+        """
+        if fmt is None:
+            fmt = os.path.splitext(path)[1].lstrip('.')
+        fmt = fmt.lower()
+        if fmt not in _writers:
+            raise ValueError("Invalid format: '{}'".format(fmt))
+
+        rows = len(self.view.positions()) if self.view is not None else len(self)
+        total = rows + self.visible_columns + len(self._formattting['footer']['stats'])
+
+        def run(call):
+            def counted(written=0):
+                for chunk in self.formatted_rows(chunksize):
+                    yield chunk
+                    written += len(chunk)  # resumed by the writer once the chunk is written
+                    if progress is not None:
+                        call(progress, written, total)
+
+            error = None
+            try:
+                _writers[fmt](path, counted(), header=self.visible_columns)
+            except Exception as e:
+                error = e
+            if on_done is not None:
+                call(on_done, path, error)
+            return error
+
+        def direct(func, *args):
+            func(*args)
+
+        if not background:
+            error = run(direct)
+            if error is not None:
+                raise error
+            return None
+
+        if self.frame is None:  # headless, no event loop so callbacks run on the export thread
+            thread = threading.Thread(target=run, args=(direct, ), daemon=True)
+            thread.start()
+            return thread
+
+        events = queue.Queue()
+        thread = threading.Thread(target=run, args=(lambda func, *args: events.put((func, args)), ), daemon=True)
+
+        def poll():
+            while not events.empty():
+                func, args = events.get_nowait()
+                func(*args)
+            if thread.is_alive() or not events.empty():
+                self.frame.after(50, poll)
+
+        thread.start()
+        self.frame.after(50, poll)
+
+        return thread
+
+    def show_page(self, start):
+        """
+        Display the page of rows starting at the specified row, only used when `page_size` is set
+        
+        Parameters
+        ----------
+        start : int
+            row position of the first row to display (zero based)
+        """
+        self.page_start = max(0, min(start, len(self) - 1))
+        self.show()
+
+    def _visible_positions(self):
+        """
+        Returns the row positions displayed by `show`
+        
+        Returns
+        -------
+        row positions : np.ndarray (int)
+        """
+        if self.view is not None:
+            positions = self.view.positions()
+        else:
+            positions = np.arange(len(self))
+        if self.page_size is not None:
+            positions = positions[self.page_start:self.page_start + self.page_size]
+
+        return positions
+
+    def _append_cells(self, data):
+        """
+        Appends the rows of data to the bottom of the table, existing cells are not re-wrapped
+        
+        Parameters
+        ----------
+        data : df
+            rows to append, columns in the same order as the table
+        """
+        start = len(self)
+        cells = _wrap_cells(data)
+        cells.columns = self.columns
+        self._update_inplace(pd.concat([pd.DataFrame(self), cells]))
+        self._style_ids = np.vstack([self._style_ids,
+                                     np.full(cells.shape, self.default_style, dtype=np.int32)])
+        self._rows_appended(start)
+
+    def set_view(self, view=None):
+        """
+        Display rows in the order of a TableView, clicking a column header then sorts the view by that column
+        
+        Parameters
+        ----------
+        view : TableView, default=None
+            view to display, None to display all rows in table order
+        """
+        self.view = view
+
+    def _header_clicked(self, col):
+        """
+        Sorts the view by col, reversing the order if already sorted by col
+        """
+        ascending = not self.view.ascending if self.view.sort_col == col else True
+        self.view.sort(col, ascending)
+        self.show()
+
+    def _column_keys(self, j):
+        """
+        Returns the cached sort keys of column j
+        
+        Parameters
+        ----------
+        j : int
+            column position
+        
+        Returns
+        -------
+        sort keys : np.ndarray (float or str)
+        """
+        if j not in self._keys:
+            self._keys[j] = _sort_keys([cell['data'] for cell in self.iloc[:, j].values])
+
+        return self._keys[j]
+
+    def _sort_order(self, j):
+        """
+        Returns the cached row positions of column j in ascending order
+        
+        Parameters
+        ----------
+        j : int
+            column position
+        
+        Returns
+        -------
+        row positions : np.ndarray (int)
+        """
+        if j not in self._orders:
+            self._orders[j] = np.argsort(self._column_keys(j), kind='mergesort')
+
+        return self._orders[j]
+
+    def _column_stats(self, j):
+        """
+        Returns the cached ColumnStats of column j
+        
+        Parameters
+        ----------
+        j : int
+            column position
+        """
+        if j not in self._stats:
+            self._stats[j] = ColumnStats([cell['data'] for cell in self.iloc[:, j].values])
+
+        return self._stats[j]
+
+    def _cell_changed(self, index, col, old):
+        """
+        Updates the cached sort keys, order and statistics after the cell at (index, col) changes, without re-sorting
+        or rescanning the column
+        
+        Parameters
+        ----------
+        index : object
+            row label
+        col : object
+            column label
+        old : object
+            previous cell value
+        """
+        pos = self.index.get_loc(index)
+        j = self.columns.get_loc(col)
+        if col in self._sparklines:
+            self._sparklines[col].invalidate([pos])
+        self._conditional_ids.pop(j, None)
+        self._width_changed(j, [pos], [old])
+        if j in self._stats:
+            self._stats[j].replace([old], [self.iat[pos, j]['data']])
+        if j in self._keys:
+            keys = self._keys[j]
+            key = _sort_keys([self.iat[pos, j]['data']])
+            if key.dtype != keys.dtype:  # column changed between numbers and text
+                self._column_changed(col)
+                return
+            keys[pos] = key[0]
+            if j in self._orders:
+                order = self._orders[j]
+                order = order[order != pos]
+                self._orders[j] = np.insert(order, np.searchsorted(keys[order], key[0], side='right'), pos)
+
+        if self.view is not None:
+            self.view.invalidate()
+
+    def _column_changed(self, col, positions=None, old=None):
+        """
+        Drops the cached sort keys and order of col after many of its cells change.  Cached statistics are updated
+        from the changed values when old values are given and less than a quarter of the column changed
+        
+        Parameters
+        ----------
+        col : object
+            column label
+        positions : np.ndarray (int), default=None
+            row positions of the changed cells, None if the whole column changed
+        old : list, default=None
+            previous values of the changed cells
+        """
+        j = self.columns.get_loc(col)
+        if col in self._sparklines:
+            self._sparklines[col].invalidate(positions)
+        self._conditional_ids.pop(j, None)
+        if positions is None or old is None:
+            self._widths.pop(j, None)
+        else:
+            self._width_changed(j, positions, old)
+        if j in self._stats:
+            if old is None or len(old) > len(self) // 4:
+                del self._stats[j]
+            else:
+                cells = self.iloc[:, j].values
+                if positions is not None:
+                    cells = cells[positions]
+                self._stats[j].replace(old, [cell['data'] for cell in cells])
+        self._keys.pop(j, None)
+        self._orders.pop(j, None)
+        if self.view is not None:
+            self.view.invalidate()
+
+    def _rows_appended(self, start):
+        """
+        Merges the rows from position start onwards into the cached sort keys, order and statistics
+        """
+        for atlas in self._sparklines.values():
+            atlas.resize(len(self))
+        self._conditional_ids = {}
+        for j in list(self._widths):
+            self._widths[j] = max(self._widths[j], self._text_width(j, slice(start, None)))
+
+        for j in self._stats:
+            self._stats[j].add([cell['data'] for cell in self.iloc[start:, j].values])
+
+        for j in list(self._keys):
+            keys = self._keys[j]
+            new_keys = _sort_keys([cell['data'] for cell in self.iloc[start:, j].values])
+            if new_keys.dtype != keys.dtype:
+                del self._keys[j]
+                self._orders.pop(j, None)
+                continue
+            self._keys[j] = np.concatenate([keys, new_keys])
+            if j in self._orders:
+                order = self._orders[j]
+                new_order = np.argsort(new_keys, kind='mergesort')
+                at = np.searchsorted(keys[order], new_keys[new_order], side='right')
+                self._orders[j] = np.insert(order, at, new_order + start)
+
+        if self.view is not None:
+            self.view.invalidate()
+
+    def _table_changed(self):
+        """
+        Drops all cached sort keys, orders and statistics after rows or columns are inserted or reordered
+        """
+        self._keys = {}
+        self._orders = {}
+        self._stats = {}
+        self._conditional_ids = {}
+        self._widths = {}
+        for atlas in self._sparklines.values():
+            atlas.resize(len(self))
+            atlas.invalidate()
+        if self.view is not None:
+            self.view.invalidate()
+
+    def insert_row(self, row, value, sort=None):
+        """
+        Inserts a row in the table at specified location
+        
+        Parameters
+        ----------
+        row : int
+            row position to insert (zero based)
+        value : list
+            row values to insert
+        sort : str, default=None
+            sort direction after insertion
+        """
+        self.flush_rows(render=False)  # apply batches already waiting, so the new row is the last one appended
+        batch = self._batch_frame([value], index=[row])
+        pos = _label_positions(self.index, [row])[0]
+        if pos >= 0:  # existing row is replaced
+            steps = [self._cells_delta(np.full(len(self.columns), pos), np.arange(len(self.columns)),
+                                       [cell['data'] for cell in self.iloc[pos, :].values], batch.iloc[0].values)]
+        else:
+            steps = [{'kind': 'insert', 'rows': batch}]
+        steps = [step for step in steps if step is not None]
+        self._pending.append((batch, True))
+        self.flush_rows(render=False, record=False)  # recorded below, with the sort
+
+        if sort is not None:
+            if sort.upper() in ['F', 'FORWARD', 'YES']:
+                ascending = True
+            elif sort.upper() in ['R', 'REVERSE', 'REVERSED', 'BACKWARDS']:
+                ascending = False
+            order = self.index.argsort()
+            if not ascending:
+                order = order[::-1]
+            self._take_rows(order)
+            steps.append({'kind': 'order', 'order': order})
+        if steps:
+            self.history.record({'kind': 'steps', 'steps': steps})
+
+    def _take_rows(self, order):
+        """
+        Reorders the rows of the table and their styles
+        
+        Parameters
+        ----------
+        order : np.ndarray (int)
+            current row position of each row in the new order
+        """
+        self._update_inplace(pd.DataFrame(self).take(order))
+        self._style_ids = self._style_ids[order]
+        self._table_changed()
+
+    def _drop_last_rows(self, count):
+        """
+        Removes the last rows of the table and their styles
+        
+        Parameters
+        ----------
+        count : int
+            number of rows to remove
+        """
+        keep = len(self) - count
+        self._update_inplace(pd.DataFrame(self).iloc[:keep])
+        self._style_ids = self._style_ids[:keep]
+        self._table_changed()
+
+    def append_rows(self, rows, index=None):
+        """
+        Appends a batch of rows to the table.  Batches are buffered and applied together with one concatenation and
+        one call to `show` when the tkinter event loop is next idle, or when `flush_rows` is called
+        
+        Parameters
+        ----------
+        rows : df, list of tuples, or np record array
+            rows to append, a df is matched to the table by column label if it has the same labels, else by position
+        index : list, default=None
+            row labels, if None a df keeps its own index and other rows are numbered on from the largest label,
+            which must be an integer
+        """
+        self._pending.append((self._batch_frame(rows, index), False))
+        self._schedule_flush()
+
+    def upsert_rows(self, rows, index=None):
+        """
+        Updates rows whose label is already in the table and appends the rest, buffered as for `append_rows`.  Where
+        appended rows have given the table a label more than once, the last row with the label is updated
+        
+        Parameters
+        ----------
+        rows : df, list of tuples, or np record array
+            rows to update or append, a df is matched to the table by column label if it has the same labels, 
+            else by position
+        index : list, default=None
+            row labels, if None a df keeps its own index and other rows are numbered on from the largest label,
+            which must be an integer
+        """
+        self._pending.append((self._batch_frame(rows, index), True))
+        self._schedule_flush()
+
+    def flush_rows(self, render=True, record=True):
+        """
+        Applies buffered row batches to the table
+        
+        Parameters
+        ----------
+        render : bool, default=True
+            call `show` once the batches are applied
+        record : bool, default=True
+            record the updated and appended rows in the history, so they can be undone
+        """
+        if self._flush_id is not None:
+            self.frame.after_cancel(self._flush_id)
+            self._flush_id = None
+        if not self._pending:
+            return
+
+        batches, self._pending = self._pending, []
+        batch = pd.concat([rows for rows, upsert in batches])
+        upsert = np.concatenate([np.full(len(rows), upsert) for rows, upsert in batches])
+
+        # upserted rows already in the table are updated in place
+        positions = _label_positions(self.index, batch.index)
+        update = upsert & (positions >= 0)
+        steps = []
+        if update.any():
+            for i, column in enumerate(self.columns):
+                cells = self.iloc[:, i].values[positions[update]]
+                old = [cell['data'] for cell in cells]
+                new = batch.iloc[:, i].values[update]
+                for cell, value in zip(cells, new):
+                    cell['data'] = value
+                self._column_changed(column, positions[update], old)
+                steps.append(self._cells_delta(positions[update], np.full(update.sum(), i), old, new))
+
+        # everything else is appended, keeping the last of any upserted label given more than once
+        append = ~update & ~(upsert & batch.index.duplicated(keep='last'))
+        if append.any():
+            self._append_cells(batch[append])
+            steps.append({'kind': 'insert', 'rows': batch[append]})
+
+        steps = [step for step in steps if step is not None]
+        if record and steps:
+            self.history.record({'kind': 'steps', 'steps': steps})
+
+        if render and self.frame is not None:
+            self.show()
+
+    def _schedule_flush(self):
+        """
+        Flushes buffered batches when the tkinter event loop is next idle
+        """
+        if self.frame is None:
+            self.flush_rows()
+        elif self._flush_id is None:
+            self._flush_id = self.frame.after_idle(self.flush_rows)
+
+    def _batch_frame(self, rows, index=None):
+        """
+        Returns a batch of rows as a df with the table's columns
+        
+        Parameters
+        ----------
+        rows : df, list of tuples, or np record array
+        index : list, default=None
+            row labels, if None rows other than a df are numbered on from the largest label of the table and the
+            batches waiting to be applied, which must then be integers
+        """
+        if type(rows) is pd.DataFrame:
+            if set(rows.columns) == set(self.columns):
+                rows = rows[self.columns]
+            else:
+                rows = rows.copy(deep=False)  # relabelled below, leave the caller's df as it is
+        else:
+            rows = pd.DataFrame.from_records(rows)
+            if index is None:
+                start = self._next_label()
+                index = np.arange(start, start + len(rows))
+        if index is not None:
+            rows.index = index
+        rows.columns = self.columns
+
+        return rows
+
+    def _next_label(self):
+        """
+        Returns the integer label following the largest label of the table and of the batches waiting to be applied,
+        ValueError if the labels are not integers
+        """
+        labels = [labels for labels in [self.index] + [batch.index for batch, upsert in self._pending] if len(labels)]
+        if not all(pd.api.types.is_integer_dtype(labels) for labels in labels):
+            raise ValueError('Row labels are not integers, pass index to number the new rows')
+
+        return max([labels.max() + 1 for labels in labels], default=0)
+
+    def insert(self, loc, column, value, allow_duplicates=False):
+        # TODO may not need, can probably just use the inherited method
+        """
+        Inserts a column in the table at specified location
+        
+        Parameters
+        ----------
+        loc : int 
+            location to insert
+        column : object
+            column name
+        value : int, Series, or array-like
+            values to insert
+        allow_duplicates : bool
+        """
+        super().insert(loc, column, value, allow_duplicates)
+        self._style_ids = np.insert(self._style_ids, loc, self.default_style, axis=1)
+        self.history.clear()  # recorded column positions no longer match
+        self._table_changed()
+        # self.reindex()
+
+    def column_format(self, col, format_='', dec=2, fontname=None, fontsize=None, fontstyle=None):
+        """
+        Formats column in the table
+        
+        Parameters
+        ----------
+        col : str
+            column to be formatted
+        format_ : str
+            format code ('$', 'float', 'int') or format spec, i.e. '$#,##0.00;($#,##0.00)' or '0.0%'
+        dec : int, default=2
+            number of decimal places for 'float' and '$'
+        fontname : str
+            name of font to use
+        fontsize : int
+            font size
+        fontstyle : str
+            font style 
+        """
+        self._restyle((slice(None), self.columns.get_loc(col)), format_, dec, fontname, fontsize, fontstyle)
+
+    def auto_width(self, enable=True, candidates=20, pad=6):
+        """
+        Sizes columns to their widest text, over every row rather than only the displayed page, so columns keep
+        their width when paging or sorting.  Widths come from font metrics rather than from laying out labels: text
+        widths are estimated from their length, only the widest candidates are measured, and measurements are
+        memoized per (style, text).  Cached widths are updated as cells change instead of being recomputed
+        
+        Parameters
+        ----------
+        enable : bool, default=True
+            False to let tkinter size the columns again
+        candidates : int, default=20
+            texts per column measured exactly
+        pad : int, default=6
+            pixels added to each width for the label border and padding
+        """
+        self._auto_width = {'candidates': candidates, 'pad': pad} if enable else None
+        self._widths = {}
+
+    def column_widths(self):
+        """
+        Widths of the widest text of each column in pixels, index column first if visible, requires a tkinter root
+        window
+        
+        Returns
+        -------
+        widths : list (int)
+        """
+        widths = [self._column_width(j) for j in range(len(self.columns))]
+        if self.visible_index:
+            if 'index' not in self._widths:
+                self._widths['index'] = self._text_width('index', slice(None))
+            widths.insert(0, self._widths['index'])
+
+        return widths
+
+    def _column_width(self, j):
+        """
+        Returns the cached width of column j, including its header
+        """
+        if j not in self._widths:
+            width = self._text_width(j, slice(None))
+            if self.visible_columns:
+                header_style = self._formattting['header']['style']
+                width = max(width, styles.measure(header_style, str(styles.text(header_style, self.columns[j]))))
+            self._widths[j] = width
+
+        return self._widths[j]
+
+    def _text_width(self, j, rows):
+        """
+        Returns the width of the widest text of column j, or of the index if j is 'index', in the selected rows
+        
+        Parameters
+        ----------
+        j : int or str
+            column position or 'index'
+        rows : slice or np.ndarray (int)
+            rows to measure
+        """
+        candidates = 20 if self._auto_width is None else self._auto_width['candidates']
+        if isinstance(j, str):
+            style_id = self._formattting['index']['style']
+            labels = self.index[rows].tolist()
+            return _widest(np.full(len(labels), style_id), [styles.text(style_id, label) for label in labels],
+                           candidates)
+        if self.columns[j] in self._sparklines:
+            return self._sparklines[self.columns[j]].width
+
+        style_ids = self._conditional_styles(j)[rows]
+        values = [cell['data'] for cell in self.iloc[:, j].values[rows]]
+
+        return _widest(style_ids, styles.format_values(style_ids, values), candidates)
+
+    def _width_changed(self, j, positions, old):
+        """
+        Updates the cached width of column j after the cells at positions change, widening it if a new text is
+        wider, dropping it if an old text may have been the widest
+        
+        Parameters
+        ----------
+        j : int
+            column position
+        positions : list or np.ndarray (int)
+            row positions of the changed cells
+        old : list
+            previous values of the changed cells
+        """
+        if j not in self._widths or self.columns[j] in self._sparklines:
+            return
+        if self.columns[j] in self._conditional:  # rules may restyle cells that did not change
+            del self._widths[j]
+            return
+
+        positions = np.asarray(positions)
+        new_width = self._text_width(j, positions)
+        if new_width >= self._widths[j]:
+            self._widths[j] = new_width
+            return
+        style_ids = self._style_ids[positions, j]
+        candidates = self._auto_width['candidates'] if self._auto_width is not None else 20
+        if _widest(style_ids, styles.format_values(style_ids, old), candidates) >= self._widths[j]:
+            del self._widths[j]
+
+    def sparkline(self, col, width=60, height=16, color=(31, 119, 180), background=(255, 255, 255)):
+        """
+        Displays a column whose cells hold sequences of numbers as inline trend graphs.  The graphs of all rows are
+        rasterized together into an icmatplot.SparklineAtlas, and only the rows whose cells changed are redrawn
+        when the table is next shown
+        
+        Parameters
+        ----------
+        col : str
+            column to display as sparklines
+        width : int, default=60
+            width of each sparkline in pixels, None to display the column as text again
+        height : int, default=16
+            height of each sparkline in pixels
+        color : tuple, default=(31, 119, 180)
+            RGB line colour
+        background : tuple, default=(255, 255, 255)
+            RGB background colour
+        """
+        if width is None:
+            self._sparklines.pop(col, None)
+            return
+
+        import icmatplot
+
+        atlas = icmatplot.SparklineAtlas(width, height, color, background)
+        atlas.resize(len(self))
+        self._sparklines[col] = atlas
+
+    def threshold_format(self, col, above=None, below=None, foreground=None, background=None, fontstyle=None):
+        """
+        Colours cells of a column above and/or below a value, given both only cells between them are coloured.
+        Conditional rules are evaluated over the whole column at once and the displayed cells are updated in place
+        
+        Parameters
+        ----------
+        col : str
+            column to format
+        above : float, default=None
+            colour cells greater than this value
+        below : float, default=None
+            colour cells less than this value
+        foreground : str, default=None
+            text colour, i.e. '#9c0006'
+        background : str, default=None
+            background colour, i.e. '#ffc7ce'
+        fontstyle : str, default=None
+            font style, i.e. 'bold'
+        """
+        self._add_rule(col, {'kind': 'threshold', 'above': above, 'below': below, 'foreground': foreground,
+                             'background': background, 'fontstyle': fontstyle})
+
+    def color_scale(self, col, colors=('#f8696b', '#ffeb84', '#63be7b'), steps=16):
+        """
+        Colours the background of cells of a column on a gradient from the smallest to the largest value
+        
+        Parameters
+        ----------
+        col : str
+            column to format
+        colors : tuple, default=('#f8696b', '#ffeb84', '#63be7b')
+            '#rrggbb' colours of the gradient, evenly spaced from the smallest to the largest value
+        steps : int, default=16
+            number of distinct colours used
+        """
+        self._add_rule(col, {'kind': 'scale', 'colors': colors, 'steps': steps})
+
+    def top_n_format(self, col, n=10, largest=True, foreground=None, background=None, fontstyle=None):
+        """
+        Colours the largest or smallest cells of a column
+        
+        Parameters
+        ----------
+        col : str
+            column to format
+        n : int, default=10
+            number of cells to colour
+        largest : bool, default=True
+            True for the largest values, False for the smallest
+        foreground : str, default=None
+            text colour
+        background : str, default=None
+            background colour
+        fontstyle : str, default=None
+            font style, i.e. 'bold'
+        """
+        self._add_rule(col, {'kind': 'top_n', 'n': n, 'largest': largest, 'foreground': foreground,
+                             'background': background, 'fontstyle': fontstyle})
+
+    def clear_conditional(self, col=None):
+        """
+        Removes conditional formatting rules
+        
+        Parameters
+        ----------
+        col : str, default=None
+            column to clear, None for all columns
+        """
+        if col is None:
+            self._conditional = {}
+        else:
+            self._conditional.pop(col, None)
+        self._conditional_ids = {}
+        self._widths = {}
+        self._refresh_styles()
+
+    def _add_rule(self, col, rule):
+        """
+        Adds a conditional formatting rule to a column, rules added later take precedence where they overlap
+        """
+        j = self.columns.get_loc(col)  # raises KeyError for an unknown column before the rule is kept
+        self._conditional.setdefault(col, []).append(rule)
+        self._conditional_ids.pop(j, None)
+        self._widths.pop(j, None)  # rules may change the font
+        self._refresh_styles()
+
+    def _conditional_styles(self, j):
+        """
+        Returns the style ids of column j with its conditional formatting rules applied, cached until the column's
+        data or styles change.  Each distinct (style, look) pair is derived once
+        
+        Parameters
+        ----------
+        j : int
+            column position
+        
+        Returns
+        -------
+        style ids : np.ndarray (int)
+        """
+        rules = self._conditional.get(self.columns[j])
+        if not rules:
+            return self._style_ids[:, j]
+        if j not in self._conditional_ids:
+            keys = self._column_keys(j)
+            if keys.dtype.kind != 'f':  # text columns are left as they are
+                keys = np.full(len(self), np.nan)
+            looks = [(None, None, None)]
+            codes = np.zeros(len(self), dtype=np.int64)
+            for rule in rules:
+                for mask, look in _rule_looks(rule, keys):
+                    looks.append(look)
+                    codes[mask] = len(looks) - 1
+
+            pairs, inverse = np.unique(self._style_ids[:, j].astype(np.int64) * len(looks) + codes,
+                                       return_inverse=True)
+            ids = [styles.derive(pair // len(looks), fontstyle=looks[pair % len(looks)][2],
+                                 foreground=looks[pair % len(looks)][0], background=looks[pair % len(looks)][1])
+                   for pair in pairs]
+            self._conditional_ids[j] = np.array(ids, dtype=np.int32)[inverse.ravel()]
+
+        return self._conditional_ids[j]
+
+    def _display_styles(self, positions):
+        """
+        Returns the style ids of the cells in the rows at positions, with conditional formatting applied
+        
+        Returns
+        -------
+        style ids : np.ndarray (int), shape (len(positions), number of columns)
+        """
+        style_ids = self._style_ids[positions]
+        for col in self._conditional:
+            j = self.columns.get_loc(col)
+            style_ids[:, j] = self._conditional_styles(j)[positions]
+
+        return style_ids
+
+    def _refresh_cells(self, positions, j):
+        """
+        Updates the text of the displayed labels of column j in the rows at positions, no other widgets are touched
+        
+        Parameters
+        ----------
+        positions : np.ndarray (int)
+            row positions of the changed cells
+        j : int
+            column position
+        """
+        if self.frame is None or self._shown is None or self.columns[j] in self._sparklines:
+            return
+
+        shown_positions, style_ids = self._shown
+        rows = np.flatnonzero(np.isin(shown_positions, positions))
+        texts = styles.format_values(style_ids[rows, j], [self.iat[shown_positions[r], j]['data'] for r in rows])
+        for r, text in zip(rows, texts):
+            lbl = self.iat[shown_positions[r], j]['lbl']
+            if lbl is not None and lbl.winfo_exists():
+                lbl.configure(text=text)
+
+    def _refresh_styles(self):
+        """
+        Reconfigures the displayed cells whose style changed, no other widgets are touched
+        """
+        if self.frame is None or self._shown is None:
+            return
+
+        positions, shown = self._shown
+        if len(positions) and positions.max() >= len(self):  # rows were removed since the table was shown
+            return
+        style_ids = self._display_styles(positions)
+        for r, i in zip(*np.nonzero(style_ids != shown)):
+            lbl = self.iat[positions[r], i]['lbl']
+            if lbl is None or not lbl.winfo_exists() or self.columns[i] in self._sparklines:
+                continue
+            style_id = style_ids[r, i]
+            options = {'fg': lbl.configure('fg')[3], 'bg': lbl.configure('bg')[3]}  # widget defaults
+            options.update(styles.colors(style_id))
+            lbl.configure(font=styles.font(style_id), **options)
+        shown[:] = style_ids  # in place, so an unfinished `show` builds its remaining labels with the new styles
+
+    def header_format(self, format_='', dec=2, fontname=None, fontsize=None, fontstyle=None):
+        """
+        Formats the header (column titles)
+        
+        Parameters
+        ----------
+        format_ : str 
+            format style ('float', '$', 'int') or format spec, i.e. '#,##0'
+        dec : int, default=2
+            number of decimal places for 'float' and '$'
+        fontname : str
+            name of font to use
+        fontsize : int
+            font size
+        fontstyle : str
+            font style  
+        
+        """
+        header = self._formattting['header']
+        self._record_format('header')
+        header['style'] = styles.derive(header['style'], fontname, fontsize, fontstyle, format_ or None,
+                                        dec if format_ else None)
+        self._widths = {}
+
+    def index_format(self, fontname=None, fontsize=None, fontstyle=None):
+        """
+        Formats the index column
+        
+        Parameters
+        ----------
+        fontname : str
+            name of font to use
+        fontsize : int
+            font size
+        fontstyle : str
+            font style  
+        """
+        index = self._formattting['index']
+        self._record_format('index')
+        index['style'] = styles.derive(index['style'], fontname, fontsize, fontstyle)
+        self._widths.pop('index', None)
+
+    def row_format(self, row, format_='', dec=2, fontname=None, fontsize=None, fontstyle=None):
+        """
+        Formats row in the table
+        
+        Parameters
+        ----------
+        row : int
+            row to be formatted
+        format_ : str
+            format code ('$', 'float', 'int') or format spec, i.e. '$#,##0.00;($#,##0.00)' or '0.0%'
+        dec : int, default=2
+            number of decimal places for 'float' and '$'
+        fontname : str
+            name of font to use
+        fontsize : int
+            font size
+        fontstyle : str
+            font style 
+        """
+        self._restyle((self.index.get_loc(row), slice(None)), format_, dec, fontname, fontsize, fontstyle)
+
+    def footer(self, stats=('sum', 'mean', 'min', 'max', 'count'), format_='float', dec=2, fontname=None,
+               fontsize=None, fontstyle=None):
+        """
+        Adds summary rows below the table.  Statistics are cached per column and updated as cells change, so
+        refreshing the footer never rescans the columns
+        
+        Parameters
+        ----------
+        stats : tuple (str)
+            rows to show, any of 'sum', 'mean', 'min', 'max', 'count', empty to remove the footer
+        format_ : str
+            format code for sum, mean, min and max ('$', 'float', 'int') or format spec, i.e. '#,##0.00'
+        dec : int, default=2
+            number of decimal places for 'float' and '$'
+        fontname : str
+            name of font to use
+        fontsize : int
+            font size
+        fontstyle : str
+            font style
+        """
+        footer = self._formattting['footer']
+        self._record_format('footer')
+        footer['style'] = styles.derive(footer['style'], fontname, fontsize, fontstyle, format_, dec)
+        footer['stats'] = tuple(stats) if stats else ()
+
+    def _restyle(self, cells, format_='', dec=2, fontname=None, fontsize=None, fontstyle=None):
+        """
+        Replaces fields of the style of the selected cells, one lookup per distinct style and one array assignment
+        
+        Parameters
+        ----------
+        cells : tuple
+            (rows, columns) positions or slices selecting cells in `_style_ids`
+        format_ : str
+            format code ('$', 'float', 'int') or format spec, '' keeps the current format and decimals
+        dec : int, default=2
+            number of decimal places for 'float' and '$'
+        fontname : str
+            name of font to use
+        fontsize : int
+            font size
+        fontstyle : str
+            font style 
+        """
+        cells = tuple(np.arange(*c.indices(size)) if isinstance(c, slice) else c
+                      for c, size in zip(cells, self._style_ids.shape))  # positions stay valid as rows are added
+        style_ids = self._style_ids[cells].copy()
+        unique_ids, inverse = np.unique(style_ids, return_inverse=True)
+        new_ids = np.array([styles.derive(style_id, fontname, fontsize, fontstyle, format_ or None,
+                                          dec if format_ else None) for style_id in unique_ids], dtype=np.int32)
+        self._style_ids[cells] = new_ids[inverse].reshape(style_ids.shape)
+        self._conditional_ids = {}
+        self._widths = {}
+        self.history.record({'kind': 'style', 'cells': cells, 'old': style_ids, 'new': self._style_ids[cells]})
+
+    def _record_format(self, key):
+        """
+        Records the header, index or footer formatting before it is changed
+        """
+        self.history.record({'kind': 'format', 'key': key, 'old': dict(self._formattting[key])})
+
+    def _cells_delta(self, rows, cols, old, new):
+        """
+        Returns a cell edit for the history, holding only the cells whose value changed
+        
+        Parameters
+        ----------
+        rows : np.ndarray (int)
+            row position of each cell
+        cols : np.ndarray (int)
+            column position of each cell
+        old : list or array like
+            previous values
+        new : list or array like
+            new values
+        
+        Returns
+        -------
+        edit : dict, None if no value changed
+        """
+        old, new = _object_array(old), _object_array(new)
+        changed = _changed(old, new)
+        if not changed.any():
+            return None
+
+        return {'kind': 'data', 'rows': np.asarray(rows, dtype=np.int32)[changed],
+                'cols': np.asarray(cols, dtype=np.int32)[changed], 'old': _compact(old[changed]),
+                'new': _compact(new[changed])}
+
+    def _record_cells(self, rows, cols, old, new):
+        """
+        Records a cell edit in the history, see `_cells_delta`
+        """
+        delta = self._cells_delta(rows, cols, old, new)
+        if delta is not None:
+            self.history.record(delta)
+
+    def undo(self):
+        """
+        Undo the last edit or format change, call `show` to display the change
+        
+        Returns
+        -------
+        True if there was an edit to undo : bool
+        """
+        delta = self.history.undo()
+        if delta is None:
+            return False
+        self._apply_delta(delta, 'old')
+
+        return True
+
+    def redo(self):
+        """
+        Redo the last undone edit or format change, call `show` to display the change
+        
+        Returns
+        -------
+        True if there was an edit to redo : bool
+        """
+        delta = self.history.redo()
+        if delta is None:
+            return False
+        self._apply_delta(delta, 'new')
+
+        return True
+
+    def _apply_delta(self, delta, side):
+        """
+        Applies one side of a recorded edit
+        
+        Parameters
+        ----------
+        delta : dict
+            edit from the history
+        side : str
+            'old' to undo, 'new' to redo
+        """
+        kind = delta['kind']
+        if kind == 'data':
+            self._apply_cells(delta['rows'], delta['cols'], delta[side])
+        elif kind == 'style':
+            self._style_ids[delta['cells']] = delta[side]
+            self._conditional_ids = {}
+            self._widths = {}
+        elif kind == 'format':
+            if side == 'old':
+                delta['new'] = dict(self._formattting[delta['key']])  # formatting to restore on redo
+            self._formattting[delta['key']] = dict(delta[side])
+            self._widths = {}
+        elif kind == 'insert':
+            if side == 'old':
+                self._drop_last_rows(len(delta['rows']))
+            else:
+                self._append_cells(delta['rows'])
+        elif kind == 'order':
+            self._take_rows(delta['order'] if side == 'new' else np.argsort(delta['order']))
+        elif kind == 'steps':
+            for step in (delta['steps'] if side == 'new' else reversed(delta['steps'])):
+                self._apply_delta(step, side)
+
+    def _apply_cells(self, rows, cols, values):
+        """
+        Sets cell values by position, updating cached sort keys and statistics one column at a time
+        """
+        for j in np.unique(cols):
+            mask = cols == j
+            cells = self.iloc[:, j].values[rows[mask]]
+            old = [cell['data'] for cell in cells]
+            for cell, value in zip(cells, values[mask]):
+                cell['data'] = value
+            self._column_changed(self.columns[j], rows[mask], old)
+
+    def column_stats(self, col):
+        """
+        Summary statistics of the numerical values in a column
+        
+        Parameters
+        ----------
+        col : str
+            column label
+        
+        Returns
+        -------
+        statistics : dict ('sum', 'mean', 'min', 'max', 'count')
+        """
+        return self._column_stats(self.columns.get_loc(col)).stats()
+
+    def _fit(self, data, length):
+        """
+        Returns data as a list truncated, or padded with `blank_cell`, to length
+        """
+        data = list(data)[:length]
+
+        return data + [self.blank_cell] * (length - len(data))
+
+    def i_column(self, col, data):
+        """
+        Replaces specified column (index) with provided data
+        
+        Usage notes:
+            t3['Average'] = [12, 12, 12, 12, 12, 12] is equivalent to
+            t3.column('Average', [13, 13, 13, 13, 13, 13]), with exception as listed under data:
+        
+        Parameters
+        ----------
+        col : int
+            column index
+        data : list, series, array like
+            data to replace in column, must be same length as number of rows, if data is longer then end of
+            list will be truncated, if shorter blank items will be appended to end 
+        """
+        cells = self.iloc[:, col].values
+        old = [cell['data'] for cell in cells]
+        data = self._fit(data, len(self))
+        for cell, value in zip(cells, data):
+            cell['data'] = value
+        self._column_changed(self.columns[col], old=old)
+        self._record_cells(np.arange(len(self)), np.full(len(self), col), old, data)
+
+    def column(self, col, data):
+        """
+        Replaces specified column (label) with provided data
+        
+        Usage notes:
+            t3['Average'] = [12, 12, 12, 12, 12, 12] is equivalent to
+            t3.column('Average', [13, 13, 13, 13, 13, 13]), with exception as listed under data:
+        
+        Parameters
+        ----------
+        col : str
+            column label
+        data : list, series, array like
+            data to replace in column, must be same length as number of rows, if data is longer then end of
+            list will be truncated, if shorter blank items will be appended to end 
+        """
+        self.i_column(self.columns.get_loc(col), data)
+
+    def i_row(self, row, data):
+        """
+        Replaces specified row (index) with provided data
+        
+        Parameters
+        ----------
+        row : int
+            row index
+        data : (list, series, or array like) 
+            data to replace in row, must be same length as number of columns, if data is longer then end of
+            list will be truncated, if shorter blank items will be appended to end 
+        """
+        data = self._fit(data, len(self.columns))
+
+    def row(self, row, data):
+        """
+        Replaces specified row (label) with provided data
+        
+        Parameters
+        ----------
+        row : int
+            row index
+        data : (list, series, or array like) 
+            data to replace in row, must be same length as number of columns, if data is longer then end of
+            list will be truncated, if shorter blank items will be appended to end 
+        """
+        data = self._fit(data, len(self.columns))
+        old_values = []
+        for c, cell, value in zip(self.columns, self.loc[row].values, data):
+            old = cell['data']
+            cell['data'] = value
+            self._cell_changed(row, c, old)
+            old_values.append(old)
+        self._record_cells(np.full(len(self.columns), self.index.get_loc(row)), np.arange(len(self.columns)),
+                           old_values, data)
+
+    def row_rename(self):
+        """
+        Rename row index  --*UNDER CONSTRUCTION*--
+         
+        """
+        # TODO develop method
+        pass
+
+    def column_rename(self):
+        """
+        Rename column  --*UNDER CONSTRUCTION*--
+ 
+        """
+        # TODO develop method
+        pass
+
+
+class ColumnStats(object):
+    """
+    Sum, mean, min, max and count of the numerical values in a column.  Sum and count are updated in O(1) as values
+    change and a sorted list of the values keeps min and max current, so the column is only scanned once.  The
+    running sum is recomputed exactly from the sorted values once the updates since the last recompute reach the
+    number of values, so rounding errors do not build up
+    
+    **METHODS:**
+    
+    **add** : Add values
+    
+    **remove** : Remove values
+    
+    **replace** : Replace values
+    
+    **stats** : Current statistics
+    
+    Parameters
+    ----------
+    values : list or array like
+        column values, values that are not numbers are ignored
+    """
+    def __init__(self, values):
+        numbers = _numbers(values)
+        numbers = numbers[~np.isnan(numbers)]
+        self._sorted = np.sort(numbers).tolist()
+        self.sum = math.fsum(self._sorted)
+        self.count = len(numbers)
+        self._updates = 0  # values added or removed since the sum was last recomputed
+
+    def add(self, values):
+        """
+        Add values
+        
+        Parameters
+        ----------
+        values : list or array like
+        """
+        numbers = _numbers(values)
+        numbers = numbers[~np.isnan(numbers)]
+        self.sum += numbers.sum()
+        self.count += len(numbers)
+        if len(numbers) <= 32:  # single cell edits stay O(log n) to find, no resort of the column
+            for number in numbers.tolist():
+                bisect.insort(self._sorted, number)
+        else:
+            self._sorted.extend(np.sort(numbers).tolist())
+            self._sorted.sort()  # merges the two sorted runs in linear time
+        self._updated(len(numbers))
+
+    def remove(self, values):
+        """
+        Remove values
+        
+        Parameters
+        ----------
+        values : list or array like
+        """
+        numbers = _numbers(values)
+        removed = 0
+        for number in numbers[~np.isnan(numbers)].tolist():
+            at = bisect.bisect_left(self._sorted, number)
+            if at == len(self._sorted) or self._sorted[at] != number:  # not a value of the column
+                continue
+            del self._sorted[at]
+            self.sum -= number
+            self.count -= 1
+            removed += 1
+        self._updated(removed)
 
-    def update_data(self, new_data):
+    def _updated(self, changes):
         """
-        Replaces data in table, does not alter index or column labels
+        Recomputes the sum from the sorted values once enough values have been added or removed
+        """
+        self._updates += changes
+        if self._updates >= max(self.count, 64):
+            self.sum = math.fsum(self._sorted)
+            self._updates = 0
+
+    def replace(self, old, new):
+        """
+        Replace values
         
         Parameters
         ----------
-        new_data : df, dict, list
-                should have same shape as existing df, not including the index and columns            
+        old : list or array like
+            values to remove
+        new : list or array like
+            values to add
         """
-        # TODO add exception for shape of new data not matching existing data frame, or trim/expand to fit
-        if type(new_data) == np.ndarray:
-            new_data = pd.DataFrame(new_data)
-        elif type(new_data) == dict:
-            new_data = pd.DataFrame.from_dict(new_data)
-        elif type(new_data) == pd.DataFrame:
-            pass
+        self.remove(old)
+        self.add(new)
+
+    def stats(self):
+        """
+        Current statistics
+        
+        Returns
+        -------
+        statistics : dict ('sum', 'mean', 'min', 'max', 'count')
+        """
+        if self.count == 0:
+            return {'sum': 0.0, 'mean': np.nan, 'min': np.nan, 'max': np.nan, 'count': 0}
+
+        return {'sum': self.sum, 'mean': self.sum / self.count, 'min': self._sorted[0], 'max': self._sorted[-1],
+                'count': self.count}
+
+
+def _object_array(values):
+    """returns values as a 1d object array, values that are sequences themselves are kept as single elements
+
+        :param values:list or array like: values to store
+    """
+    array = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        array[i] = value
+
+    return array
+
+
+def _same(a, b):
+    """returns True if two cell values are equal, NaN equal to NaN"""
+    try:
+        return bool(a == b) or bool(pd.isnull(a) and pd.isnull(b))
+    except (TypeError, ValueError):  # sequences, i.e. sparkline cells
+        return np.array_equal(np.asarray(a, dtype=object), np.asarray(b, dtype=object))
+
+
+def _changed(old, new):
+    """returns bool array, True where old and new values differ
+
+        :param old:np.ndarray (object): previous values
+        :param new:np.ndarray (object): new values
+    """
+    try:
+        changed = np.asarray(old != new, dtype=bool)
+        if changed.shape != old.shape:
+            raise ValueError('values compared element wise')
+    except (TypeError, ValueError):  # array cells can not be compared in one pass
+        return np.array([not _same(a, b) for a, b in zip(old, new)], dtype=bool)
+
+    return changed & ~(pd.isnull(old) & pd.isnull(new))  # NaN never equals itself
+
+
+def _compact(values):
+    """returns values as a typed array if they are all numbers, else an object array
+
+        :param values:list or array like: values to store
+    """
+    try:
+        array = np.asarray(values.tolist() if isinstance(values, np.ndarray) else values)
+    except ValueError:  # ragged sequences
+        return _object_array(values)
+    if array.dtype.kind not in 'biuf' or array.ndim != 1:
+        array = _object_array(values)
+
+    return array
+
+
+class EditHistory(object):
+    """
+    Undo/redo stack of TableFrame edits.  Cell edits are stored as deltas (row and column positions with the old and
+    new values in typed arrays) and formatting as the old and new style ids, never as copies of the table.  Cell
+    edits made within `coalesce` seconds of each other are merged into one step, and the oldest steps are dropped 
+    once the stack holds more than `max_bytes`.
+    
+    **METHODS:**
+    
+    **record** : Push an edit, clearing the redo stack
+    
+    **undo** : Pop the edit to undo
+    
+    **redo** : Pop the edit to redo
+    
+    **clear** : Drop all edits
+    
+    Parameters
+    ----------
+    max_bytes : int, default=16MB
+        memory cap of the stored deltas, values held in object arrays (text, mixed columns) are counted by their
+        estimated size, so the cap is approximate
+    coalesce : float, default=0.5
+        seconds within which consecutive cell edits are merged, 0 to never merge
+    """
+    def __init__(self, max_bytes=2 ** 24, coalesce=0.5):
+        self.max_bytes = max_bytes
+        self.coalesce = coalesce
+        self.nbytes = 0
+        self._undo = collections.deque()
+        self._redo = []
+
+    @staticmethod
+    def _size(delta):
+        """Bytes held by the arrays of a delta"""
+        if delta['kind'] == 'steps':
+            return sum(EditHistory._size(step) for step in delta['steps'])
+
+        values = [value for value in delta.values() if not isinstance(value, tuple)]
+        values += [value for selection in delta.values() if isinstance(selection, tuple) for value in selection]
+
+        return sum(EditHistory._nbytes(value) if isinstance(value, np.ndarray) else
+                   int(value.memory_usage(deep=True).sum())
+                   for value in values if isinstance(value, (np.ndarray, pd.DataFrame)))
+
+    @staticmethod
+    def _nbytes(array):
+        """Bytes held by an array, for object arrays its pointers and an estimate of the objects they point to"""
+        if array.dtype != object:
+            return array.nbytes
+
+        return array.nbytes + sum(sys.getsizeof(value) for value in array.ravel().tolist())
+
+    def record(self, delta):
+        """
+        Push an edit, clearing the redo stack
+        
+        Parameters
+        ----------
+        delta : dict
+            'kind' of edit and the data needed to undo and redo it
+        """
+        delta['time'] = time.time()
+        self._redo = []
+        last = self._undo[-1] if self._undo else None
+        if delta['kind'] == 'data' and last is not None and last['kind'] == 'data' and \
+                delta['time'] - last['time'] < self.coalesce:
+            self._undo.pop()
+            self.nbytes -= self._size(last)
+            delta = self._merge(last, delta)
+
+        self._undo.append(delta)
+        self.nbytes += self._size(delta)
+        while self.nbytes > self.max_bytes and len(self._undo) > 1:
+            self.nbytes -= self._size(self._undo.popleft())
+
+    @staticmethod
+    def _merge(first, second):
+        """Merges two cell edits, keeping the first old value and the last new value of each cell"""
+        rows = np.concatenate([first['rows'], second['rows']])
+        cols = np.concatenate([first['cols'], second['cols']])
+        old = np.concatenate([first['old'], second['old']])
+        new = np.concatenate([first['new'], second['new']])
+
+        keys = rows.astype(np.int64) * (cols.max() + 1) + cols
+        keys_first, first_at = np.unique(keys, return_index=True)
+        keys_last, last_at = np.unique(keys[::-1], return_index=True)
+        last_at = len(keys) - 1 - last_at
+
+        return {'kind': 'data', 'rows': rows[first_at], 'cols': cols[first_at], 'old': old[first_at],
+                'new': new[last_at], 'time': second['time']}
+
+    def undo(self):
+        """
+        Pop the edit to undo
+        
+        Returns
+        -------
+        edit : dict, None if there is nothing to undo
+        """
+        if not self._undo:
+            return None
+        delta = self._undo.pop()
+        self.nbytes -= self._size(delta)
+        self._redo.append(delta)
+
+        return delta
+
+    def redo(self):
+        """
+        Pop the edit to redo
+        
+        Returns
+        -------
+        edit : dict, None if there is nothing to redo
+        """
+        if not self._redo:
+            return None
+        delta = self._redo.pop()
+        delta['time'] = 0  # a redone edit is never merged with the next one
+        self._undo.append(delta)
+        self.nbytes += self._size(delta)
+
+        return delta
+
+    def clear(self):
+        """Drop all edits"""
+        self._undo.clear()
+        self._redo = []
+        self.nbytes = 0
+
+
+class TableView(object):
+    """
+    Sorted and filtered view of a TableFrame.  Holds only an array of row positions, so sorting or filtering never
+    copies or rebuilds the table data.  Sort keys are cached per column by the table and kept up to date as cells
+    change, re-sorting by a column already sorted once is a lookup.
+    
+    **METHODS:**
+    
+    **sort** : Sort the view by a column
+    
+    **filter** : Add a filter on a column
+    
+    **clear_filter** : Remove all filters
+    
+    **positions** : Row positions of the view, in display order
+    
+    **invalidate** : Drop the cached positions, called by the table when data changes
+    
+    Parameters
+    ----------
+    table : TableFrame
+        table to view
+    
+    **=EXAMPLES===============================================================**
+        view = ictkinter.TableView(table)
+        view.sort('Average', ascending=False)
+        view.filter('Count', lambda count: count > 10)
+        table.set_view(view)
+        table.show()
+    """
+    def __init__(self, table):
+        self.table = table
+        self.sort_col = None
+        self.ascending = True
+        self.filters = []  # (column label, predicate) pairs
+        self._positions = None
+
+    def sort(self, col, ascending=True):
+        """
+        Sort the view by a column
+        
+        Parameters
+        ----------
+        col : str
+            column label, None for table order
+        ascending : bool
+        """
+        self.sort_col = col
+        self.ascending = ascending
+        self.invalidate()
+
+    def filter(self, col, predicate):
+        """
+        Add a filter on a column, rows are shown only if they pass every filter
+        
+        Parameters
+        ----------
+        col : str
+            column label
+        predicate : function
+            called with the column values as an array (float if the column is numerical, else str), returns an
+            array of bool with True for rows to show
+        """
+        self.filters.append((col, predicate))
+        self.invalidate()
+
+    def clear_filter(self):
+        """Remove all filters"""
+        self.filters = []
+        self.invalidate()
+
+    def invalidate(self):
+        """Drop the cached positions, they are rebuilt on the next call to `positions`"""
+        self._positions = None
+
+    def positions(self):
+        """
+        Row positions of the view, in display order
+        
+        Returns
+        -------
+        row positions : np.ndarray (int)
+        """
+        if self._positions is None:
+            if self.sort_col is None:
+                positions = np.arange(len(self.table))
+            else:
+                positions = self.table._sort_order(self.table.columns.get_loc(self.sort_col))
+                if not self.ascending:
+                    positions = positions[::-1]
+
+            if self.filters:
+                mask = np.ones(len(self.table), dtype=bool)
+                for col, predicate in self.filters:
+                    mask &= np.asarray(predicate(self.table._column_keys(self.table.columns.get_loc(col))),
+                                       dtype=bool)
+                positions = positions[mask[positions]]
+
+            self._positions = positions
+
+        return self._positions
+
+
+class _SharedCell(object):
+    """
+    Table cell of a SharedDataset table, read and written as cell['data'] and cell['lbl'] like the dict cells of
+    other tables.  The value is read from the dataset's column array at the cell's row position until the table
+    writes a value of its own, so the values are held once by the dataset rather than boxed again by every table
+    """
+    __slots__ = ('column', 'position', 'value', 'lbl')
+
+    _unset = object()  # value of cells that read the dataset
+
+    def __init__(self, column, position):
+        self.column = column  # (dataset, column label), one tuple shared by the cells of a column
+        self.position = position
+        self.value = self._unset
+        self.lbl = None
+
+    def __getitem__(self, key):
+        if key == 'lbl':
+            return self.lbl
+        if key != 'data':
+            raise KeyError(key)
+        if self.value is self._unset:
+            dataset, col = self.column
+            return dataset._arrays[col][self.position]
+
+        return self.value
+
+    def __setitem__(self, key, value):
+        if key == 'lbl':
+            self.lbl = value
+        elif key == 'data':
+            self.value = value
         else:
-            return
+            raise KeyError(key)
 
-        new_data.set_index(self.index.values, inplace=True)
-        new_data.columns = self.columns
-        for column in self.columns:
-            self[column] = new_data[column]
 
-    # TODO develop usage
-    def hide_index(self, val=True):
+class SharedDataset(object):
+    """
+    One copy of a dataset shared by several TableFrames, each with its own formatting and choice of columns.  The
+    column arrays are taken from the source df without copying and only copied the first time they are written, so
+    the source is never changed.  Writes and appended rows go through the dataset, which sends them to every
+    attached table: the table's cells, cached sort keys and statistics are updated incrementally and only its
+    displayed labels of the changed cells are touched.
+    
+    The cells of tables created by `table` hold a row position rather than a value and read the value from the
+    dataset's arrays, so the values are stored once however many tables show them.  Each table still has one small
+    cell object per cell, as every cell keeps its own label, and its own sort keys and statistics.  Edits made
+    directly on a table are kept by the table's cells and not sent back to the dataset.  Tables attached with
+    `attach` keep the cells they were created with.  Changes sent by the dataset clear the undo history of the
+    tables they reach, as the edits recorded before them no longer hold.
+    
+    **METHODS:**
+    
+    **table** : Creates a TableFrame attached to the dataset
+    
+    **attach** : Attach an existing TableFrame
+    
+    **detach** : Stop sending changes to a table
+    
+    **frame** : df of the dataset, sharing its column arrays
+    
+    **column** : Read only array of a column
+    
+    **set_values** : Write values to a column and send them to the attached tables
+    
+    **append_rows** : Append rows and send them to the attached tables
+    
+    Parameters
+    ----------
+    data : df, dict, or np.ndarray
+        source data
+    
+    **=EXAMPLES===============================================================**
+        prices = ictkinter.SharedDataset(prices_df)
+        summary = prices.table(window1, columns=['Ticker', 'Close'])
+        detail = prices.table(window2)
+        detail.column_format('Close', format_='$')
+        prices.set_values('Close', [0, 5], [101.25, 99.5])  # both tables update
+    """
+    def __init__(self, data):
+        if type(data) is not pd.DataFrame:
+            data = pd.DataFrame(data)
+        self.index = data.index
+        self.columns = list(data.columns)
+        self._arrays = {col: data[col].to_numpy() for col in self.columns}  # shared with data until written
+        self._positions = list(range(len(self.index)))  # row positions, one int object shared by every table's cells
+        self._owned = set()  # columns copied since, safe to write in place
+        self.tables = []  # (table, columns shown by the table)
+
+    def frame(self, columns=None):
         """
-        Send true to hide index column, false to show
+        df of the dataset, sharing its column arrays
         
         Parameters
         ----------
-        val : bool
+        columns : list, default=None
+            columns to include, None for all
+        
+        Returns
+        -------
+        dataset : df
         """
-        self.visible_index = val
+        columns = self.columns if columns is None else list(columns)
 
-    # TODO develop usage
-    def hide_columns(self, val=True):
+        return pd.DataFrame({col: self._arrays[col] for col in columns}, index=self.index, columns=columns,
+                            copy=False)
+
+    def table(self, window, columns=None, **kwargs):
         """
-        Send true to hide column labels, false to show
-                
+        Creates a TableFrame attached to the dataset
+        
         Parameters
         ----------
-        val : bool
+        window : tkinter.Frame
+            container for TableFrame, None for a headless table
+        columns : list, default=None
+            columns shown by the table, None for all
+        kwargs :
+            passed on to TableFrame (row, column, page_size, ...)
+        
+        Returns
+        -------
+        table : TableFrame
         """
-        self.visible_columns = val
+        self._check_columns(self.columns if columns is None else columns)
+        table = TableFrame(window, data=self._cells(columns, 0), **kwargs)
+        self.attach(table, columns)
 
-    def add_label(self, row, col, text, fontstyle='normal'):
+        return table
+
+    def attach(self, table, columns=None):
         """
-        Adds label to subframe
+        Attach an existing TableFrame, its rows are matched to the dataset by index label
         
         Parameters
         ----------
-        row : int
-                row in subframe 
-        col : int
-                col in subframe
-        text : str
-                label text
-        fontstyle : str
-                label fontstyle
+        table : TableFrame
+        columns : list, default=None
+            dataset columns the table shows, by the same labels, None for all
         """
-        lbl = tkinter.Label(self.sub_frame, text=text, font=('arial', 10, fontstyle))
-        lbl.grid(row=row, column=col, sticky='nsew')
+        columns = self.columns if columns is None else list(columns)
+        self._check_columns(columns)
+        missing = [col for col in columns if col not in table.columns]
+        if missing:
+            raise KeyError('Columns not in table: {}'.format(missing))
+        self.tables.append((table, columns))
 
-        return lbl
+    def detach(self, table):
+        """Stop sending changes to a table"""
+        self.tables = [(t, columns) for t, columns in self.tables if t is not table]
 
-    def show(self):
+    def column(self, col):
         """
-        Display data table on subframe.  Must be called after table creation to display table
+        Read only array of a column, not copied
+        
+        Returns
+        -------
+        values : np.ndarray
         """
-        self.sub_frame = clear_subframe(self.frame, self.sub_frame)
+        values = self._arrays[col].view()
+        values.flags.writeable = False
 
-        col = 0
-        row = 1
-        # add index to table
-        if self.visible_index:
-            for item in list(self.index.tolist()):
-                lbl = tkinter.Label(self.sub_frame, text=item, font=self._formattting['index']['font'])
-                lbl.grid(row=row, column=col, sticky='nsew')
-                row += 1
-            col += 1
+        return values
 
-        # add headers to table
-        header_labels = list(self)
-        row = 0
-        if self.visible_columns:
-            for col_label in header_labels:
-                lbl = tkinter.Label(self.sub_frame, text=col_label, font=self._formattting['header']['font'])
-                lbl.grid(row=row, column=col, sticky='nsew')
-                col += 1
+    def _cells(self, columns=None, start=0):
+        """
+        Returns a df of _SharedCell reading the rows of the dataset from position start, for TableFrame
+        """
+        columns = self.columns if columns is None else list(columns)
+        positions = self._positions[start:]
+        cells = np.empty((len(positions), len(columns)), dtype=object)
+        for j, col in enumerate(columns):
+            column = (self, col)
+            cells[:, j] = [_SharedCell(column, position) for position in positions]
+        cells = pd.DataFrame(cells, index=self.index[start:], columns=columns)
+        cells.attrs['cells'] = True
 
-        col = 0 + self.visible_index
-        for col_label in self.columns:
-            row = 0 + self.visible_columns
-            for index in self.index.values:
-                self[col_label][index]['lbl'] = tkinter.Label(self.sub_frame,
-                                                              text=self[col_label][index]['data'],
-                                                              font=self[col_label][index]['font'])\
-                    .grid(row=row, column=col, sticky='nsew')
-                row += 1
-            col += 1
-
-        self.frame.update()
-        # print(self)
+        return cells
 
-    def insert_row(self, row, value, sort=None):
+    def _check_columns(self, columns):
         """
-        Inserts a row in the table at specified location
+        Raises KeyError naming the columns that are not in the dataset
+        """
+        missing = [col for col in columns if col not in self._arrays]
+        if missing:
+            raise KeyError('Columns not in dataset: {}'.format(missing))
+
+    def _writable(self, col, values):
+        """
+        Returns the array of col, copied if still shared with the source, or promoted to the dtype numpy gives both
+        the column and values if it cannot hold values.  TypeError if values cannot share a typed column, e.g. text
+        written to a numerical column
+        """
+        array = self._arrays[col]
+        try:
+            dtype = np.result_type(array.dtype, values.dtype)
+        except TypeError:
+            dtype = None
+        if dtype is None or (dtype.kind in 'USV' and array.dtype.kind not in 'USV'):
+            raise TypeError("Cannot write {} values to column '{}' of dtype {}".format(values.dtype, col, array.dtype))
+        if dtype != array.dtype:
+            array = array.astype(dtype)
+        elif col not in self._owned:
+            array = array.copy()
+        self._arrays[col] = array
+        self._owned.add(col)
+
+        return array
+
+    def set_values(self, col, positions, values):
+        """
+        Write values to a column and send them to the attached tables showing the column
         
         Parameters
         ----------
-        row : int
-            row position to insert (zero based)
-        value : list
-            row values to insert
-        sort : str, default=None
-            sort direction after insertion
+        col : str
+            column label
+        positions : list or np.ndarray (int)
+            row positions in the dataset
+        values : list or np.ndarray
+            new values, one per position
         """
-        self.loc[row] = value
-        if sort is not None:
-            if sort.upper() in ['F', 'FORWARD', 'YES']:
-                ascending = True
-            elif sort.upper() in ['R', 'REVERSE', 'REVERSED', 'BACKWARDS']:
-                ascending = False
-            self.sort_index(inplace=True, ascending=ascending)
+        self._check_columns([col])
+        positions = np.asarray(positions, dtype=np.int64)
+        values = np.asarray(values)
+
+        # old values are read before the array is written, as shared cells read their value from it
+        labels = self.index[positions]
+        changes = []
+        for table, columns in self.tables:
+            if col not in columns:
+                continue
+            rows = _label_positions(table.index, labels)  # tables may be sorted or have rows inserted
+            found = rows >= 0
+            cells = table.iloc[:, table.columns.get_loc(col)].values[rows[found]]
+            changes.append((table, rows[found], found, cells, [cell['data'] for cell in cells]))
+
+        self._writable(col, values)[positions] = values
+        objects = np.asarray(values, dtype=object)
+        for table, rows, found, cells, old in changes:
+            for cell, value in zip(cells, objects[found]):
+                if type(cell) is _SharedCell and cell.column[0] is self:
+                    cell.value = _SharedCell._unset  # reads the new value, dropping any value the table wrote
+                else:
+                    cell['data'] = value
+            table._column_changed(col, rows, old)
+            table._refresh_cells(rows, table.columns.get_loc(col))
+            table._refresh_styles()
+            table.history.clear()  # not an edit of the table, undoing past it would restore stale values
+
+    def append_rows(self, rows, render=True):
+        """
+        Append rows and send them to the attached tables
+        
+        Parameters
+        ----------
+        rows : df
+            rows to append, with the dataset's columns
+        render : bool, default=True
+            call `show` on the attached tables that are displayed
+        """
+        missing = [col for col in self.columns if col not in rows.columns]
+        if missing:
+            raise KeyError('Rows are missing dataset columns: {}'.format(missing))
+        rows = rows[self.columns]
+        self._arrays = {col: np.concatenate([self._arrays[col], rows[col].to_numpy()]) for col in self.columns}
+        self._owned = set(self.columns)
+        start = len(self.index)
+        self.index = self.index.append(rows.index)
+        self._positions.extend(range(start, len(self.index)))
+
+        for table, columns in self.tables:
+            table._append_cells(self._cells(columns, start))
+            table.history.clear()
+            if render and table.frame is not None:
+                table.show()
+
+
+class RenderScheduler(object):
+    """
+    Runs long tkinter work a slice at a time from the event loop, so input is still handled while large tables and
+    lists fill in.  Work is an iterator, usually a generator, that does a small step each time it is advanced.  Each
+    tick steps the highest priority job until the time budget is spent, then hands back to tkinter with `after`.
+    Submitting work under a key that is already scheduled cancels the older job, so a newer render of the same
+    widget supersedes an older one.
+    
+    **METHODS:**
+    
+    **submit** : Schedule work under a key, cancelling older work with the same key
+    
+    **cancel** : Cancel the work scheduled under a key
+    
+    **pending** : True while work is scheduled
+    
+    **finish** : Run the work scheduled under a key to completion straight away
+    
+    Parameters
+    ----------
+    widget : tkinter widget
+        widget whose event loop runs the work, usually the window
+    budget : float, default=0.008
+        seconds of work per tick
+    
+    **=EXAMPLES===============================================================**
+        def fill(listbox, items):
+            for start in range(0, len(items), 100):
+                listbox.insert(tkinter.END, *items[start:start + 100])
+                yield
+        
+        scheduler = ictkinter.render_scheduler(main)
+        scheduler.submit('files', fill(listbox, files), on_done=lambda: print('done'))
+    """
+    def __init__(self, widget, budget=0.008):
+        self.widget = widget
+        self.budget = budget
+        self._jobs = {}  # key: [priority, sequence, steps, on_done]
+        self._sequence = 0
+        self._tick_id = None
 
-    def insert(self, loc, column, value, allow_duplicates=False):
-        # TODO may not need, can probably just use the inherited method
+    def submit(self, key, steps, priority=0, on_done=None):
         """
-        Inserts a column in the table at specified location
+        Schedule work under a key, cancelling older work with the same key
         
         Parameters
         ----------
-        loc : int 
-            location to insert
-        column : object
-            column name
-        value : int, Series, or array-like
-            values to insert
-        allow_duplicates : bool
+        key : hashable
+            identifies the work, i.e. (widget path, 'show')
+        steps : iterable
+            advanced one step at a time, the work is done when it is exhausted
+        priority : int, default=0
+            higher priorities run first, equal priorities in the order submitted
+        on_done : function, default=None
+            called with no arguments once the work is done, not called if cancelled
+        
+        Returns
+        -------
+        key : hashable
         """
-        super().insert(loc, column, value, allow_duplicates)
-        # self.reindex()
+        self.cancel(key)
+        self._sequence += 1
+        self._jobs[key] = [-priority, self._sequence, iter(steps), on_done]
+        if self._tick_id is None:
+            self._tick_id = self.widget.after_idle(self._tick)
 
-    def column_format(self, col, format_='', dec=2, fontname=None, fontsize=None, fontstyle=None):
+        return key
+
+    def cancel(self, key):
         """
-        Formats column in the table
+        Cancel the work scheduled under a key
         
-        Parameters
-        ----------
-        col : int
-            column to be formatted
-        format_ : str
-            format code ('$', 'float', 'int')
-        dec : int, default=2
-            number of decimal places for 'float' and '$'
-        fontname : str
-            name of font to use
-        fontsize : int
-            font size
-        fontstyle : str
-            font style 
+        Returns
+        -------
+        True if work was cancelled : bool
         """
-        for index, value_dict in self[col].iteritems():
-            text = icstring.format_text(dec, format_, value_dict['data'])
-            value_dict['data'] = text
-            font_tup = ()
-            if fontname is not None:
-                font_tup = font_tup + (fontname, )
-            else:
-                font_tup = font_tup + (value_dict['font'][0], )
-            if fontsize is not None:
-                font_tup = font_tup + (fontsize, )
-            else:
-                font_tup = font_tup + (value_dict['font'][1], )
-            if fontstyle is not None:
-                font_tup = font_tup + (fontstyle, )
-            else:
-                font_tup = font_tup + (value_dict['font'][2], )
+        job = self._jobs.pop(key, None)
+        if job is None:
+            return False
+        if hasattr(job[2], 'close'):  # runs the generator's cleanup
+            job[2].close()
 
-            value_dict['font'] = font_tup
+        return True
 
-    def header_format(self, format_='', dec=2, fontname=None, fontsize=None, fontstyle=None):
+    def pending(self, key=None):
         """
-        Formats the header (column titles)
+        True while work is scheduled
         
         Parameters
         ----------
-        format_ : str 
-            format style ('float', '$', 'int')    
-        dec : int, default=2
-            number of decimal places for 'float' and '$'
-        fontname : str
-            name of font to use
-        fontsize : int
-            font size
-        fontstyle : str
-            font style  
-        
+        key : hashable, default=None
+            key of the work, None for any work
         """
-        for header in self.columns:
-            self.rename(columns={header: icstring.format_text(dec, format_, header)})
-            font_tup = ()
-            if fontname is not None:
-                font_tup = font_tup + (fontname, )
-            else:
-                font_tup = font_tup + (self._formattting['header']['font'][0], )
-            if fontsize is not None:
-                font_tup = font_tup + (fontsize, )
-            else:
-                font_tup = font_tup + (self._formattting['header']['font'][1], )
-            if fontstyle is not None:
-                font_tup = font_tup + (fontstyle, )
-            else:
-                font_tup = font_tup + (self._formattting['header']['font'][2], )
+        if key is None:
+            return bool(self._jobs)
 
-            self._formattting['header']['font'] = font_tup
+        return key in self._jobs
 
-    def index_format(self, fontname=None, fontsize=None, fontstyle=None):
+    def finish(self, key):
         """
-        Formats the index column
-        
-        Parameters
-        ----------
-        fontname : str
-            name of font to use
-        fontsize : int
-            font size
-        fontstyle : str
-            font style  
+        Run the work scheduled under a key to completion straight away, i.e. before reading the widgets it builds
         """
-        font_tup = ()
-        if fontname is not None:
-            font_tup = font_tup + (fontname, )
-        else:
-            font_tup = font_tup + (self._formattting['header']['font'][0], )
-        if fontsize is not None:
-            font_tup = font_tup + (fontsize, )
-        else:
-            font_tup = font_tup + (self._formattting['header']['font'][1], )
-        if fontstyle is not None:
-            font_tup = font_tup + (fontstyle, )
-        else:
-            font_tup = font_tup + (self._formattting['header']['font'][2], )
+        job = self._jobs.pop(key, None)
+        if job is None:
+            return
+        for _ in job[2]:
+            pass
+        if job[3] is not None:
+            job[3]()
+
+    def _tick(self):
+        """
+        Steps jobs in priority order until the budget is spent, then schedules the next tick if work remains
+        """
+        self._tick_id = None
+        deadline = time.perf_counter() + self.budget
+        try:
+            while self._jobs and time.perf_counter() < deadline:
+                key = min(self._jobs, key=lambda k: self._jobs[k][:2])
+                job = self._jobs[key]
+                try:
+                    while self._jobs.get(key) is job and time.perf_counter() < deadline:
+                        next(job[2])
+                except StopIteration:
+                    if self._jobs.get(key) is job:
+                        del self._jobs[key]
+                        if job[3] is not None:
+                            job[3]()
+                except Exception:
+                    if self._jobs.get(key) is job:  # a failed job is dropped, the rest carry on next tick
+                        del self._jobs[key]
+                    raise
+        finally:
+            if self._jobs and self._tick_id is None:
+                self._tick_id = self.widget.after(1, self._tick)  # after(1) so pending input is handled first
 
-        self._formattting['index']['font'] = font_tup
 
-    def row_format(self, row, format_='', dec=2, fontname=None, fontsize=None, fontstyle=None):
+class AsyncBridge(object):
+    """
+    Runs an asyncio event loop on a daemon thread beside tkinter's mainloop, so data is fetched without freezing the
+    window.  Coroutines are submitted from tkinter callbacks and their results are passed back through a queue that
+    the tkinter loop polls with `after`, callbacks therefore always run on the tkinter thread and may touch widgets.
+    At most `concurrency` coroutines run at once, and `connection` lends fetchers pooled connections that are reused
+    rather than opened per request.  Submitting under a key that is still running cancels the older request.
+    
+    **METHODS:**
+    
+    **submit** : Run a coroutine on the loop and pass its result to a callback on the tkinter thread
+    
+    **cancel** : Cancel the request running under a key
+    
+    **update_table** : Replace the data of a TableFrame with the result of a coroutine
+    
+    **update_chart** : Redraw a ChartSlot with the result of a coroutine
+    
+    **connection** : Borrow a pooled connection, for use in submitted coroutines
+    
+    **stop** : Close pooled connections and stop the loop
+    
+    Parameters
+    ----------
+    widget : tkinter widget
+        widget whose event loop receives the results
+    concurrency : int, default=8
+        most coroutines running at once, also the most idle connections kept per pool
+    interval : int, default=20
+        milliseconds between polls for results
+    
+    **=EXAMPLES===============================================================**
+        bridge = ictkinter.AsyncBridge(main)
+        bridge.pool('db', lambda: sqlite3.connect('prices.db', check_same_thread=False))
+        
+        async def prices():
+            async with bridge.connection('db') as db:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(None, lambda: db.execute(query).fetchall())
+        
+        bridge.update_table(table, prices(), key='prices')
+    """
+    def __init__(self, widget, concurrency=8, interval=20):
+        self.widget = widget
+        self.concurrency = concurrency
+        self.interval = interval
+        self.loop = asyncio.new_event_loop()
+        self._results = queue.Queue()
+        self._running = {}  # key: concurrent.futures.Future
+        self._futures = set()  # submitted futures not yet seen done by `_poll`
+        self._factories = {}  # pool name: function returning a new connection
+        self._idle = {}  # pool name: idle connections
+        self._poll_id = None
+
+        self._semaphore = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self.submit(self._setup())
+
+    def _run(self):
+        """Runs the loop, on the bridge's thread"""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    async def _setup(self):
+        """Creates the semaphore on the loop it is used by"""
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+
+    async def _limited(self, coro):
+        """Awaits coro once fewer than `concurrency` coroutines are running"""
+        if self._semaphore is None:
+            return await coro
+        async with self._semaphore:
+            return await coro
+
+    def submit(self, coro, callback=None, error=None, key=None):
         """
-        Formats row in the table
+        Run a coroutine on the loop and pass its result to a callback on the tkinter thread
         
         Parameters
         ----------
-        row : int
-            row to be formatted
-        format_ : str
-            format code ('$', 'float', 'int')
-        dec : int, default=2
-            number of decimal places for 'float' and '$'
-        fontname : str
-            name of font to use
-        fontsize : int
-            font size
-        fontstyle : str
-            font style 
+        coro : coroutine
+            work to run on the asyncio loop
+        callback : function, default=None
+            called as callback(result) on the tkinter thread
+        error : function, default=None
+            called as error(exception) on the tkinter thread if the coroutine raises, None to raise it in the
+            tkinter loop
+        key : hashable, default=None
+            identifies the request, a newer request with the same key cancels this one
+        
+        Returns
+        -------
+        future : concurrent.futures.Future
         """
-        row_dict = self.loc[row]
-        for value_dict in row_dict:
-            text = icstring.format_text(dec, format_, value_dict['data'])
-            value_dict['data'] = text
-            font_tup = ()
-            if fontname is not None:
-                font_tup = font_tup + (fontname, )
-            else:
-                font_tup = font_tup + (value_dict['font'][0], )
-            if fontsize is not None:
-                font_tup = font_tup + (fontsize, )
-            else:
-                font_tup = font_tup + (value_dict['font'][1], )
-            if fontstyle is not None:
-                font_tup = font_tup + (fontstyle, )
-            else:
-                font_tup = font_tup + (value_dict['font'][2], )
+        if key is not None:
+            self.cancel(key)
+        future = asyncio.run_coroutine_threadsafe(self._limited(coro), self.loop)
+        if key is not None:
+            self._running[key] = future
+        self._futures.add(future)
 
-            value_dict['font'] = font_tup
+        def done(finished):
+            if finished.cancelled():
+                return
+            self._results.put((key, finished, callback, error))
 
-    def i_column(self, col, data):
+        future.add_done_callback(done)
+        if self._poll_id is None:
+            self._poll_id = self.widget.after(self.interval, self._poll)
+
+        return future
+
+    def cancel(self, key):
         """
-        Replaces specified column (index) with provided data
+        Cancel the request running under a key
         
-        Usage notes:
-            t3['Average'] = [12, 12, 12, 12, 12, 12] is equivalent to
-            t3.column('Average', [13, 13, 13, 13, 13, 13]), with exception as listed under data:
+        Returns
+        -------
+        True if a request was cancelled : bool
+        """
+        future = self._running.pop(key, None)
+
+        return future is not None and future.cancel()
+
+    def _poll(self):
+        """
+        Runs the callbacks of finished coroutines on the tkinter thread, polling again while requests are running
+        """
+        self._poll_id = None
+        try:
+            while not self._results.empty():
+                key, future, callback, error = self._results.get_nowait()
+                if key is not None:
+                    if self._running.get(key) is not future:  # superseded after it finished
+                        continue
+                    del self._running[key]
+                exception = future.exception()
+                if exception is not None:
+                    if error is None:
+                        raise exception
+                    error(exception)
+                elif callback is not None:
+                    callback(future.result())
+        finally:
+            self._futures = {future for future in self._futures if not future.done()}
+            if self._futures or not self._results.empty():
+                self._poll_id = self.widget.after(self.interval, self._poll)
+
+    def update_table(self, table, coro, key=None, render=True):
+        """
+        Replace the data of a TableFrame with the result of a coroutine, see `TableFrame.update_data`
         
         Parameters
         ----------
-        col : int
-            column index
-        data : list, series, array like
-            data to replace in column, must be same length as number of rows, if data is longer then end of
-            list will be truncated, if shorter blank items will be appended to end 
+        table : TableFrame
+            table to update
+        coro : coroutine
+            returns a df, dict or np.ndarray the shape of the table
+        key : hashable, default=None
+            identifies the request, None to use the table
+        render : bool, default=True
+            call `show` once the data is updated
         """
-        while len(data) > len(self):
-            del data[-1]
-        while len(data) < len(self):
-            data.append(self.blank_cell)
+        def apply(data):
+            table.update_data(data)
+            if render:
+                table.show()
 
-        self.iloc[:, col] = data
+        return self.submit(coro, apply, key=('table', id(table)) if key is None else key)
 
-    def column(self, col, data):
+    def update_chart(self, slot, coro, key=None, **kwargs):
         """
-        Replaces specified column (label) with provided data
-        
-        Usage notes:
-            t3['Average'] = [12, 12, 12, 12, 12, 12] is equivalent to
-            t3.column('Average', [13, 13, 13, 13, 13, 13]), with exception as listed under data:
+        Redraw a ChartSlot with the result of a coroutine, see `icmatplot.create_graph_image`
         
         Parameters
         ----------
-        col : str
-            column label
-        data : list, series, array like
-            data to replace in column, must be same length as number of rows, if data is longer then end of
-            list will be truncated, if shorter blank items will be appended to end 
+        slot : ChartSlot
+            slot to redraw
+        coro : coroutine
+            returns data to plot
+        key : hashable, default=None
+            identifies the request, None to use the slot
+        kwargs :
+            passed on to the graph (title, x_name, y_name, height, width, dpi)
         """
-        while len(data) > len(self):
-            del data[-1]
-        while len(data) < len(self):
-            data.append(self.blank_cell)
+        key = ('chart', id(slot)) if key is None else key
 
-        iter_data = iter(data)
-        for index, v in self.iterrows():
-            v[col]['data'] = next(iter_data)
+        return self.submit(coro, lambda data: slot.plot(data, **kwargs), key=key)
 
-    def i_row(self, row, data):
+    def pool(self, name, factory):
         """
-        Replaces specified row (index) with provided data
+        Register a pool of connections for `connection`
         
         Parameters
         ----------
-        row : int
-            row index
-        data : (list, series, or array like) 
-            data to replace in row, must be same length as number of columns, if data is longer then end of
-            list will be truncated, if shorter blank items will be appended to end 
+        name : str
+            pool name
+        factory : function
+            returns a new connection, may be a coroutine function
         """
-        while len(data) > len(self.columns):
-            del data[-1]
-        while len(data) < len(self.columns):
-            data.append(self.blank_cell)
+        self._factories[name] = factory
+        self._idle.setdefault(name, [])
 
-    def row(self, row, data):
+    @contextlib.asynccontextmanager
+    async def connection(self, name):
         """
-        Replaces specified row (label) with provided data
+        Borrow a pooled connection, for use in submitted coroutines with `async with`.  Idle connections are reused,
+        a new one is only made when none is idle, and at most `concurrency` idle connections are kept
         
         Parameters
         ----------
-        row : int
-            row index
-        data : (list, series, or array like) 
-            data to replace in row, must be same length as number of columns, if data is longer then end of
-            list will be truncated, if shorter blank items will be appended to end 
+        name : str
+            pool registered with `pool`
         """
-        while len(data) > len(self.columns):
-            del data[-1]
-        while len(data) < len(self.columns):
-            data.append(self.blank_cell)
+        idle = self._idle[name]
+        if idle:
+            conn = idle.pop()
+        else:
+            conn = self._factories[name]()
+            if asyncio.iscoroutine(conn):
+                conn = await conn
+        try:
+            yield conn
+        except BaseException:
+            _close(conn)  # the connection may be left mid request
+            raise
+        else:
+            if len(idle) < self.concurrency:
+                idle.append(conn)
+            else:
+                _close(conn)
 
-        iter_data = iter(data)
-        for c, v in self.iteritems():
-            v[row]['data'] = next(iter_data)
+    async def _shutdown(self):
+        """Closes the idle connections on the loop, then stops it"""
+        for idle in self._idle.values():
+            for conn in idle:
+                closing = _close(conn)
+                if closing is not None:
+                    await closing
+            idle.clear()
+        self.loop.stop()
 
-    def row_rename(self):
+    def stop(self):
         """
-        Rename row index  --*UNDER CONSTRUCTION*--
-         
+        Cancel running requests, keyed or not, close pooled connections and stop the loop
         """
-        # TODO develop method
-        pass
+        self._running.clear()
+        for future in self._futures:  # every submitted future not yet seen done, keyed ones included
+            future.cancel()
+        self._futures.clear()
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop)
+        self._thread.join(timeout=1)
+        if self._poll_id is not None:
+            self.widget.after_cancel(self._poll_id)
+            self._poll_id = None
 
-    def column_rename(self):
-        """
-        Rename column  --*UNDER CONSTRUCTION*--
- 
-        """
-        # TODO develop method
-        pass
+
+def _close(conn):
+    """closes a pooled connection if it has a close method, returns the task of an asynchronous close, else None
+
+        :param conn:object: connection made by a pool factory
+    """
+    close = getattr(conn, 'close', None)
+    if close is None:
+        return None
+    result = close()
+    if asyncio.iscoroutine(result):
+        return asyncio.ensure_future(result)
+
+    return None
 
 
 class ListBoxController(tkinter.Listbox):
@@ -874,25 +3968,105 @@ class ListBoxController(tkinter.Listbox):
             but.grid(row=1, column=col, sticky='nsew')
 
     def add_item(self):
-        """Add item to list from linked widget"""
-        listbox_items = self.list_items()
-        if not self.duplicates:
-            if self.widget_link.get() not in listbox_items:
-                self.insert(tkinter.END, self.widget_link.get())
-                listbox_items.append(self.widget_link.get())
-        else:
-            self.insert(tkinter.END, self.widget_link.get())
-            listbox_items.append(self.widget_link.get())
-
+        """Add item to list from linked widget, sorted lists insert it in place rather than being rebuilt"""
+        item = self.widget_link.get()
         if self.issorted:
-            self.clear()
-            for f in sorted(listbox_items):
-                self.insert(tkinter.END, f)
+            listbox_items = self.list_items()
+            position = bisect.bisect_right(listbox_items, item)
+            if not self.duplicates and position and listbox_items[position - 1] == item:
+                return
+            self.insert(position, item)
+        elif self.duplicates or item not in self.list_items():
+            self.insert(tkinter.END, item)
 
     def delete_item(self):
         pass
 
 
+class ChartSlot(object):
+    """
+    A canvas holding one image item and one tkinter PhotoImage that are reused on every refresh.  New pixels are
+    pasted into the existing PhotoImage, which updates the canvas item in place, so dashboards refreshing a graph
+    for days do not pile up canvas items or tkinter images.  A new PhotoImage is only made when the image size
+    changes.
+    
+    **METHODS:**
+    
+    **update** : Draw a PIL image in the slot
+    
+    **plot** : Draw a graph of data in the slot
+    
+    **clear** : Remove the image from the slot
+    
+    Parameters
+    ----------
+    subframe : tkinter.Frame
+        frame to contain the canvas
+    row : int
+        grid row
+    column : int
+        grid column
+    padx : int
+        x padding for canvas
+    pady : int
+        y padding for canvas
+    sticky : str
+        grid sticky
+    
+    **=EXAMPLES===============================================================**
+        slot = ictkinter.ChartSlot(subframe, row=0, column=1)
+        
+        def refresh():
+            slot.plot(latest_prices(), title='Prices')
+            main.after(5000, refresh)
+    """
+    def __init__(self, subframe, row=0, column=0, padx=2, pady=1, sticky='nsew'):
+        self.canvas = tkinter.Canvas(subframe, highlightthickness=0)
+        self.canvas.grid(row=row, column=column, sticky=sticky, padx=padx, pady=pady)
+        self.grid = {'row': row, 'column': column, 'padx': padx, 'pady': pady, 'sticky': sticky}
+        self.photo = None
+        self.tag = 'chart_slot'
+
+    def update(self, image):
+        """
+        Draw a PIL image in the slot
+        
+        Parameters
+        ----------
+        image : PIL.Image
+            image to draw, None leaves the slot as it is
+        """
+        if image is None:
+            return
+        if self.photo is not None and (self.photo.width(), self.photo.height()) == image.size:
+            self.photo.paste(image)  # the canvas item shows the PhotoImage, so it redraws without being touched
+            return
+
+        self.photo = ImageTk.PhotoImage(image)  # the previous PhotoImage is freed once nothing refers to it
+        self.canvas.configure(width=image.width, height=image.height)
+        image_to_canvas(None, self.photo, canvas=self.canvas, item=self.tag, **self.grid)
+
+    def plot(self, data, **kwargs):
+        """
+        Draw a graph of data in the slot
+        
+        Parameters
+        ----------
+        data : list, np.ndarray or pd.Series
+            data to plot
+        kwargs :
+            passed on to icmatplot.render_graph (title, x_name, y_name, height, width, dpi)
+        """
+        import icmatplot
+
+        self.update(icmatplot.render_graph(data, **kwargs))
+
+    def clear(self):
+        """Remove the image from the slot, releasing the PhotoImage"""
+        self.canvas.delete(self.tag)
+        self.photo = None
+
+
 class ScrollFrame(tkinter.Canvas):
     """ 
     Creates a canvas with scroll bar
@@ -939,9 +4113,10 @@ class ScrollFrame(tkinter.Canvas):
         return self.frame
 
 
-class CreateToolTip(object):  # TODO not working, tooltip does not display on buttons, may only work on list boxes, etc
+class CreateToolTip(object):
     """
-    create a tooltip for a given widget
+    create a tooltip for a given widget, binds events on the widget and creates a window per hover, use
+    ToolTipManager for many widgets or table cells
     link: http://stackoverflow.com/questions/3221956/what-is-the-simplest-way-to-make-tooltips-in-tkinter
     """
     def __init__(self, widget, text='widget info'):
@@ -973,10 +4148,8 @@ class CreateToolTip(object):  # TODO not working, tooltip does not display on bu
             self.widget.after_cancel(id_)
 
     def showtip(self, event=None):
-        # x = y = 0
-        x, y, cx, cy = self.widget.bbox("insert")
-        x += self.widget.winfo_rootx() + 25
-        y += self.widget.winfo_rooty() + 20
+        x = self.widget.winfo_rootx() + 25
+        y = self.widget.winfo_rooty() + 20  # bbox('insert') only exists on text widgets, so not used for buttons
         # creates a top level window
         self.tw = tkinter.Toplevel(self.widget)
         # Leaves only the label and removes the app window
@@ -993,6 +4166,146 @@ class CreateToolTip(object):  # TODO not working, tooltip does not display on bu
         if tw:
             tw.destroy()
 
+
+class ToolTipManager(object):
+    """
+    Tooltips for any number of widgets and table cells from one hidden window and one set of bindings.  Widgets are
+    given a bind tag rather than bindings of their own, the tag's class bindings look up the text of the widget
+    under the pointer, by widget path, or by (row label, column label) for TableFrame cells, and reuse the same
+    window for every tooltip.
+    
+    **METHODS:**
+    
+    **add** : Give a widget a tooltip
+    
+    **remove** : Remove a widget's tooltip
+    
+    **attach_table** : Give TableFrame cells tooltips
+    
+    **hide** : Hide the tooltip
+    
+    Parameters
+    ----------
+    window : tkinter.Tk or tkinter.Frame
+        any widget of the application
+    waittime : int, default=500
+        milliseconds the pointer rests on a widget before its tooltip is shown
+    wraplength : int, default=180
+        pixels before the tooltip text wraps
+    tag : str, default='ICToolTip'
+        bind tag given to widgets with tooltips
+    
+    **=EXAMPLES===============================================================**
+        tips = ictkinter.ToolTipManager(main)
+        tips.add(open_button, 'Open a file')
+        tips.attach_table(table, {(2014, 'Average'): 'Average of 12 months'})
+    """
+    def __init__(self, window, waittime=500, wraplength=180, tag='ICToolTip'):
+        self.window = window
+        self.waittime = waittime
+        self.tag = tag
+        self.texts = {}  # widget path: text, removed when the widget is destroyed
+        self._tables = {}  # path of TableFrame.frame: table
+        self._id = None
+
+        self.tw = tkinter.Toplevel(window)
+        self.tw.wm_overrideredirect(True)
+        self.tw.withdraw()
+        self.label = tkinter.Label(self.tw, justify='left', background="#ffffff", relief='solid', borderwidth=1,
+                                   wraplength=wraplength)
+        self.label.pack(ipadx=1)
+
+        window.bind_class(tag, '<Enter>', self._enter)
+        window.bind_class(tag, '<Leave>', self.hide)
+        window.bind_class(tag, '<ButtonPress>', self.hide)
+        window.bind_class(tag, '<Destroy>', self._destroyed)
+
+    def add(self, widget, text):
+        """
+        Give a widget a tooltip, or change its text
+        
+        Parameters
+        ----------
+        widget : tkinter widget
+        text : str
+        """
+        self.texts[str(widget)] = text
+        _add_bindtag(widget, self.tag)
+
+    def remove(self, widget):
+        """Remove a widget's tooltip"""
+        self.texts.pop(str(widget), None)
+        widget.bindtags(tuple(tag for tag in widget.bindtags() if tag != self.tag))
+
+    def attach_table(self, table, texts):
+        """
+        Give TableFrame cells tooltips, the cells are tagged as the table is shown
+        
+        Parameters
+        ----------
+        table : TableFrame
+        texts : dict
+            {(row label, column label): text}, may be changed later, i.e. to add tooltips for new rows
+        """
+        table.tooltips = texts
+        table._tooltip_tag = self.tag
+        self._tables[str(table.frame)] = table
+
+    def _text(self, widget):
+        """
+        Returns the tooltip text of a widget, None if it has none
+        """
+        text = self.texts.get(str(widget))
+        if text is not None:
+            return text
+
+        # table cells are found from their grid position, as their table's sub_frame is a child of table.frame
+        table = self._tables.get(widget.winfo_parent().rpartition('.')[0])
+        if table is None or table._shown is None:
+            return None
+        grid = widget.grid_info()
+        r, c = int(grid['row']) - table.visible_columns, int(grid['column']) - table.visible_index
+        positions = table._shown[0]
+        if not 0 <= r < len(positions) or not 0 <= c < len(table.columns):
+            return None
+
+        return table.tooltips.get((table.index[positions[r]], table.columns[c]))
+
+    def _destroyed(self, event):
+        """Forgets the text of a destroyed widget"""
+        self.texts.pop(str(event.widget), None)
+
+    def _enter(self, event):
+        """Schedules the tooltip of the widget the pointer entered"""
+        self.hide()
+        text = self._text(event.widget)
+        if text is not None:
+            self._id = self.window.after(self.waittime, lambda: self._show(text))
+
+    def _show(self, text):
+        """Moves the tooltip window next to the pointer and shows text"""
+        self._id = None
+        x, y = self.window.winfo_pointerxy()
+        self.label.configure(text=text)
+        self.tw.wm_geometry("+%d+%d" % (x + 15, y + 10))
+        self.tw.deiconify()
+        self.tw.lift()
+
+    def hide(self, event=None):
+        """Hide the tooltip, the window is kept for the next one"""
+        if self._id is not None:
+            self.window.after_cancel(self._id)
+            self._id = None
+        self.tw.withdraw()
+
+
+def _add_bindtag(widget, tag):
+    """puts tag first in a widget's bind tags, if not already there"""
+    tags = widget.bindtags()
+    if tag not in tags:
+        widget.bindtags((tag,) + tags)
+
+
 if __name__ == '__main__':
     main = tkinter.Tk()
 
@@ -0,0 +1,148 @@
+"""
+Soak test of the refresh cycles long running dashboards repeat: TableFrame.show/update_data,
+create_graph_image + image_to_canvas, ListBoxController.add_item and clear_subframe.
+
+Tracks python allocations (tracemalloc), live tk widgets and images, and RSS, and exits with status 1 if any grows
+by more than its threshold between the end of the warm up and the last cycle, or if the table's undo history grows
+past its max_bytes cap.  Needs a display, headless run from the repository root with:
+
+    xvfb-run -a python test_code/soak_test.py --cycles 5000
+"""
+
+import argparse
+import os
+import resource
+import sys
+import time
+import tracemalloc
+import tkinter
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import ictkinter
+import icmatplot
+
+
+def rss_mb():
+    """returns resident set size of this process in MB, peak RSS where /proc is not available"""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2 ** 10
+
+
+def count_widgets(widget):
+    """returns number of widgets below widget, including widget"""
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def measure(main, table):
+    """returns dict of the tracked sizes"""
+    return {'python_mb': tracemalloc.get_traced_memory()[0] / 2 ** 20,
+            'widgets': count_widgets(main),
+            'images': len(main.tk.call('image', 'names')),
+            'rss_mb': rss_mb(),
+            'history_kb': table.history.nbytes / 2 ** 10}
+
+
+def build(main, rows, columns, history_kb):
+    """creates the widgets refreshed by each cycle"""
+    frame = tkinter.Frame(main)
+    frame.grid(row=0, column=0, sticky='nsew')
+    subframe = tkinter.Frame(frame)
+    subframe.grid(row=0, column=0, sticky='nsew')
+
+    data = pd.DataFrame(np.random.rand(rows, columns))
+    table = ictkinter.TableFrame(main, row=1, data=data,
+                                 columns=['col%d' % c for c in range(columns)])
+    table.column_format('col0', format_='float')
+    table.history.max_bytes = history_kb * 2 ** 10  # a cap the run fills, so trimming is exercised
+
+    entry = tkinter.Entry(main)
+    entry.grid(row=2, column=0)
+    listbox = ictkinter.ListBoxController(main, row=3, widget_link=entry)
+
+    canvas = tkinter.Canvas(main)
+
+    return {'frame': frame, 'subframe': subframe, 'table': table, 'entry': entry, 'listbox': listbox,
+            'canvas': canvas, 'shape': (rows, columns)}
+
+
+def cycle(main, parts, i):
+    """one refresh of every path"""
+    table = parts['table']
+    table.update_data(np.random.rand(*parts['shape']))
+    table.show()
+    ictkinter.render_scheduler(table.frame).finish((str(table.frame), 'show'))
+
+    graph = icmatplot.create_graph_image(np.random.rand(20), title='cycle %d' % i, height=2, width=3)
+    parts['graph'] = ictkinter.image_to_canvas(parts['subframe'], graph, row=0, column=1, canvas=parts['canvas'],
+                                               item='graph')[0]
+
+    entry = parts['entry']
+    entry.delete(0, tkinter.END)
+    entry.insert(0, 'item %d' % (i % 50))  # a bounded set of items, so the list itself stops growing
+    parts['listbox'].add_item()
+
+    parts['subframe'] = ictkinter.clear_subframe(parts['frame'], parts['subframe'])
+
+    main.update()
+
+
+def main_loop(args):
+    main = tkinter.Tk()
+    parts = build(main, args.rows, args.columns, args.history_kb)
+    tracemalloc.start()
+
+    history = parts['table'].history
+    over_cap = 0  # reports where the undo history was above its cap
+    for i in range(args.warmup):
+        cycle(main, parts, i)
+    baseline = measure(main, parts['table'])
+    print('baseline', baseline)
+
+    start = time.time()
+    for i in range(args.cycles):
+        cycle(main, parts, args.warmup + i)
+        if (i + 1) % args.report == 0:
+            over_cap += history.nbytes > history.max_bytes
+            print('cycle %d, %.1fs' % (i + 1, time.time() - start), measure(main, parts['table']))
+    final = measure(main, parts['table'])
+
+    # the undo history is left to fill, it counts towards python_mb up to its cap and is checked against the cap
+    limits = {'python_mb': args.max_python_mb, 'widgets': 0, 'images': 0, 'rss_mb': args.max_rss_mb}
+    failed = [key for key in limits if final[key] - baseline[key] > limits[key]]
+    for key in limits:
+        print('%-10s %10.1f -> %10.1f  (limit +%s)%s' % (key, baseline[key], final[key], limits[key],
+                                                         '  FAILED' if key in failed else ''))
+    over_cap += history.nbytes > history.max_bytes
+    if over_cap:
+        failed.append('history_kb')
+    print('%-10s %10.1f -> %10.1f  (cap %.1f)%s' % ('history_kb', baseline['history_kb'], final['history_kb'],
+                                                   history.max_bytes / 2 ** 10, '  FAILED' if over_cap else ''))
+    if args.top:
+        snapshot = tracemalloc.take_snapshot()
+        for stat in snapshot.statistics('lineno')[:args.top]:
+            print(stat)
+
+    main.destroy()
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--cycles', type=int, default=2000)
+    parser.add_argument('--warmup', type=int, default=50)
+    parser.add_argument('--report', type=int, default=250, help='cycles between progress lines')
+    parser.add_argument('--rows', type=int, default=30)
+    parser.add_argument('--columns', type=int, default=6)
+    parser.add_argument('--max-python-mb', type=float, default=5.0)
+    parser.add_argument('--max-rss-mb', type=float, default=50.0)
+    parser.add_argument('--history-kb', type=int, default=1024, help='undo history cap of the table')
+    parser.add_argument('--top', type=int, default=10, help='largest allocation sites to print, 0 for none')
+
+    sys.exit(main_loop(parser.parse_args()))
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+import icdatetime
+
+
+def test_weekmask():
+    assert icdatetime.weekmask('Mon, Wed, Fri') == '1010100'
+    assert icdatetime.weekmask('Mon, Tue, Wed, Thu, Fri') == '1111100'
+    assert icdatetime.weekmask('Sun/Sat') == '0000011'
+    assert icdatetime.weekmask(['TUES', 'Thurs', 2]) == '1101000'
+
+
+def test_weekmask_invalid_day():
+    with pytest.raises(ValueError):
+        icdatetime.weekmask('Mon, Funday')
+
+
+def test_business_calendar_defaults():
+    assert icdatetime.business_calendar().weekmask.tolist() == [True] * 5 + [False] * 2
+
+
+def test_count_business_days_defaults():
+    assert icdatetime.count_business_days('2024-01-01', '2024-01-08') == 5
+    counts = icdatetime.count_business_days(['2024-01-01', '2024-01-06'], ['2024-01-03', '2024-01-08'])
+    assert counts.tolist() == [2, 0]  # Saturday and Sunday only
+
+
+def test_count_business_days_holidays():
+    assert icdatetime.count_business_days('2024-01-01', '2024-01-08', holidays=['2024-01-01']) == 4
+
+
+def test_offset_business_days_defaults():
+    assert icdatetime.offset_business_days('2024-01-05', 1) == np.datetime64('2024-01-08')
+    assert icdatetime.offset_business_days('2024-01-06', 0) == np.datetime64('2024-01-08')  # Saturday rolls forward
+    dates = icdatetime.offset_business_days(['2024-01-01', '2024-01-08'], [-1, 5])
+    assert dates.tolist() == [np.datetime64('2023-12-29', 'D').item(), np.datetime64('2024-01-15', 'D').item()]
+
+
+def test_expand_recurrence():
+    dates = icdatetime.expand_recurrence('Mon, Thu', '2024-01-01', '2024-01-15')
+    assert dates.astype(str).tolist() == ['2024-01-01', '2024-01-04', '2024-01-08', '2024-01-11']
+
+
+def test_parse_dates_inferred_format():
+    dates = icdatetime.parse_dates(['01/02/2017', 'Tue 01/03/2017', '01/02/2017', None, 'junk'])
+    assert dates[:3].astype('datetime64[D]').astype(str).tolist() == ['2017-01-02', '2017-01-03', '2017-01-02']
+    assert np.isnat(dates[3:]).all()
+
+
+def test_parse_dates_mixed_formats():
+    dates = icdatetime.parse_dates(['2017-01-02', '2017-01-02', '01/03/2017', 'Jan 5, 2017', 'junk'], key='mixed')
+    assert dates[:4].astype('datetime64[D]').astype(str).tolist() == ['2017-01-02', '2017-01-02', '2017-01-03',
+                                                                       '2017-01-05']
+    assert np.isnat(dates[4])
+    later = icdatetime.parse_dates(['01/04/2017'], key='mixed')  # remembered format does not fit, still parsed
+    assert later.astype('datetime64[D]').astype(str).tolist() == ['2017-01-04']
+
+
+def test_parse_dates_given_format_is_strict():
+    dates = icdatetime.parse_dates(['2017-01-02', '01/03/2017'], format_='%Y-%m-%d')
+    assert str(dates[0].astype('datetime64[D]')) == '2017-01-02'
+    assert np.isnat(dates[1])
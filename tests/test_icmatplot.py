@@ -0,0 +1,33 @@
+import numpy as np
+import icmatplot
+
+
+def _atlas(series, width=8, height=5):
+    atlas = icmatplot.SparklineAtlas(width, height, (0, 0, 0), (255, 255, 255))
+    atlas.resize(len(series))
+    atlas.draw(series)
+
+    return atlas
+
+
+def test_sparkline_draws_each_point():
+    atlas = _atlas([[0, 1, 2, 3, 4, 3, 2, 1]])
+    pixels = atlas.pixels[0]
+    assert pixels.any(axis=0).all()  # every column has a point
+    assert pixels[4, 0] and pixels[0, 4]  # lowest value at the bottom, highest at the top
+
+
+def test_sparkline_gaps_stay_empty():
+    pixels = _atlas([[0, 1, np.nan, np.nan, 3, 4, 2, 0]]).pixels[0]
+    assert not pixels[:, 2:4].any()
+    assert pixels[:, 1].sum() == 1  # the point before the gap is not joined to anything
+
+
+def test_sparkline_redraws_invalidated_rows_only():
+    atlas = _atlas([[0, 1, 2, 3, 4, 5, 6, 7], [7, 6, 5, 4, 3, 2, 1, 0]])
+    before = atlas.pixels.copy()
+    atlas.invalidate([1])
+    atlas.draw([None, [0, 1, 2, 3, 4, 5, 6, 7]])  # row 0 is not read
+    assert (atlas.pixels[0] == before[0]).all()
+    assert (atlas.pixels[1] == before[0]).all()
+    assert atlas.image(1).size == (8, 5)
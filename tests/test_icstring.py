@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+import icstring
+
+
+@pytest.fixture(autouse=True)
+def default_separators():
+    icstring.set_separators()
+    yield
+    icstring.set_separators()
+
+
+def test_parse_numbers():
+    numbers, valid = icstring.parse_numbers(['$1,234.50', '12.00', '-3', '(45.10)', '12.5%', 7, 'abc', None])
+    assert numbers[:6].tolist() == [1234.5, 12.0, -3.0, -45.1, 0.125, 7.0]
+    assert np.isnan(numbers[6:]).all()
+    assert valid.tolist() == [True] * 6 + [False] * 2
+
+
+@pytest.mark.parametrize('text', ['SKU-100', 'Room 12B', 'Q1 2024', '2024-01-05', 'A10', '1.2.3', '-', '$', '()'])
+def test_parse_numbers_codes_are_not_numbers(text):
+    numbers, valid = icstring.parse_numbers([text])
+    assert not valid[0]
+    assert np.isnan(numbers[0])
+    assert icstring.format_array(2, '#,##0.00', [text]).tolist() == [text]
+
+
+def test_parse_numbers_formatted_text():
+    numbers, valid = icstring.parse_numbers(['-$3', '$-3', '€ 5', '.5', ' 7 ', '-2e3', '1,234,567'])
+    assert numbers.tolist() == [-3.0, -3.0, 5.0, 0.5, 7.0, -2000.0, 1234567.0]
+    assert valid.all()
+
+
+def test_parse_numbers_int():
+    numbers, valid = icstring.parse_numbers(['1.9', 'x'], dtype='int64')
+    assert numbers.dtype == np.int64
+    assert numbers.tolist() == [1, 0]
+    assert valid.tolist() == [True, False]
+
+
+def test_number_format_sections():
+    fmt = icstring.compile_format('$#,##0.00;($#,##0.00);"nil"')
+    assert fmt.format(1234.5) == '$1,234.50'
+    assert fmt.format(-1234.5) == '($1,234.50)'
+    assert fmt.format(0) == 'nil'
+    assert fmt.format('abc') == 'abc'
+    assert icstring.compile_format('#,##0').format(-1234.5) == '-1,234'
+    assert icstring.compile_format('0.0%').format(0.125) == '12.5%'
+
+
+def test_compile_format_cached():
+    assert icstring.compile_format('#,##0.00') is icstring.compile_format('#,##0.00')
+
+
+def test_number_format_separators():
+    assert icstring.compile_format('#,##0.00', '.', ',').format(1234.5) == '1.234,50'
+
+
+def test_format_array():
+    texts = icstring.format_array(2, '$#,##0.00;($#,##0.00)', [1234.5, -3, '12', 'abc', None])
+    assert texts.tolist() == ['$1,234.50', '($3.00)', '$12.00', 'abc', None]
+    assert icstring.format_array(2, 'float', [1.234, 'x']).tolist() == ['1.23', 'x']
+
+
+def test_percent_text_same_in_format_text_and_format_array():
+    values = ['12.5%', 0.125, '(5%)']
+    texts = icstring.format_array(0, '0.0%', values).tolist()
+    assert texts == ['12.5%', '12.5%', '-5.0%']
+    assert [icstring.format_text(0, '0.0%', value) for value in values] == texts
+
+
+def test_set_separators():
+    icstring.set_separators('.', ',')
+    assert icstring.format_text(0, '#,##0.00', 1234.5) == '1.234,50'
+    assert icstring.format_array(0, '#,##0.00', [1234.5]).tolist() == ['1.234,50']
+
+
+def test_legacy_codes_do_not_scale_percent():
+    assert icstring.format_text(2, 'float', '12.5%') == '12.50'
+    assert icstring.format_text(2, '$', '5%') == '$5.00'
+    assert icstring.format_text(2, 'int', '(4.7)') == -4
+    assert icstring.format_text(2, 'float', 'abc') == 'abc'
+    assert icstring.format_array(2, 'float', ['12.5%', 1.234]).tolist() == ['12.50', '1.23']
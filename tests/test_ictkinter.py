@@ -0,0 +1,291 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+import ictkinter
+
+# TableFrame keeps its state in attributes of the DataFrame subclass
+pytestmark = pytest.mark.filterwarnings("ignore:Pandas doesn't allow columns to be created via a new attribute name")
+
+
+def _cache_round_trip(data, path, cache_dir, **kwargs):
+    ictkinter.save_column_cache(data, path, cache_dir, **kwargs)
+    cached = ictkinter.load_column_cache(path, cache_dir, **kwargs)
+
+    return pd.concat(list(ictkinter._cached_chunks(cached)))
+
+
+def test_column_cache_round_trip(tmp_path):
+    path = str(tmp_path / 'data.csv')
+    data = pd.DataFrame({'name': ['x', 'y', None], 'value': [1.5, np.nan, 3.0], 'count': [1, 2, 3]})
+    data.to_csv(path, index=False)
+    data = pd.read_csv(path)
+
+    result = _cache_round_trip([data.iloc[:2], data.iloc[2:]], path, str(tmp_path / 'cache'))
+    pd.testing.assert_frame_equal(result, data, check_dtype=False, check_index_type=False)
+    assert result['value'].dtype == np.float64
+    assert result['count'].dtype == np.int64
+
+
+def test_column_cache_missing_values(tmp_path):
+    path = str(tmp_path / 'data.csv')
+    open(path, 'w').close()
+    values = np.array(['x', float('nan'), np.nan, None, pd.NaT, pd.NA], dtype=object)
+    data = pd.DataFrame({'text': pd.Series(values, dtype=object), 'empty': pd.Series([np.nan] * 6, dtype=object)})
+
+    result = _cache_round_trip(data, path, str(tmp_path / 'cache'))
+    text = result['text'].tolist()
+    assert text[0] == 'x'
+    assert all(isinstance(value, float) and np.isnan(value) for value in text[1:3])
+    assert text[3] is None and text[4] is pd.NaT and text[5] is pd.NA
+    assert all(isinstance(value, float) and np.isnan(value) for value in result['empty'])
+
+
+def test_column_cache_keyed_on_options(tmp_path):
+    path = str(tmp_path / 'data.csv')
+    pd.DataFrame({'a': [1, 2]}).to_csv(path, index=False)
+    cache_dir = str(tmp_path / 'cache')
+    ictkinter.save_column_cache(pd.read_csv(path), path, cache_dir)
+
+    assert ictkinter.load_column_cache(path, cache_dir) is not None
+    assert ictkinter.load_column_cache(path, cache_dir, index_col=0) is None
+    assert ictkinter.load_column_cache(path, cache_dir, fmt='parquet') is None
+
+
+def test_column_cache_pruned_when_file_changes(tmp_path):
+    path = str(tmp_path / 'data.csv')
+    cache_dir = str(tmp_path / 'cache')
+    pd.DataFrame({'a': [1, 2]}).to_csv(path, index=False)
+    ictkinter.save_column_cache(pd.read_csv(path), path, cache_dir)
+    pd.DataFrame({'a': [3, 4, 5]}).to_csv(path, index=False)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    assert ictkinter.load_column_cache(path, cache_dir) is None
+    ictkinter.save_column_cache(pd.read_csv(path), path, cache_dir)
+    assert len(os.listdir(cache_dir)) == 1
+    cached = ictkinter.load_column_cache(path, cache_dir)
+    assert pd.concat(list(ictkinter._cached_chunks(cached)))['a'].tolist() == [3, 4, 5]
+
+
+def test_shared_dataset_tables_read_shared_arrays():
+    dataset = ictkinter.SharedDataset(pd.DataFrame({'k': ['a', 'b', 'c'], 'v': [1.0, 2.0, 3.0]}))
+    summary = dataset.table(None, columns=['v'])
+    detail = dataset.table(None)
+
+    dataset.set_values('v', [1], [20.0])
+    assert summary.iat[1, 0]['data'] == detail.iat[1, 1]['data'] == 20.0
+    assert summary.column_stats('v')['max'] == detail.column_stats('v')['max'] == 20.0
+    assert dataset.frame()['v'].tolist() == [1.0, 20.0, 3.0]
+
+
+def test_shared_dataset_table_edits_stay_in_table():
+    dataset = ictkinter.SharedDataset(pd.DataFrame({'v': [1.0, 2.0]}))
+    summary = dataset.table(None)
+    detail = dataset.table(None)
+
+    summary.column('v', [7.0, 8.0])
+    assert detail.column_stats('v')['sum'] == 3.0
+    assert dataset.column('v').tolist() == [1.0, 2.0]
+    dataset.set_values('v', [0], [5.0])  # the dataset's value replaces the table's edit
+    assert summary.iat[0, 0]['data'] == 5.0
+    assert summary.column_stats('v')['sum'] == 13.0
+
+
+def test_shared_dataset_append_rows_and_checks():
+    dataset = ictkinter.SharedDataset(pd.DataFrame({'k': ['a'], 'v': [1]}))
+    table = dataset.table(None)
+    dataset.append_rows(pd.DataFrame({'v': [2.5], 'k': ['b']}, index=[1]))
+    assert len(table) == 2
+    assert table.iat[1, 1]['data'] == 2.5
+    assert table.column_stats('v')['sum'] == 3.5
+
+    with pytest.raises(TypeError):
+        dataset.set_values('v', [0], ['text'])
+    with pytest.raises(KeyError):
+        dataset.set_values('missing', [0], [1])
+    with pytest.raises(KeyError):
+        dataset.append_rows(pd.DataFrame({'k': ['c']}))
+
+
+def _data(table, col):
+    return [cell['data'] for cell in table[col].values]
+
+
+def test_new_rows_numbered_after_largest_label():
+    table = ictkinter.TableFrame(None, data=pd.DataFrame({'a': [1, 2, 3]}, index=[1, 2, 3]), columns=['a'])
+    table.upsert_rows([(99,)])
+    assert table.index.tolist() == [1, 2, 3, 4]
+    assert _data(table, 'a') == [1, 2, 3, 99]
+    table.append_rows([(5,)])
+    assert table.index.tolist() == [1, 2, 3, 4, 5]
+
+
+def test_new_rows_need_index_for_text_labels():
+    table = ictkinter.TableFrame(None, data=pd.DataFrame({'a': [1]}, index=['x']), columns=['a'])
+    with pytest.raises(ValueError):
+        table.append_rows([(2,)])
+    table.append_rows([(2,)], index=['y'])
+    assert table.index.tolist() == ['x', 'y']
+
+
+def test_upsert_updates_last_row_of_duplicate_label():
+    table = ictkinter.TableFrame(None, data=pd.DataFrame({'a': [1, 2]}), columns=['a'])
+    table.append_rows(pd.DataFrame({'a': [3]}, index=[1]))
+    table.upsert_rows(pd.DataFrame({'a': [7]}, index=[1]))
+    assert _data(table, 'a') == [1, 2, 7]
+
+
+def test_code_columns_are_not_numbers():
+    table = ictkinter.TableFrame(None, data=pd.DataFrame({'code': ['A10', 'B2', 'SKU-7']}), columns=['code'])
+    assert table.column_stats('code')['count'] == 0
+    assert ictkinter._sort_keys(['A10', 'B2', 'SKU-7']).tolist() == ['A10', 'B2', 'SKU-7']
+
+
+def _table(data, **kwargs):
+    data = pd.DataFrame(data)
+    table = ictkinter.TableFrame(None, data=data, columns=list(data.columns), **kwargs)
+    table.history.coalesce = 0  # every edit its own step unless a test merges them
+
+    return table
+
+
+def _cells(table):
+    return [[cell['data'] for cell in row] for row in table.values]
+
+
+def test_edit_history_coalesces_cell_edits():
+    history = ictkinter.EditHistory(coalesce=60)
+    history.record({'kind': 'data', 'rows': np.array([0, 1]), 'cols': np.array([0, 0]),
+                    'old': np.array([1, 2]), 'new': np.array([10, 20])})
+    history.record({'kind': 'data', 'rows': np.array([0]), 'cols': np.array([0]),
+                    'old': np.array([10]), 'new': np.array([100])})
+    delta = history.undo()
+    assert history.undo() is None
+    assert delta['rows'].tolist() == [0, 1]
+    assert delta['old'].tolist() == [1, 2]  # first old value of each cell
+    assert delta['new'].tolist() == [100, 20]  # last new value of each cell
+    assert history.redo() is delta
+    assert history.redo() is None
+
+
+def test_edit_history_cap_drops_oldest_steps():
+    history = ictkinter.EditHistory(max_bytes=1000, coalesce=0)
+    for i in range(20):
+        history.record({'kind': 'data', 'rows': np.arange(10), 'cols': np.zeros(10, dtype=int),
+                        'old': np.zeros(10), 'new': np.full(10, i)})
+    assert history.nbytes <= history.max_bytes
+    assert 0 < len(history._undo) < 20
+    assert history.undo()['new'][0] == 19
+
+    history.clear()
+    assert history.nbytes == 0 and history.undo() is None
+
+
+def test_edit_history_counts_text_values():
+    text = ictkinter.EditHistory._size({'kind': 'data', 'rows': np.arange(2), 'cols': np.zeros(2, dtype=int),
+                                        'old': np.array(['x' * 1000, 'y'], dtype=object),
+                                        'new': np.array(['a', 'b'], dtype=object)})
+    assert text > 1000
+
+
+def test_table_undo_redo_cell_edits():
+    table = _table({'a': [1, 2, 3], 'b': [4, 5, 6]})
+    table.column('a', [7, 8, 9])
+    table.row(1, [0, 0])
+    assert _cells(table) == [[7, 4], [0, 0], [9, 6]]
+    assert table.column_stats('a')['sum'] == 16
+
+    assert table.undo()
+    assert _cells(table) == [[7, 4], [8, 5], [9, 6]]
+    assert table.undo()
+    assert _cells(table) == [[1, 4], [2, 5], [3, 6]]
+    assert table.column_stats('a')['sum'] == 6
+    assert not table.undo()
+
+    assert table.redo() and table.redo()
+    assert _cells(table) == [[7, 4], [0, 0], [9, 6]]
+    assert not table.redo()
+
+
+def test_table_update_data_records_changed_cells_only():
+    table = _table({'a': [1.0, 2.0], 'b': [3.0, 4.0]})
+    table.update_data(np.array([[1.0, 3.0], [2.0, 5.0]]))
+    delta = table.history.undo()
+    assert delta['rows'].tolist() == [1] and delta['cols'].tolist() == [1]
+
+
+def test_table_undo_redo_appended_rows():
+    table = _table({'a': [1, 2]})
+    table.append_rows([(3,), (4,)])
+    table.upsert_rows(pd.DataFrame({'a': [20, 5]}, index=[1, 4]))
+    assert _cells(table) == [[1], [20], [3], [4], [5]]
+
+    table.undo()
+    assert _cells(table) == [[1], [2], [3], [4]]
+    table.undo()
+    assert _cells(table) == [[1], [2]]
+    assert table.column_stats('a')['sum'] == 3
+    table.redo()
+    table.redo()
+    assert _cells(table) == [[1], [20], [3], [4], [5]]
+    assert table.index.tolist() == [0, 1, 2, 3, 4]
+
+
+def test_column_stats_updates():
+    stats = ictkinter.ColumnStats([3, '$1,000.00', 'text', None, 2.5])
+    assert stats.stats() == {'sum': 1005.5, 'mean': 1005.5 / 3, 'min': 2.5, 'max': 1000.0, 'count': 3}
+
+    stats.add(list(range(100)))
+    stats.remove([1000.0, 12345.0])  # values not in the column are ignored
+    stats.replace([3], [-1])
+    assert stats.count == 102
+    assert stats.stats()['min'] == -1
+    assert stats.stats()['max'] == 99
+    assert stats.sum == sum(range(100)) + 2.5 - 1
+
+
+def test_column_stats_sum_stays_exact():
+    stats = ictkinter.ColumnStats([1e16, 1.0])
+    for i in range(500):
+        stats.replace([1.0], [1.0])
+    assert stats.sum == 1e16 + 1.0
+
+
+def test_table_view_sort_and_filter():
+    table = _table({'name': ['b', 'c', 'a', 'd'], 'value': ['$10', '2', '(3)', '40']})
+    view = ictkinter.TableView(table)
+    table.set_view(view)
+    view.sort('value')
+    assert view.positions().tolist() == [2, 1, 0, 3]
+    view.sort('name', ascending=False)
+    assert view.positions().tolist() == [3, 1, 0, 2]
+
+    view.filter('value', lambda values: values > 0)
+    assert view.positions().tolist() == [3, 1, 0]
+    table.column('value', [1, -1, 1, 1])  # the table invalidates its view
+    assert view.positions().tolist() == [3, 0, 2]
+    view.clear_filter()
+    assert len(view.positions()) == 4
+
+
+def test_formatted_rows_follow_view_and_formats():
+    table = _table({'x': [1.5, 2.25], 'y': ['a', 'b']})
+    table.column_format('x', format_='$', dec=1)
+    view = ictkinter.TableView(table)
+    view.sort('x', ascending=False)
+    table.set_view(view)
+    rows = [row for chunk in table.formatted_rows(chunksize=1) for row in chunk]
+    assert rows == [['', 'x', 'y'], ['1', '$2.2', 'b'], ['0', '$1.5', 'a']]
+
+
+def test_export_csv(tmp_path):
+    table = _table({'x': [1, 2, 3]})
+    table.footer(stats=('sum', ), dec=0)
+    path = str(tmp_path / 'table.csv')
+    progress = []
+    table.export(path, chunksize=2, progress=lambda written, total: progress.append((written, total)))
+
+    with open(path) as f:
+        assert f.read().splitlines() == [',x', '0,1', '1,2', '2,3', 'Sum,6']
+    assert progress[-1] == (5, 5)